@@ -20,11 +20,31 @@ ALTO = 600
 # -----------------------------------------------------------------------------
 #region RENDIMIENTO Y FRAMERATE
 # -----------------------------------------------------------------------------
-# FPS objetivo del juego. Afecta:
-# - velocidad del bucle principal
-# - estabilidad del movimiento y animaciones
-# - rendimiento general
-FPS = 60
+# La simulación corre a paso fijo (SIM_HZ) con acumulador, y el render
+# va por separado (RENDER_FPS) interpolando posiciones entre pasos.
+#
+# Las constantes de movimiento (gravedad, velocidades, animaciones) se
+# escriben por tick a BASE_HZ y se convierten al tick real con
+# core/utils/tick_rate.py: SIM_HZ = 120 juega igual que 60, con pasos
+# más finos. El render sí puede subir libremente.
+SIM_HZ = 60
+
+# Frecuencia a la que están afinadas las constantes "por tick"
+BASE_HZ = 60
+
+# FPS máximo de render (0 = sin límite)
+RENDER_FPS = 144
+
+# Máximo de pasos de simulación por frame de render. Si un frame tarda
+# demasiado se descarta el atraso en lugar de entrar en espiral.
+MAX_CATCHUP_STEPS = 5
+
+# Compatibilidad: frecuencia del bucle usada antes del paso fijo
+FPS = SIM_HZ
+
+# En el menú sin cambios el bucle espera eventos (pygame.event.wait) en
+# lugar de redibujar; este es el tiempo máximo de espera en ms.
+MENU_IDLE_WAIT_MS = 250
 # endregion
 # -----------------------------------------------------------------------------
 
@@ -33,7 +53,54 @@ FPS = 60
 #region COLORES GLOBALes
 # -----------------------------------------------------------------------------
 # Color de fondo usado cuando no se carga un background específico.
-# El color se aplica como fallback en BaseLevel._draw_background()
+# El color se aplica como fallback en StaticLayer (core/render/static_layer.py)
 COLOR_FONDO = (18, 18, 30)
 # endregion
 # -----------------------------------------------------------------------------
+
+
+# -----------------------------------------------------------------------------
+#region FÍSICA DE BOLAS
+# -----------------------------------------------------------------------------
+# "step"     -> paso vectorizado por frame (BallField.step)
+# "analytic" -> trayectorias cerradas con cola de impactos
+#               (core/physics/trajectory.py). Permite adelantar miles de
+#               frames en simulación sin cabeza y evita el "tunneling".
+BALL_PHYSICS = "step"
+# endregion
+# -----------------------------------------------------------------------------
+
+
+# -----------------------------------------------------------------------------
+#region RENDER PARCIAL (DIRTY RECTS)
+# Con DIRTY_RECTS cada frame restaura y actualiza solo las zonas donde se
+# dibujan entidades y HUD (pygame.display.update(rects)) en lugar de flip().
+# Si el área sucia supera DIRTY_RECTS_MAX_SHARE de la pantalla se hace un
+# flip completo. Útil en equipos con poca tasa de relleno.
+DIRTY_RECTS = False
+DIRTY_RECTS_MAX_SHARE = 0.5
+# endregion
+# -----------------------------------------------------------------------------
+
+
+# -----------------------------------------------------------------------------
+#region MEMORIA DE ASSETS
+# Presupuesto de AssetManager (core/utils/asset_manager.py). Los assets que
+# ningún nivel usa se mantienen en memoria hasta superar este tamaño y
+# luego se expulsan en orden LRU.
+ASSET_BUDGET_MB = 96
+# endregion
+# -----------------------------------------------------------------------------
+
+
+# -----------------------------------------------------------------------------
+#region CACHE DE NIVELES
+# Al volver al menú el nivel no se destruye: queda "caliente" en
+# LevelRegistry (core/level/level_registry.py) y al volver a elegirlo solo
+# se reinicia su estado dinámico. Se guardan como mucho LEVEL_CACHE_SIZE
+# niveles y LEVEL_CACHE_MB de superficies/assets propios; el resto se
+# descarta del más antiguo al más nuevo.
+LEVEL_CACHE_SIZE = 3
+LEVEL_CACHE_MB = 64
+# endregion
+# -----------------------------------------------------------------------------
@@ -2,6 +2,9 @@
 # AudioManager - Control global de volúmenes para música y SFX
 # =============================================================================
 
+from core.audio.sfx_bank import SFXBank
+
+
 class AudioManager:
     music_volume = 0.7
     sfx_volume = 0.5
@@ -13,3 +16,4 @@ class AudioManager:
     @classmethod
     def set_sfx_volume(cls, value):
         cls.sfx_volume = max(0, min(1, value))
+        SFXBank.set_volume(cls.sfx_volume)
@@ -0,0 +1,181 @@
+# =============================================================================
+# SFXBank - Efectos de sonido precargados con canales reservados por categoría
+# =============================================================================
+
+import os
+import pygame
+
+# -----------------------------------------------------------------------------
+#region DEFINICIONES
+# -----------------------------------------------------------------------------
+# nombre -> (ruta, categoría, voces simultáneas máximas, cooldown en ms)
+SFX_DEFS = {
+    "menu_beep":    ("assets/sounds/beep.mp3",              "ui",     1, 0),
+    "shoot":        ("assets/sounds/explosion_disparo.wav", "player", 2, 40),
+    "player_hit":   ("assets/sounds/hit01.wav",             "player", 1, 200),
+    "ball_explode": ("assets/sounds/explosion_bola.wav",    "balls",  3, 45),
+}
+
+# Canales de mixer reservados para cada categoría. Quedan fuera del
+# reparto automático de Sound.play(), así los SFX de una categoría no
+# pueden quitarle canales a otra.
+CATEGORY_CHANNELS = {
+    "ui": 1,
+    "player": 2,
+    "balls": 4,
+}
+
+# MP3 decodificado a PCM crudo en disco para no volver a decodificarlo
+PCM_CACHE_DIR = "cache/sfx"
+#endregion
+# -----------------------------------------------------------------------------
+
+
+class SFXBank:
+
+    _sounds = {}        # nombre -> Sound (o None si no cargó)
+    _channels = {}      # categoría -> [Channel]
+    _last_play = {}     # nombre -> ms (reloj de quien llama) del último play
+    _loaded = False
+    volume = 0.5
+
+    # Métricas
+    played = 0
+    dropped = 0
+
+    # -------------------------------------------------------------------------
+    # region CARGA
+    # -------------------------------------------------------------------------
+    @classmethod
+    def load(cls, volume=None, predecode_mp3=True):
+        """Decodifica todos los SFX y reserva los canales (una sola vez)."""
+        if cls._loaded:
+            return
+        if not pygame.mixer.get_init():
+            return
+        if volume is not None:
+            cls.volume = volume
+
+        # Canales: los primeros N quedan reservados para el banco
+        total = sum(CATEGORY_CHANNELS.values())
+        if pygame.mixer.get_num_channels() < total + 4:
+            pygame.mixer.set_num_channels(total + 4)
+        pygame.mixer.set_reserved(total)
+
+        index = 0
+        for category, count in CATEGORY_CHANNELS.items():
+            cls._channels[category] = [
+                pygame.mixer.Channel(index + i) for i in range(count)
+            ]
+            index += count
+
+        for name, (path, _category, _voices, _cooldown) in SFX_DEFS.items():
+            cls._sounds[name] = cls._load_sound(path, predecode_mp3)
+
+        cls._loaded = True
+        cls.set_volume(cls.volume)
+
+    @classmethod
+    def _load_sound(cls, path, predecode_mp3):
+        if not os.path.exists(path):
+            print(f"Advertencia: No se encontró {path}")
+            return None
+        try:
+            if predecode_mp3 and path.endswith(".mp3"):
+                return cls._load_predecoded(path)
+            return pygame.mixer.Sound(path)
+        except Exception as e:
+            print(f"Error cargando sonido {path}: {e}")
+            return None
+
+    @classmethod
+    def _load_predecoded(cls, path):
+        """
+        Carga un MP3 desde su PCM cacheado; si no existe o está viejo,
+        lo decodifica y guarda el PCM para la próxima vez.
+        El PCM depende del formato del mixer, que va en el nombre.
+        """
+        freq, size, channels = pygame.mixer.get_init()
+        base = os.path.splitext(os.path.basename(path))[0]
+        pcm_path = os.path.join(PCM_CACHE_DIR, f"{base}_{freq}_{size}_{channels}.pcm")
+
+        try:
+            if os.path.getmtime(pcm_path) >= os.path.getmtime(path):
+                with open(pcm_path, "rb") as f:
+                    return pygame.mixer.Sound(buffer=f.read())
+        except OSError:
+            pass
+
+        sound = pygame.mixer.Sound(path)
+        try:
+            os.makedirs(PCM_CACHE_DIR, exist_ok=True)
+            with open(pcm_path, "wb") as f:
+                f.write(sound.get_raw())
+        except OSError as e:
+            print(f"No se pudo guardar PCM de {path}: {e}")
+        return sound
+    # endregion
+    # -------------------------------------------------------------------------
+
+
+    # -------------------------------------------------------------------------
+    # region VOLUMEN
+    # -------------------------------------------------------------------------
+    @classmethod
+    def set_volume(cls, volume):
+        """Aplica el volumen a todos los SFX una vez (no en cada play)."""
+        cls.volume = volume
+        for sound in cls._sounds.values():
+            if sound:
+                sound.set_volume(volume)
+    # endregion
+    # -------------------------------------------------------------------------
+
+
+    # -------------------------------------------------------------------------
+    # region PLAY
+    # -------------------------------------------------------------------------
+    @classmethod
+    def play(cls, name, now=None):
+        """
+        Reproduce un SFX en un canal libre de su categoría.
+        Se descarta si está en cooldown, si ya suena su máximo de voces
+        o si la categoría no tiene canales libres.
+        now: ms del reloj del nivel (GameClock), así el cooldown respeta
+        pausa y escala de tiempo; sin él (menú) se usa el reloj de pared.
+        """
+        if not cls._loaded:
+            cls.load()
+        sound = cls._sounds.get(name)
+        if not sound:
+            return None
+
+        _path, category, max_voices, cooldown = SFX_DEFS[name]
+
+        if now is None:
+            now = pygame.time.get_ticks()
+        last = cls._last_play.get(name)
+        # Un reloj nuevo (otro nivel, reinicio) empieza de cero: now < last
+        if last is not None and 0 <= now - last < cooldown:
+            cls.dropped += 1
+            return None
+
+        free = None
+        voices = 0
+        for channel in cls._channels[category]:
+            if channel.get_busy():
+                if channel.get_sound() is sound:
+                    voices += 1
+            elif free is None:
+                free = channel
+
+        if free is None or voices >= max_voices:
+            cls.dropped += 1
+            return None
+
+        free.play(sound)
+        cls._last_play[name] = now
+        cls.played += 1
+        return free
+    # endregion
+    # -------------------------------------------------------------------------
@@ -1,6 +1,10 @@
-import pygame
 import math
-import os
+from core.audio.sfx_bank import SFXBank
+from core.render.sprite_cache import SpriteCache
+from core.physics import ball_field
+from core.physics.ball_field import FieldAttr
+from core.utils.object_pool import ObjectPool
+from core.utils.tick_rate import per_tick, per_tick2
 
 # =============================================================================
 #region CLASS: BALL (Bola de Super Pang)
@@ -17,34 +21,51 @@ class Ball:
         "small": 0.8
     }
 
-    # Parámetros físicos globales
-    MIN_VY = 6
-    MIN_BOUNCE_HEIGHT = 200
+    # Radios por tamaño
+    radius_by_size = {
+        "big": 40,
+        "medium": 25,
+        "small": 15
+    }
 
-    # Sonido cargado bajo demanda
-    _explode_sound = None
-    # endregion
-    # -------------------------------------------------------------------------
+    # Sprites por defecto
+    default_sprites = {
+        "big": "assets/sprites/orb_red.png",
+        "medium": "assets/sprites/orb_blue.png",
+        "small": "assets/sprites/orb_purple.png"
+    }
 
+    # Colores del círculo de respaldo si el sprite no carga
+    fallback_color_by_size = {
+        "big": (255,0,0),
+        "medium": (0,0,255),
+        "small": (128,0,128)
+    }
 
-    # -------------------------------------------------------------------------
-    # region LOAD SOUND (Lazy load del sonido de explosión)
-    # -------------------------------------------------------------------------
-    @classmethod
-    def _get_explode_sound(cls):
-        """Carga el sonido de explosión la primera vez que se requiera."""
-        if cls._explode_sound is None:
-            try:
-                path = "assets/sounds/explosion_bola.wav"
-                if os.path.exists(path):
-                    cls._explode_sound = pygame.mixer.Sound(path)
-                else:
-                    print("Advertencia: No se encontró explosion_bola.wav")
-                    cls._explode_sound = False
-            except Exception as e:
-                print("Error cargando sonido:", e)
-                cls._explode_sound = False
-        return cls._explode_sound
+    # Parámetros físicos globales (afinados por tick a 60 Hz, ver tick_rate)
+    GRAVITY = per_tick2(0.18)
+    MIN_VY = per_tick(6)
+    MAX_VY = ball_field.MAX_VY
+    MIN_BOUNCE_HEIGHT = 200
+    BOUNCE_COOLDOWN = ball_field.BOUNCE_COOLDOWN    # ticks sin volver a rebotar
+
+    # Unidades de los ajustes por oleada (ball_params del spec):
+    # exponente de TICK_SCALE (1 = velocidad, 2 = aceleración)
+    PARAM_TICK_POWER = {"gravity": 2, "MIN_VY": 1}
+
+    # Estado físico: vive en el BallField cuando la bola está en uno
+    x = FieldAttr()
+    y = FieldAttr()
+    vx = FieldAttr()
+    vy = FieldAttr()
+    bounce_factor = FieldAttr()
+    prev_x = FieldAttr()
+    prev_y = FieldAttr()
+    bounce_count = FieldAttr()
+    just_bounced = FieldAttr()
+
+    _field = None
+    _slot = -1
     # endregion
     # -------------------------------------------------------------------------
 
@@ -56,43 +77,39 @@ class Ball:
         """
         x, y: posición de la bola
         size: "big", "medium", "small"
-        vx, vy: velocidad inicial
+        vx, vy: velocidad inicial (px por tick a 60 Hz, se convierte a SIM_HZ)
         sprite_path: Ruta específica para este sprite (opcional)
         custom_sprites: Diccionario personalizado de sprites por tamaño (opcional)
         """
-        # Sprites por defecto
-        default_sprites = {
-            "big": "assets/sprites/orb_red.png",
-            "medium": "assets/sprites/orb_blue.png",
-            "small": "assets/sprites/orb_purple.png"
-        }
-        
+        self.reinit(x, y, size, vx, vy, sprite_path, custom_sprites)
+
+    def reinit(self, x, y, size, vx, vy, sprite_path=None, custom_sprites=None):
+        """Estado inicial completo (también al reutilizarla desde Ball.pool)."""
         # Usar sprites personalizados si se proporcionan, sino usar los por defecto
-        self.sprite_by_size = custom_sprites if custom_sprites else default_sprites
+        self.sprite_by_size = custom_sprites if custom_sprites else self.default_sprites
         
         # Posición y velocidad
         self.x = x
         self.y = y
+        self.prev_x = x
+        self.prev_y = y
         self.size = size
-        self.vx = vx
-        self.vy = vy
+        self.vx = per_tick(vx)
+        self.vy = per_tick(vy)
 
         # Física
-        self.gravity = 0.18
+        self.gravity = self.GRAVITY
         self.bounce_factor = self.bounce_factor_by_size[size]
 
-        # Radios por tamaño
-        self.radius_by_size = {
-            "big": 40,
-            "medium": 25,
-            "small": 15
-        }
-
         # Control de comportamiento de rebotes
         self.bounce_count = 0
         self.max_bounces_before_low = 3
         self.just_bounced = 0
 
+        # Ajustes de una oleada anterior (bola reutilizada): volver a los de clase
+        self.__dict__.pop("MIN_VY", None)
+        self.__dict__.pop("MIN_BOUNCE_HEIGHT", None)
+
         # ------------------------------------------------------
         # Cargar sprite
         # ------------------------------------------------------
@@ -101,18 +118,11 @@ class Ball:
         # Determinar qué sprite usar
         sprite_to_load = sprite_path if sprite_path else self.sprite_by_size[self.size]
         
-        try:
-            img = pygame.image.load(sprite_to_load).convert_alpha()
-            self.image = pygame.transform.scale(img, (2*r, 2*r))
-        except:
-            # Fallback visual si hay error
-            self.image = pygame.Surface((2*r, 2*r), pygame.SRCALPHA)
-            color = {
-                "big": (255,0,0),
-                "medium": (0,0,255),
-                "small": (128,0,128)
-            }[size]
-            pygame.draw.circle(self.image, color, (r, r), r)
+        # Sprite compartido desde el cache global (sin I/O en el hot path)
+        self.image = SpriteCache.get_scaled(
+            sprite_to_load, r,
+            fallback_color=self.fallback_color_by_size[size]
+        )
     # endregion
     # -------------------------------------------------------------------------
 
@@ -136,10 +146,10 @@ class Ball:
 
         if abs(self.vy) < self.MIN_VY:
             self.vy = -self.MIN_VY
-        if abs(self.vy) > 18:
-            self.vy = -18
+        if abs(self.vy) > self.MAX_VY:
+            self.vy = -self.MAX_VY
 
-        self.just_bounced = 3
+        self.just_bounced = self.BOUNCE_COOLDOWN
     # endregion
     # -------------------------------------------------------------------------
 
@@ -171,7 +181,7 @@ class Ball:
                 self.vy = abs(self.vy) * self.bounce_factor
                 if self.vy < self.MIN_VY:
                     self.vy = self.MIN_VY
-                self.just_bounced = 3
+                self.just_bounced = self.BOUNCE_COOLDOWN
 
             return
 
@@ -198,22 +208,24 @@ class Ball:
     # -------------------------------------------------------------------------
     # region SPLIT (División al ser golpeada)
     # -------------------------------------------------------------------------
-    def split(self):
-        """Divide la bola en dos más pequeñas, o desaparece si es small."""
+    def split(self, now=None):
+        """
+        Divide la bola en dos más pequeñas, o desaparece si es small.
+        now: ms del reloj del nivel (para el cooldown del sonido).
+        """
         if self.size == "small":
             return []
 
-        snd = self._get_explode_sound()
-        if snd:
-            snd.play()
+        # Limitado en voces y cooldown: una cadena de splits no satura el mixer
+        SFXBank.play("ball_explode", now)
 
         new_size = "medium" if self.size == "big" else "small"
 
-        # Genera dos bolas con velocidades opuestas
+        # Genera dos bolas con velocidades opuestas (del pool: sin asignar objetos)
         # IMPORTANTE: Propaga los sprites personalizados a las bolas hijas
         return [
-            Ball(self.x, self.y, new_size, 3, -8, custom_sprites=self.sprite_by_size),
-            Ball(self.x, self.y, new_size, -3, -8, custom_sprites=self.sprite_by_size)
+            Ball.pool.acquire(self.x, self.y, new_size, 3, -8, custom_sprites=self.sprite_by_size),
+            Ball.pool.acquire(self.x, self.y, new_size, -3, -8, custom_sprites=self.sprite_by_size)
         ]
     # endregion
     # -------------------------------------------------------------------------
@@ -222,12 +234,22 @@ class Ball:
     # -------------------------------------------------------------------------
     # region DRAW (Dibujar bola)
     # -------------------------------------------------------------------------
-    def draw(self, screen):
-        """Dibuja la bola considerando su radio."""
+    def draw(self, screen, alpha=1.0):
+        """
+        Dibuja la bola considerando su radio.
+        alpha: interpolación entre el paso anterior (0) y el actual (1).
+        Retorna el rect dibujado.
+        """
         r = self.radius_by_size[self.size]
-        screen.blit(self.image, (self.x - r, self.y - r))
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        return screen.blit(self.image, (x - r, y - r))
     # endregion
     # -------------------------------------------------------------------------
 
+
+# Bolas reutilizables: se liberan con Ball.pool.release() al destruirlas
+Ball.pool = ObjectPool(Ball, "balls")
+
 #endregion
 # ============================================================================="
\ No newline at end of file
@@ -1,5 +1,8 @@
 import pygame
 from core.utils.spritesheet import load_image, slice_spritesheet
+from core.utils.asset_cache import cached_frames
+from core.utils.object_pool import ObjectPool
+from core.utils.tick_rate import per_tick, ticks
 
 
 # =============================================================================
@@ -28,35 +31,32 @@ class Bullet:
             
         try:
             # Spritesheet completo 800x800 (8x8 → 64 frames)
-            bullet_sheet = load_image("assets/sprites/7_firespin_spritesheet.png")
-            bullet_sheet = bullet_sheet.convert_alpha()
-            
+            sheet_path = "assets/sprites/7_firespin_spritesheet.png"
             frame_width = 100
             frame_height = 100
-            
-            print(f"Cargando animación completa: 64 frames de {frame_width}x{frame_height}")
-            
-            cls._bullet_sprites = []
-
-            # Extraer los 64 frames (8 filas × 8 columnas)
-            for row in range(8):
-                for col in range(8):
-                    x = col * frame_width
-                    y = row * frame_height
-                    
-                    frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-                    frame.blit(bullet_sheet, (0, 0), (x, y, frame_width, frame_height))
-                    cls._bullet_sprites.append(frame)
-            
-            # Reescalar para que la bala no sea gigante
-            scaled_frames = []
             target_size = 64  # Tamaño final de la bala
-            
-            for frame in cls._bullet_sprites:
-                scaled_frame = pygame.transform.scale(frame, (target_size, target_size))
-                scaled_frames.append(scaled_frame)
-            
-            cls._bullet_sprites = scaled_frames
+
+            def build_frames():
+                print(f"Cargando animación completa: 64 frames de {frame_width}x{frame_height}")
+                bullet_sheet = load_image(sheet_path)
+
+                # Extraer los 64 frames (8 filas × 8 columnas) como vistas del
+                # sheet: el escalado de abajo ya crea las superficies finales
+                frames = slice_spritesheet(bullet_sheet, frame_width, frame_height,
+                                           max_tiles=64, subsurface=True)
+
+                # Reescalar para que la bala no sea gigante
+                return [
+                    pygame.transform.scale(frame, (target_size, target_size))
+                    for frame in frames
+                ]
+
+            # Frames ya cortados y escalados desde la cache en disco
+            cls._bullet_sprites = cached_frames(
+                sheet_path,
+                ["bullet", frame_width, frame_height, 64, target_size],
+                build_frames
+            )
             
             print(f"Bala: {len(cls._bullet_sprites)} frames de animación cargados ({target_size}x{target_size})")
             
@@ -98,12 +98,19 @@ class Bullet:
         Crea una bala en (x, y), con los frames de animación especificados.
         Si no se pasan frames, utiliza los del spritesheet global.
         """
-        # Hitbox lógico (NO depende del sprite)
+        # Hitbox lógico (NO depende del sprite); un único Rect por bala
         self.hitbox_width = 8
         self.hitbox_height = 12
+        self._hitbox = pygame.Rect(0, 0, self.hitbox_width, self.hitbox_height)
+
+        self.reinit(x, y, sprite_frames)
+
+    def reinit(self, x, y, sprite_frames=None):
+        """Estado de una bala recién disparada (también desde Bullet.pool)."""
 
         self.x = x
         self.y = y
+        self.prev_y = y
         
         # Usar los sprites globales si no se proporcionan otros
         if sprite_frames is None:
@@ -115,12 +122,12 @@ class Bullet:
         self.height = self.sprite_frames[0].get_height()
         
         # Movimiento
-        self.vel = 10
+        self.vel = per_tick(10)
         self.activa = True
         
-        # Animación
+        # Animación (frame nuevo cada 3 ticks a 60 Hz)
         self.current_frame = 0
-        self.animation_speed = 3
+        self.animation_speed = ticks(3)
         self.animation_counter = 0
     # endregion
     # -------------------------------------------------------------------------
@@ -129,17 +136,24 @@ class Bullet:
     def get_hitbox(self):
         """
         Retorna el rect de colisión REAL de la bala
-        (punta superior, sin padding transparente)
+        (punta superior, sin padding transparente).
+        Es siempre el mismo Rect actualizado: no guardarlo entre frames.
         """
-        hitbox_x = self.x + (self.width // 2) - (self.hitbox_width // 2)
-        hitbox_y = self.y  # punta superior
+        hitbox = self._hitbox
+        hitbox.x = self.x + (self.width // 2) - (self.hitbox_width // 2)
+        hitbox.y = self.y  # punta superior
+        hitbox.height = self.hitbox_height
+        return hitbox
 
-        return pygame.Rect(
-            hitbox_x,
-            hitbox_y,
-            self.hitbox_width,
-            self.hitbox_height
-        )
+    def get_swept_hitbox(self):
+        """
+        Hitbox cubriendo todo el recorrido del último paso (de prev_y a y):
+        la bala sube en vertical, así que el barrido exacto es la unión.
+        Mismo Rect reutilizado que get_hitbox().
+        """
+        hitbox = self.get_hitbox()
+        hitbox.height = self.hitbox_height + max(0, self.prev_y - self.y)
+        return hitbox
 
     # -------------------------------------------------------------------------
     # region UPDATE (Movimiento y animación)
@@ -167,12 +181,17 @@ class Bullet:
     # -------------------------------------------------------------------------
     # region DRAW (Dibujar bala)
     # -------------------------------------------------------------------------
-    def dibujar(self, pantalla):
-        """Dibuja la bala en pantalla usando su frame actual."""
+    def dibujar(self, pantalla, alpha=1.0):
+        """Dibuja la bala usando su frame actual (interpolada); retorna el rect."""
         current_sprite = self.sprite_frames[self.current_frame]
-        pantalla.blit(current_sprite, (self.x, self.y))
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        return pantalla.blit(current_sprite, (self.x, y))
     # endregion
     # -------------------------------------------------------------------------
 
+
+# Balas reutilizables: se liberan con Bullet.pool.release() al destruirlas
+Bullet.pool = ObjectPool(Bullet, "bullets")
+
 #endregion
 # =============================================================================
@@ -1,8 +1,10 @@
 import pygame
-import os
-from core.audio.audio_manager import AudioManager
+from core.audio.sfx_bank import SFXBank
 from core.entities.bullet import Bullet
 from core.utils.spritesheet import load_image, slice_spritesheet
+from core.utils.asset_cache import cached_frames
+from core.utils.game_clock import WALL_CLOCK
+from core.utils.tick_rate import per_tick, ticks
 
 # =============================================================================
 #region CLASS: PLAYER  (Jugador principal)
@@ -10,10 +12,8 @@ from core.utils.spritesheet import load_image, slice_spritesheet
 
 class Player:
 
-    # Sprites y sonidos compartidos
+    # Sprites compartidos (los sonidos están en SFXBank)
     _player_sprites = None
-    _shoot_sound = None
-    _damage_sound = None
     _assets_loaded = False
 
     # -------------------------------------------------------------------------
@@ -21,7 +21,7 @@ class Player:
     # -------------------------------------------------------------------------
     @classmethod
     def load_assets(cls):
-        """Carga sprites y sonidos del jugador una sola vez."""
+        """Carga sprites del jugador una sola vez."""
         if cls._assets_loaded:
             return True
             
@@ -29,8 +29,12 @@ class Player:
         # SPRITES DEL MAGO
         # -------------------------
         try:
-            mage_sheet = load_image("assets/sprites/wizard.png")
-            all_frames = slice_spritesheet(mage_sheet, 32, 32, spacing=0)
+            mage_path = "assets/sprites/wizard.png"
+            all_frames = cached_frames(
+                mage_path, ["slice", 32, 32, 0],
+                lambda: slice_spritesheet(load_image(mage_path), 32, 32,
+                                          spacing=0, subsurface=True)
+            )
 
             cls._idle_sprites  = all_frames[0:5]
             cls._cast1_sprites = all_frames[5:10]
@@ -53,60 +57,39 @@ class Player:
             cls._idle_sprites = cls._cast1_sprites = cls._cast2_sprites = cls._death_sprites = [fallback]
             cls._player_sprites = [fallback]
 
-        # -------------------------
-        # SONIDO: DISPARO
-        # -------------------------
-        try:
-            if os.path.exists("assets/sounds/explosion_disparo.wav"):
-                cls._shoot_sound = pygame.mixer.Sound("assets/sounds/explosion_disparo.wav")
-                cls._shoot_sound.set_volume(AudioManager.sfx_volume)
-            else:
-                print("Advertencia: No se encontró explosion_disparo.wav")
-                cls._shoot_sound = False
-        except Exception as e:
-            print(f"Error cargando sonido de disparo: {e}")
-            cls._shoot_sound = False
-
-        # -------------------------
-        # SONIDO: DAÑO
-        # -------------------------
-        try:
-            if os.path.exists("assets/sounds/hit01.wav"):
-                cls._damage_sound = pygame.mixer.Sound("assets/sounds/hit01.wav")
-                cls._damage_sound.set_volume(AudioManager.sfx_volume)
-            else:
-                print("Advertencia: No se encontró hit01.wav")
-                cls._damage_sound = False
-        except Exception as e:
-            print(f"Error cargando sonido de daño: {e}")
-            cls._damage_sound = False
-
         cls._assets_loaded = True
         return True
 
     # -------------------------------------------------------------------------
     # INIT
     # -------------------------------------------------------------------------
-    def __init__(self, x, y):
+    def __init__(self, x, y, clock=WALL_CLOCK, scheduler=None):
 
         if not Player._assets_loaded:
             Player.load_assets()
 
+        # Reloj de juego del nivel (cooldowns e invulnerabilidad)
+        self.clock = clock
+        # Planificador del nivel: fin de la invulnerabilidad (opcional)
+        self.scheduler = scheduler
+        self._invulnerability_timer = None
+
         self.x = x
         self.y = y
+        self.prev_x = x
 
         self.sprites = Player._idle_sprites
         self.current_sprite = 0
         self.width = self.sprites[0].get_width()
         self.height = self.sprites[0].get_height()
 
-        # Movilidad
-        self.speed = 6
+        # Movilidad (px y ticks a 60 Hz, ver tick_rate)
+        self.speed = per_tick(6)
         self.cooldown = 450
-        self.ultimo_disparo = 0
+        self.ultimo_disparo = -self.cooldown
 
         # Animación
-        self.animation_speed = 6
+        self.animation_speed = ticks(6)
         self.animation_counter = 0
         self.moving = False
 
@@ -149,7 +132,7 @@ class Player:
     # ANIMACIÓN
     # -------------------------------------------------------------------------
     def update_animation(self):
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.now()
         
         # Muerte
         if self.lives <= 0 and not self.death_animation_finished:
@@ -189,7 +172,7 @@ class Player:
     # DISPARO
     # -------------------------------------------------------------------------
     def puede_disparar(self):
-        return (pygame.time.get_ticks() - self.ultimo_disparo) >= self.cooldown
+        return (self.clock.now() - self.ultimo_disparo) >= self.cooldown
 
     def disparar(self, bala_sprite=None):
 
@@ -198,17 +181,14 @@ class Player:
             
         if self.puede_disparar():
 
-            self.ultimo_disparo = pygame.time.get_ticks()
+            self.ultimo_disparo = self.clock.now()
 
             # Animación
             self.state = "casting"
-            self.casting_animation_time = pygame.time.get_ticks() + self.CASTING_DURATION
+            self.casting_animation_time = self.clock.now() + self.CASTING_DURATION
             self.current_sprite = 0
             
-            # Sonido → Actualizar volumen por si el usuario lo cambió
-            if Player._shoot_sound:
-                Player._shoot_sound.set_volume(AudioManager.sfx_volume)
-                Player._shoot_sound.play()
+            SFXBank.play("shoot", self.clock.now())
             
             # Crear bala
             bullet_sprites = Bullet.get_bullet_sprites() if bala_sprite is None else (
@@ -218,7 +198,7 @@ class Player:
             bx = self.x + self.width // 2 - bullet_sprites[0].get_width() // 2
             by = self.y
             
-            return Bullet(bx, by, bullet_sprites)
+            return Bullet.pool.acquire(bx, by, bullet_sprites)
 
         return None
 
@@ -231,21 +211,28 @@ class Player:
 
             self.lives -= 1
             self.invulnerable = True
-            self.invulnerable_until = pygame.time.get_ticks() + self.INVULNERABILITY_MS
+            self.invulnerable_until = self.clock.now() + self.INVULNERABILITY_MS
+            if self.scheduler is not None:
+                self._invulnerability_timer = self.scheduler.schedule(
+                    self.INVULNERABILITY_MS, self._end_invulnerability,
+                    name="invulnerability"
+                )
             
-            # Sonido → Actualizar volumen según menú
-            if Player._damage_sound:
-                Player._damage_sound.set_volume(AudioManager.sfx_volume)
-                Player._damage_sound.play()
+            SFXBank.play("player_hit", self.clock.now())
                 
             return True
 
         return False
 
     def update_invulnerability(self):
-        if self.invulnerable and pygame.time.get_ticks() > self.invulnerable_until:
+        """Solo para jugadores sin planificador (ver take_damage)."""
+        if self.scheduler is None and self.invulnerable and self.clock.now() > self.invulnerable_until:
             self.invulnerable = False
 
+    def _end_invulnerability(self):
+        self.invulnerable = False
+        self._invulnerability_timer = None
+
     # -------------------------------------------------------------------------
     # ESTADO DE VIDA
     # -------------------------------------------------------------------------
@@ -261,15 +248,17 @@ class Player:
     # -------------------------------------------------------------------------
     # DRAW
     # -------------------------------------------------------------------------
-    def dibujar(self, pantalla):
+    def dibujar(self, pantalla, alpha=1.0):
 
         current_sprite = self.sprites[self.current_sprite]
+        x = self.prev_x + (self.x - self.prev_x) * alpha
 
+        # Retorna el rect dibujado (None si está oculto por el parpadeo)
         if self.invulnerable:
-            if (pygame.time.get_ticks() // 150) % 2 == 0:
-                pantalla.blit(current_sprite, (self.x, self.y))
-        else:
-            pantalla.blit(current_sprite, (self.x, self.y))
+            if (self.clock.now() // 150) % 2 == 0:
+                return pantalla.blit(current_sprite, (x, self.y))
+            return None
+        return pantalla.blit(current_sprite, (x, self.y))
 
     # -------------------------------------------------------------------------
     # RESET
@@ -279,6 +268,9 @@ class Player:
         self.lives = 5
         self.invulnerable = False
         self.invulnerable_until = 0
+        if self.scheduler is not None:
+            self.scheduler.cancel(self._invulnerability_timer)
+        self._invulnerability_timer = None
         self.state = "idle"
         self.death_animation_started = False
         self.death_animation_finished = False
@@ -1,7 +1,10 @@
 import pygame
-from core.level.level1 import Level1
+from core.level.level import BaseLevel
 from core.entities.ball import Ball
-from core.utils.spritesheet import load_image
+from core.entities.bullet import Bullet
+from core.utils.asset_manager import AssetManager
+from core.utils.game_clock import WALL_CLOCK
+from core.utils.tick_rate import per_tick
 import math
 
 
@@ -10,31 +13,29 @@ import math
 # =============================================================================
 class Boss:
 
-    def __init__(self, x, y):
-        self.image = load_image("assets/sprites/boss_ice.png")
-        self.image = pygame.transform.scale(self.image, (160, 120))
+    def __init__(self, spec, owner=None):
+        """spec: BossSpec del nivel (imagen, vida, disparos...)."""
+        self.spec = spec
+        self.image = AssetManager.scaled(spec.image, spec.size, owner=owner)
 
-        self.x = x
-        self.y = y
+        self.x = spec.x
+        self.y = spec.y
         self.width = self.image.get_width()
         self.height = self.image.get_height()
 
         # Movimiento horizontal corto
-        self.speed = 2
+        self.speed = per_tick(spec.speed)
         self.direction = 1
-        self.min_x = x - 60
-        self.max_x = x + 26 + self.width
+        self.min_x = self.x + spec.patrol[0]
+        self.max_x = self.x + spec.patrol[1] + self.width
 
         # Vida
-        self.max_hp = 15
+        self.max_hp = spec.hp
         self.hp = self.max_hp
 
         # Disparo de bolas
-        self.shoot_cooldown = 11000  # 11 segundos
-        self.first_shot_delay = 500  # medio segundo
-        self.first_shot_done = False
-        self.spawn_time = pygame.time.get_ticks()
-        self.last_shot = self.spawn_time
+        self.shoot_cooldown = spec.shoot_every_ms
+        self.first_shot_delay = spec.first_shot_ms
 
     def update(self):
         next_x = self.x + self.speed * self.direction
@@ -44,39 +45,15 @@ class Boss:
         else:
             self.x = next_x
 
-    def can_shoot(self):
-        now = pygame.time.get_ticks()
-
-        # Primer disparo a los 2 segundos
-        if not self.first_shot_done:
-            return now - self.spawn_time >= self.first_shot_delay
-
-        # Disparos normales cada 20 segundos
-        return now - self.last_shot >= self.shoot_cooldown
-
     def shoot_balls(self, custom_sprites):
-        self.last_shot = pygame.time.get_ticks()
-        self.first_shot_done = True
-
-        balls = []
-        cx = self.x + self.width // 2
-        cy = self.y + self.height
-
-        balls.append(Ball(cx - 40, cy, "big", 3, -8, custom_sprites=custom_sprites))
-        balls.append(Ball(cx, cy, "big", -3, -8, custom_sprites=custom_sprites))
-        balls.append(Ball(cx + 40, cy, "big", 2, -8, custom_sprites=custom_sprites))
-
-        return balls
-
-        balls = []
         cx = self.x + self.width // 2
         cy = self.y + self.height
 
-        balls.append(Ball(cx - 40, cy, "big", 3, -8))
-        balls.append(Ball(cx, cy, "big", -3, -8))
-        balls.append(Ball(cx + 40, cy, "big", 2, -8))
-
-        return balls
+        return [
+            Ball.pool.acquire(cx + shot.dx, cy, shot.size, shot.vx, shot.vy,
+                              custom_sprites=custom_sprites)
+            for shot in self.spec.shots
+        ]
 
     def take_damage(self):
         self.hp -= 1
@@ -85,13 +62,13 @@ class Boss:
         return self.hp <= 0
 
     def draw(self, screen):
-        screen.blit(self.image, (self.x, self.y))
+        rect = screen.blit(self.image, (self.x, self.y))
 
         # Barra de vida
         bar_width = self.width
         hp_ratio = self.hp / self.max_hp
 
-        pygame.draw.rect(
+        bar = pygame.draw.rect(
             screen, (120, 0, 0),
             (self.x, self.y - 12, bar_width, 8)
         )
@@ -99,6 +76,7 @@ class Boss:
             screen, (0, 200, 0),
             (self.x, self.y - 12, bar_width * hp_ratio, 8)
         )
+        return rect.union(bar)
 
 
 # =============================================================================
@@ -106,19 +84,20 @@ class Boss:
 # =============================================================================
 class IceCrystal:
 
-    def __init__(self, x, y):
-        self.image = load_image("assets/sprites/ice_crystal.png")
-        original_width = self.image.get_width()
-        original_height = self.image.get_height()
+    def __init__(self, x, y, spec, clock=WALL_CLOCK, owner=None):
+        """spec: CrystalSpec del nivel (imagen y alto final)."""
+        self.clock = clock
+        path = spec.image
+        original = AssetManager.image(path, owner=owner)
+        original_width = original.get_width()
+        original_height = original.get_height()
 
-        desired_height = 56  # ajusta este valor
+        desired_height = spec.height
         scale_ratio = desired_height / original_height
         new_width = int(original_width * scale_ratio)
 
-        self.image = pygame.transform.scale(
-            self.image,
-            (new_width, desired_height)
-        )
+        # Compartida entre respawns: no se vuelve a cargar ni escalar
+        self.image = AssetManager.scaled(path, (new_width, desired_height), owner=owner)
 
         self.x = x
         self.y = y
@@ -129,17 +108,17 @@ class IceCrystal:
         self.base_y = y
         self.float_amplitude = 4
         self.float_speed = 0.003
-        self.spawn_time = pygame.time.get_ticks()
+        self.spawn_time = self.clock.now()
 
         self.active = True
 
     def update(self):
         # Movimiento flotante (sube y baja)
-        t = pygame.time.get_ticks() - self.spawn_time
+        t = self.clock.now() - self.spawn_time
         self.y = self.base_y + math.sin(t * self.float_speed) * self.float_amplitude
 
     def draw(self, screen):
-        screen.blit(self.image, (self.x, self.y))
+        return screen.blit(self.image, (self.x, self.y))
 
     def get_rect(self):
         return pygame.Rect(self.x, self.y, self.width, self.height)
@@ -148,40 +127,37 @@ class IceCrystal:
 # =============================================================================
 # CLASS: BossLevel
 # =============================================================================
-class BossLevel(Level1):
+class BossLevel(BaseLevel):
+    """Nivel con jefe: usa la sección "boss" del LevelSpec."""
 
-    def __init__(self, pantalla, ANCHO, ALTO):
-        super().__init__(pantalla, ANCHO, ALTO)
+    def __init__(self, pantalla, ANCHO, ALTO, spec):
+        super().__init__(pantalla, ANCHO, ALTO, spec)
         self.boss = None
 
         # Cristal de hielo
         self.ice_crystal = None
-        self.crystal_spawn_delay = 3000  # segundos
-        self.last_crystal_time = pygame.time.get_ticks()
-        # Posiciones relativas del cristal (respecto al boss)
-        self.crystal_positions = [
-            (self.ANCHO - 130, 40),
-            (220, 40),
-            (self.ANCHO - 270, 40)
-        ]
+        self._crystal_timer = None
+        self._boss_shot_timer = None
         self.crystal_pos_index = 0
 
-    # -------------------------------------------------------------------------
-    # LOAD ASSETS
-    # -------------------------------------------------------------------------
-    def load_assets(self):
-        self._load_background()
-        super().load_assets()  # crea plataformas, jugador, límites, etc.
-        self._load_music()
+        # Sprites de las bolas que dispara el jefe
+        self.boss_ball_sprites = dict(spec.boss.ball_sprites) or None
+
+    def ball_sprite_paths(self):
+        paths = super().ball_sprite_paths()
+        if self.boss_ball_sprites:
+            paths.update(self.boss_ball_sprites.values())
+        return paths
 
     def _spawn_ice_crystal(self):
-        x, y = self.crystal_positions[self.crystal_pos_index]
-        y += self.game_area_y_start
-        self.ice_crystal = IceCrystal(x, y)
-        self.last_crystal_time = pygame.time.get_ticks()
+        crystal = self.spec.boss.crystal
+        x, y = crystal.positions[self.crystal_pos_index]
+        self.ice_crystal = IceCrystal(x, y, crystal, self.clock, owner=self)
+        self._crystal_timer = None
 
     def _respawn_crystal_next_position(self):
-        self.crystal_pos_index = (self.crystal_pos_index + 1) % len(self.crystal_positions)
+        positions = self.spec.boss.crystal.positions
+        self.crystal_pos_index = (self.crystal_pos_index + 1) % len(positions)
         self._spawn_ice_crystal()
 
     def _check_crystal_collisions(self):
@@ -190,67 +166,65 @@ class BossLevel(Level1):
 
         crystal_rect = self.ice_crystal.get_rect()
 
-        for bullet in self.bullets[:]:
+        for bullet in self.bullets:
             bullet_rect = pygame.Rect(
                 bullet.x, bullet.y, bullet.width, bullet.height
             )
 
             if bullet_rect.colliderect(crystal_rect):
                 self.bullets.remove(bullet)
+                Bullet.pool.release(bullet)
 
                 # Daño directo al boss
-                self.boss.take_damage()
-                self.boss.take_damage()  # 2 de daño total
+                for _ in range(self.spec.boss.crystal.damage):
+                    self.boss.take_damage()
 
                 self.ice_crystal = None
                 self._respawn_crystal_next_position()
                 break
 
-    def _load_background(self):
-        try:
-            bg = load_image("assets/boss_background.jpg")
-            game_area_height = self.ALTO - self.game_area_y_start
-            bg = pygame.transform.scale(bg, (self.ANCHO, game_area_height))
-
-            self.background = pygame.Surface((self.ANCHO, self.ALTO))
-            self.background.fill((18, 18, 30))
-            self.background.blit(bg, (0, self.game_area_y_start))
-        except:
-            self.background = None
-
-    def _load_music(self):
-        try:
-            pygame.mixer.music.load("assets/sounds/boss_theme.mp3")
-            pygame.mixer.music.set_volume(0.5)
-            pygame.mixer.music.play(-1)
-        except Exception as e:
-            print("Error música boss:", e)
-
-    def _get_boss_ball_sprites(self):
-        return {
-            "big": "assets/sprites/boss_ball_big.png",
-            "medium": "assets/sprites/boss_ball_medium.png",
-            "small": "assets/sprites/boss_ball_small.png",
-        }
-
     # -------------------------------------------------------------------------
     # ENTIDADES INICIALES
     # -------------------------------------------------------------------------
     def spawn_initial_entities(self):
-        self.balls = []
+        super().spawn_initial_entities()
+
+        self.boss = Boss(self.spec.boss, owner=self)
+        self.crystal_pos_index = 0
 
-        boss_x = self.ANCHO // 2 - 70
-        boss_y = self.game_area_y_start + 40
-        self.boss = Boss(boss_x, boss_y)
+        # Primer disparo a los first_shot_delay ms, luego cada shoot_cooldown
+        self.scheduler.cancel(self._boss_shot_timer)
+        self._boss_shot_timer = self.scheduler.schedule_repeating(
+            self.boss.shoot_cooldown, self._boss_shoot,
+            name="boss_shot", first_delay=self.boss.first_shot_delay
+        )
+
+        # El cristal aparece delay_ms después de empezar
+        self.ice_crystal = None
+        self.scheduler.cancel(self._crystal_timer)
+        self._crystal_timer = None
+        if self.spec.boss.crystal:
+            self._crystal_timer = self.scheduler.schedule(
+                self.spec.boss.crystal.delay_ms, self._spawn_ice_crystal,
+                name="ice_crystal"
+            )
+
+    def _boss_shoot(self):
+        self.balls.extend(self.boss.shoot_balls(self.boss_ball_sprites))
 
     # -------------------------------------------------------------------------
     # UPDATE
     # -------------------------------------------------------------------------
     def update(self, dt):
+        self._begin_step()
+        self._move_platforms()
+        self.clock.advance(dt)
+        self._store_previous_positions()
         if self.game_over or self.level_won:
             return
 
         # ======== lógica base SIN condición de victoria ========
+        self._update_input()
         self._update_time()
         self._update_player()
         self._update_bullets()
@@ -261,10 +235,6 @@ class BossLevel(Level1):
         # ======== lógica del boss ========
         self.boss.update()
 
-        if self.boss.can_shoot():
-            boss_sprites = self._get_boss_ball_sprites()
-            self.balls.extend(self.boss.shoot_balls(boss_sprites))
-
         self._check_boss_collisions()
 
         # ======== CONDICIÓN DE VICTORIA REAL ========
@@ -272,12 +242,7 @@ class BossLevel(Level1):
             self.level_won = True
 
         # ======== cristal de hielo ========
-        now = pygame.time.get_ticks()
-
-        if self.ice_crystal is None:
-            if now - self.last_crystal_time >= self.crystal_spawn_delay:
-                self._spawn_ice_crystal()
-        else:
+        if self.ice_crystal is not None:
             self.ice_crystal.update()
 
     # -------------------------------------------------------------------------
@@ -285,7 +250,7 @@ class BossLevel(Level1):
     # -------------------------------------------------------------------------
     def _check_boss_collisions(self):
         self._check_crystal_collisions()
-        for bullet in self.bullets[:]:
+        for bullet in self.bullets:
             bullet_rect = pygame.Rect(
                 bullet.x, bullet.y, bullet.width, bullet.height
             )
@@ -296,8 +261,9 @@ class BossLevel(Level1):
 
             if bullet_rect.colliderect(boss_rect):
                 self.bullets.remove(bullet)
+                Bullet.pool.release(bullet)
                 self.boss.take_damage()
-                self.score += 100
+                self.score += self.spec.boss.hit_score
 
     # -------------------------------------------------------------------------
     # DRAW
@@ -306,10 +272,8 @@ class BossLevel(Level1):
         super().draw()
 
         if self.boss and not self.boss.is_dead():
-            self.boss.draw(self.pantalla)
+            self.mark_dirty(self.boss.draw(self.pantalla))
 
         if self.ice_crystal:
-            self.ice_crystal.draw(self.pantalla)
+            self.mark_dirty(self.ice_crystal.draw(self.pantalla))
 
-    def detener_musica(self):
-        pygame.mixer.music.stop()
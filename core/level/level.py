@@ -1,39 +1,101 @@
 import pygame
 from core.physics.collisions import CollisionSystem
 from core.render.boundaries import BoundariesRenderer
-from core.physics.platforms import AdvancedPlatformSystem
+from core.render.static_layer import StaticLayer
+from core.render.dirty_rects import DirtyRectRenderer
+from core.physics.platforms import AdvancedPlatformSystem, PLATFORM_TILES
+from core.physics.moving_platform import MovingPlatform
+from core.physics.ball_field import BallField
+from core.physics.trajectory import AnalyticBallSystem
+from core.utils.game_clock import GameClock
+from core.utils.timer_wheel import TimerWheel
+from core.utils.object_pool import ObjectPool
+from core.utils.entity_store import EntityStore
+from core.utils.tick_rate import TICK_SCALE
+from core.entities.player import Player
+from core.entities.bullet import Bullet
+from core.entities.ball import Ball
+from core.utils.asset_manager import AssetManager
+from core.utils.spritesheet import slice_spritesheet
+from ui.hud import HUD
+from config import BALL_PHYSICS, DIRTY_RECTS, DIRTY_RECTS_MAX_SHARE
 
 
 class BaseLevel:
-
-        
+    """
+    Runtime genérico: juega cualquier LevelSpec (core/level/level_spec.py).
+    Fondo, tiles, plataformas, bolas, oleadas y música salen del spec.
+    """
 
     # region INIT & ESTADO GENERAL
-    def __init__(self, pantalla, ANCHO, ALTO):
+    def __init__(self, pantalla, ANCHO, ALTO, spec):
         self.pantalla = pantalla
         self.ANCHO = ANCHO
         self.ALTO = ALTO
+        self.spec = spec
+
+        # Reloj de juego: todo el tiempo del nivel sale de aquí
+        self.clock = GameClock()
+        # Eventos programados (spawns, cuenta regresiva, cooldowns...)
+        self.scheduler = TimerWheel(self.clock.now())
         
         # Sistemas
         self.collision_system = CollisionSystem()
         self.boundaries_renderer = None
         self.platform_system = AdvancedPlatformSystem()
+        # Fondo + límites + plataformas fijas en una sola superficie
+        self.static_layer = StaticLayer(self)
+        # Render parcial opcional (ver config.DIRTY_RECTS)
+        self.dirty_renderer = None
+        if DIRTY_RECTS:
+            self.dirty_renderer = DirtyRectRenderer(
+                pantalla.get_rect(), DIRTY_RECTS_MAX_SHARE
+            )
+
+        # Física de bolas opcional por eventos (ver config.BALL_PHYSICS)
+        self.analytic_balls = None
+        if BALL_PHYSICS == "analytic":
+            self.analytic_balls = AnalyticBallSystem(self.platform_system)
         
         # Estado del juego
         self.game_over = False
         self.level_won = False
         self.score = 0
-        self.time_remaining = 99
-        self.last_time_update = pygame.time.get_ticks()
+        self.time_remaining = spec.time_limit
+        self._countdown_timer = None
+        self._start_countdown()
         
         # Entidades
         self.player = None
-        self.balls = []
-        self.bullets = []
+        self.balls = BallField()
+        self.bullets = EntityStore()
         
         # Assets
         self.background = None
         self.tiles = []
+        self.tile_w = spec.tileset.tile_w
+        self.tile_h = spec.tileset.tile_h
+        self.floor_tile_idx = spec.tileset.floor_idx
+        self.wall_tile_idx = spec.tileset.wall_idx
+        self.ceiling_tile_idx = spec.tileset.ceiling_idx
+
+        # Plataformas (móviles aparte: se actualizan cada paso)
+        self.platforms_by_id = {}
+        self.moving_platforms = []
+        self._platform_specs = []   # [(Platform, PlatformSpec)] para reiniciar
+
+        # Oleadas: siguiente grupo, ráfaga usada y temporizador de cada una
+        self._wave_next = []
+        self._wave_burst_used = []
+        self._wave_timers = []
+        self._waves_pending = 0
+
+        # Límites + HUD
+        self.setup_level_boundaries(spec.hud_height, spec.floor_offset)
+        self.hud = HUD(ANCHO, self.hud_height, hud_y_start=0, owner=self)
+
+        # Fracción [0, 1] entre el paso anterior y el actual para el render
+        self.render_alpha = 1.0
     # endregion
 
 
@@ -55,10 +117,188 @@ class BaseLevel:
     # endregion
 
 
-    # region ABSTRACT METHODS
-    def load_assets(self): raise NotImplementedError
-    def setup_player(self): raise NotImplementedError
-    def spawn_initial_entities(self): raise NotImplementedError
+    # region MANIFIESTO DE ASSETS
+    @staticmethod
+    def asset_manifest(spec):
+        """Lista de assets del nivel para LevelLoader (ver level_loader.py)."""
+        manifest = list(spec.assets)
+        # Frames del jugador y la bala (usan su propia cache en disco)
+        manifest.append(("call", "jugador", Player.load_assets))
+        manifest.append(("call", "bala", Bullet.load_assets))
+        return manifest
+    # endregion
+
+
+    # region CARGA DESDE EL SPEC
+    def load_assets(self):
+        """Construye el nivel a partir del spec (assets, jugador, plataformas)."""
+        self._load_tiles()
+        self._load_background()
+        Player.load_assets()
+        Bullet.load_assets()
+        self.setup_player()
+        self._load_music()
+        if self.spec.boundaries != "none":
+            self.boundaries_renderer = BoundariesRenderer(self)
+        self.setup_platforms()
+        self.spawn_initial_entities()
+
+    def _load_tiles(self):
+        tileset = self.spec.tileset
+        try:
+            sheet = AssetManager.image(tileset.image, owner=self)
+            raw_tiles = slice_spritesheet(sheet, tileset.tile_w, tileset.tile_h,
+                                          subsurface=True)
+            PLATFORM_TILES.update(
+                (name, raw_tiles[idx]) for name, idx in tileset.platform_tiles
+            )
+            # Sin tiles los límites usan el dibujo simple
+            if self.spec.boundaries == "tiles":
+                self.tiles = raw_tiles
+        except Exception as e:
+            print("Error cargando tiles:", e)
+            self.tiles = []
+
+    def _load_background(self):
+        spec = self.spec
+        self.background = pygame.Surface((self.ANCHO, self.ALTO))
+        self.background.fill(spec.background_fill)
+        if not spec.background_image:
+            return
+        try:
+            game_area_height = self.ALTO - self.game_area_y_start
+            bg_scaled = AssetManager.scaled(
+                spec.background_image, (self.ANCHO, game_area_height),
+                alpha=spec.background_alpha, owner=self
+            )
+            self.background.blit(bg_scaled, (0, self.game_area_y_start))
+        except Exception as e:
+            print(f"Error cargando fondo {spec.name}:", e)
+            self.background = None
+
+    def _load_music(self):
+        if not self.spec.music_path:
+            return
+        try:
+            pygame.mixer.music.load(self.spec.music_path)
+            pygame.mixer.music.set_volume(self.spec.music_volume)
+            pygame.mixer.music.play(-1)
+        except Exception as e:
+            print("Error cargando música: ", e)
+
+    def setup_player(self):
+        """Jugador centrado sobre el suelo"""
+        sprites = Player._player_sprites
+        self.player = Player(
+            self.ANCHO // 2 - sprites[0].get_width() // 2,
+            self.floor_y - sprites[0].get_height(),
+            self.clock,
+            self.scheduler
+        )
+
+    def setup_platforms(self):
+        for p in self.spec.platforms:
+            if p.kind == "moving":
+                platform = MovingPlatform(
+                    p.x, p.y, p.w, p.h, move_range=p.move_range, speed=p.speed
+                )
+                platform.direction = p.direction
+                self.moving_platforms.append(platform)
+                self.platform_system.register_platform(platform)
+            else:
+                platform = self.add_platform(p.x, p.y, p.w, p.h, p.platform_type)
+            if p.id:
+                self.platforms_by_id[p.id] = platform
+            self._platform_specs.append((platform, p))
+
+    def _reset_platforms(self):
+        """Devuelve las plataformas al estado del spec sin reconstruirlas."""
+        for platform, p in self._platform_specs:
+            if p.kind == "moving":
+                platform.reset_position(p.direction)
+
+        # Rompibles destruidas: se vuelven a registrar las mismas instancias
+        initial = [platform for platform, _ in self._platform_specs]
+        if list(self.platform_system.platforms) != initial:
+            self.platform_system.restore(initial)
+    # endregion
+
+
+    # region BOLAS Y OLEADAS
+    def spawn_initial_entities(self):
+        """Bolas iniciales del spec y temporizadores de oleadas."""
+        self._clear_balls()
+        for ball_spec in self.spec.balls:
+            self.balls.append(self._make_ball(ball_spec))
+
+        for timer in self._wave_timers:
+            self.scheduler.cancel(timer)
+
+        waves = self.spec.waves
+        self._wave_next = [0] * len(waves)
+        self._wave_burst_used = [False] * len(waves)
+        self._wave_timers = [
+            self.scheduler.schedule_repeating(
+                wave.every_ms,
+                lambda i=i: self._spawn_wave_group(i),
+                name=f"wave_{i}", first_delay=wave.first_ms
+            )
+            for i, wave in enumerate(waves)
+        ]
+        self._waves_pending = len(waves)
+
+    def _spawn_wave_group(self, index):
+        """Temporizador de la oleada: saca el siguiente grupo de bolas."""
+        wave = self.spec.waves[index]
+
+        # Ráfaga única cuando al jugador le queda una vida
+        amount = 1
+        if (wave.last_life_burst and not self._wave_burst_used[index]
+                and self.player and self.player.lives == 1):
+            amount = wave.last_life_burst
+            self._wave_burst_used[index] = True
+
+        for _ in range(amount):
+            group = self._wave_next[index]
+            if group >= len(wave.groups):
+                break
+            for ball_spec in wave.groups[group]:
+                self.balls.append(self._make_ball(ball_spec))
+            self._wave_next[index] += 1
+
+        if self._wave_next[index] >= len(wave.groups):
+            self.scheduler.cancel(self._wave_timers[index])
+            self._wave_timers[index] = None
+            self._waves_pending -= 1
+
+    @property
+    def spawning_finished(self):
+        return self._waves_pending == 0
+
+    def _make_ball(self, ball_spec, custom_sprites=None):
+        ball = Ball.pool.acquire(ball_spec.x, ball_spec.y, ball_spec.size,
+                                 vx=ball_spec.vx, vy=ball_spec.vy,
+                                 custom_sprites=custom_sprites)
+        # Ajustes de rebote por oleada (antes de entrar al BallField),
+        # escritos por tick a 60 Hz como el resto del spec
+        for name, value in ball_spec.params:
+            setattr(ball, name, value * TICK_SCALE ** Ball.PARAM_TICK_POWER.get(name, 0))
+        return ball
+
+    def _clear_balls(self):
+        """Quita todas las bolas del nivel y las devuelve al pool."""
+        balls = list(self.balls)
+        self.balls.clear()
+        Ball.pool.release_all(balls)
+
+    def _clear_bullets(self):
+        Bullet.pool.release_all(self.bullets)
+        self.bullets.clear()
+
+    def release_entities(self):
+        """Devuelve bolas y balas a sus pools (el nivel se descarta)."""
+        self._clear_bullets()
+        self._clear_balls()
     # endregion
 
 
@@ -77,29 +317,46 @@ class BaseLevel:
                     self.restart()
                     return True
 
+                # Reloj: pausa, paso a paso (en pausa) y escala de tiempo
+                if event.key == pygame.K_p:
+                    self.clock.toggle_pause()
+                elif event.key == pygame.K_n:
+                    self.clock.request_step()
+                elif event.key == pygame.K_MINUS:
+                    self.clock.set_time_scale(self.clock.time_scale / 2)
+                elif event.key == pygame.K_EQUALS:
+                    self.clock.set_time_scale(self.clock.time_scale * 2)
+
                 # Disparo
-                if event.key == pygame.K_SPACE and not self.game_over and not self.level_won:
+                if (event.key == pygame.K_SPACE and not self.game_over
+                        and not self.level_won and not self.clock.paused):
                     if self.player and self.player.is_alive():
                         new_bullet = self.player.disparar(None)
                         if new_bullet:
                             self.bullets.append(new_bullet)
 
-        # Movimiento del jugador
+        return True
+
+    def _update_input(self):
+        """Movimiento del jugador: se aplica una vez por paso de simulación."""
         if (not self.game_over and not self.level_won 
             and self.player and self.player.is_alive()):
             keys = pygame.key.get_pressed()
             self.player.mover(keys, self.ANCHO)
-
-        return True
     # endregion
 
 
     # region UPDATE LOOP
     def update(self, dt):
-        """Actualiza el estado del nivel"""
+        """Actualiza el estado del nivel (un paso fijo de simulación)"""
+        self._begin_step()
+        self._move_platforms()
+        self.clock.advance(dt)
+        self._store_previous_positions()
         if self.game_over or self.level_won:
             return
 
+        self._update_input()
         self._update_time()
         self._update_player()
         self._update_bullets()
@@ -107,21 +364,45 @@ class BaseLevel:
         self._update_platforms()
         self._process_collisions()
 
-        # WIN CONDITION
-        if len(self.balls) == 0:
+        # WIN CONDITION (con oleadas, solo cuando ya salieron todas)
+        if len(self.balls) == 0 and self.spawning_finished:
             self.level_won = True
     # endregion
 
 
     # region SUB-UPDATES
+    def _begin_step(self):
+        """
+        Cierre del paso anterior: ya nadie está iterando, así que se
+        compactan los contenedores y lo liberado vuelve a los pools.
+        """
+        self.bullets.compact()
+        self.platform_system.platforms.compact()
+        ObjectPool.flush_all()
+
+    def _store_previous_positions(self):
+        """Guarda posiciones del paso anterior para interpolar el render."""
+        self.balls.store_previous()
+        for bullet in self.bullets:
+            bullet.prev_y = bullet.y
+        if self.player:
+            self.player.prev_x = self.player.x
+
     def _update_time(self):
-        now = pygame.time.get_ticks()
-        if now - self.last_time_update >= 1000:
-            self.time_remaining -= 1
-            self.last_time_update = now
-            if self.time_remaining <= 0:
-                self.time_remaining = 0
-                self.game_over = True
+        """Avanza el planificador: dispara los temporizadores vencidos."""
+        self.scheduler.advance(self.clock.now())
+
+    def _start_countdown(self):
+        self.scheduler.cancel(self._countdown_timer)
+        self._countdown_timer = self.scheduler.schedule_repeating(
+            1000, self._on_countdown_second, name="countdown"
+        )
+
+    def _on_countdown_second(self):
+        self.time_remaining -= 1
+        if self.time_remaining <= 0:
+            self.time_remaining = 0
+            self.game_over = True
 
     def _update_player(self):
         if self.player:
@@ -131,20 +412,26 @@ class BaseLevel:
                 self.game_over = True
 
     def _update_bullets(self):
-        for bullet in self.bullets[:]:
+        for bullet in self.bullets:
             bullet.actualizar()
             if not bullet.activa:
                 self.bullets.remove(bullet)
+                Bullet.pool.release(bullet)
 
     def _update_balls(self):
-        if not self.game_over:
-            for ball in self.balls[:]:
-                ball.update(
-                    self.floor_y,
-                    self.playfield_left,
-                    self.playfield_right,
-                    self.game_area_y_start
-                )
+        if self.game_over:
+            return
+
+        if self.analytic_balls is not None:
+            self.analytic_balls.step(self)
+        else:
+            # Paso vectorizado equivalente a Ball.update() por bola
+            self.balls.step(
+                self.floor_y,
+                self.playfield_left,
+                self.playfield_right,
+                self.game_area_y_start
+            )
 
     def _process_collisions(self):
         if self.player and self.player.is_alive():
@@ -154,37 +441,64 @@ class BaseLevel:
 
     # region RENDER
     def draw(self):
-        self._draw_background()
-        self._draw_boundaries()
-        self._draw_entities()
+        self._draw_static_layer()
         self._draw_platforms()
+        self._draw_entities()
+        self._draw_hud()
 
-    def _draw_background(self):
-        if self.background:
-            self.pantalla.blit(self.background, (0, 0))
+    def _draw_static_layer(self):
+        """Fondo, límites y plataformas fijas: un único blit opaco."""
+        if self.dirty_renderer:
+            # Solo se restauran las zonas dibujadas el frame anterior
+            self.dirty_renderer.restore(self.pantalla, self.static_layer)
         else:
-            self.pantalla.fill((18, 18, 30))
-
-    def _draw_boundaries(self):
-        if self.boundaries_renderer:
-            self.boundaries_renderer.draw(self.pantalla)
+            self.static_layer.draw(self.pantalla)
 
     def _draw_platforms(self):
-        self.platform_system.draw(self.pantalla)
+        """Solo las plataformas móviles; las fijas van en la capa estática."""
+        for rect in self.platform_system.draw_dynamic(self.pantalla):
+            self.mark_dirty(rect)
 
     def _draw_entities(self):
+        alpha = self.render_alpha
+        mark = self.mark_dirty
+
         # Bolas
         if not self.game_over:
             for ball in self.balls:
-                ball.draw(self.pantalla)
+                mark(ball.draw(self.pantalla, alpha))
 
         # Balas
         for bullet in self.bullets:
-            bullet.dibujar(self.pantalla)
+            mark(bullet.dibujar(self.pantalla, alpha))
 
         # Jugador
         if self.player:
-            self.player.dibujar(self.pantalla)
+            mark(self.player.dibujar(self.pantalla, alpha))
+
+    def _draw_hud(self):
+        self.hud.update(
+            lives=self.player.lives if self.player else 3,
+            score=self.score,
+            time=self.time_remaining,
+            game_over=self.game_over,
+            level_won=self.level_won,
+            now=self.clock.now()
+        )
+        self.hud.draw(self.pantalla)
+        self.mark_dirty(self.hud.dirty_rect(self.pantalla.get_rect()))
+
+    def mark_dirty(self, rect):
+        """Registra una zona dibujada fuera de la capa estática."""
+        if self.dirty_renderer:
+            self.dirty_renderer.mark(rect)
+
+    def present(self):
+        """Muestra el frame: update() parcial o flip() completo."""
+        if self.dirty_renderer:
+            self.dirty_renderer.present()
+        else:
+            pygame.display.flip()
     # endregion
 
 
@@ -194,16 +508,49 @@ class BaseLevel:
         self.game_over = False
         self.level_won = False      # RESET VICTORIA
         self.score = 0
-        self.time_remaining = 99
-        self.last_time_update = pygame.time.get_ticks()
+        self.time_remaining = self.spec.time_limit
+        # El planificador quedó parado en el game over: descartar lo pendiente
+        self.scheduler.reset(self.clock.now())
+        self._start_countdown()
         
         if self.player:
             self.player.reset()
 
-        self.bullets.clear()
-        self.balls.clear()
+        self._clear_bullets()
+        self._clear_balls()
 
+        self._reset_platforms()
         self.spawn_initial_entities()
+
+    def reenter(self):
+        """
+        Vuelve a jugar una instancia guardada en la cache de niveles
+        (LevelRegistry): tiles, capa estática, plataformas y HUD se
+        reutilizan; solo se reinicia el estado dinámico.
+        """
+        self.clock.resume()
+        self.clock.set_time_scale(1.0)
+        self.setup_player()
+        self.restart()
+        self._load_music()
+        if self.dirty_renderer:
+            self.dirty_renderer.invalidate()
+
+    def resident_bytes(self):
+        """Memoria aproximada que retiene el nivel (superficies + assets)."""
+        surfaces = [self.static_layer.surface, self.background]
+        if self.boundaries_renderer:
+            surfaces.append(self.boundaries_renderer.surface)
+        surfaces.extend(platform.surface for platform, _ in self._platform_specs)
+        total = sum(
+            s.get_width() * s.get_height() * s.get_bytesize()
+            for s in surfaces if s is not None
+        )
+        return total + AssetManager.owned_bytes(self)
+
+    def ball_sprite_paths(self):
+        """Rutas de sprites de bolas (SpriteCache) que usa el nivel."""
+        return set(Ball.default_sprites.values())
     # endregion
 
     #Esto  estaba dando error, pero asi se arreglo xd
@@ -219,10 +566,34 @@ class BaseLevel:
     # endregion
 
     # region UPDATE PLATFORMS
+    def _move_platforms(self):
+        """Plataformas móviles: se mueven siempre, también tras el final."""
+        for platform in self.moving_platforms:
+            platform.update()
+
     def _update_platforms(self):
         """Actualiza colisiones de las plataformas con las bolas"""
         if not self.game_over and not self.level_won:
-            for ball in self.balls[:]:
-                self.platform_system.process_ball_collisions(ball)
+            platform_system = self.platform_system
+            if self.analytic_balls is not None:
+                # Las fijas ya se resolvieron como eventos analíticos
+                platforms = platform_system.dynamic_platforms()
+                if not platforms:
+                    return
+                for ball in self.balls:
+                    platform_system.process_ball_collisions_swept(ball, platforms)
+                return
+
+            # Cada bola solo prueba las plataformas cercanas a su recorrido
+            for ball in self.balls:
+                platforms = platform_system.platforms_near_ball(ball)
+                if platforms:
+                    platform_system.process_ball_collisions_swept(ball, platforms)
+            platform_system.end_query_step()
     # endregion
 
+
+    # region MÚSICA
+    def detener_musica(self):
+        pygame.mixer.music.stop()
+    # endregion
@@ -0,0 +1,136 @@
+import queue
+import threading
+import time
+
+import pygame
+
+from core.utils.asset_cache import cached_scaled_image
+from core.utils.asset_manager import AssetManager
+
+# =============================================================================
+#region LEVEL LOADER (Carga de niveles por etapas sin congelar la ventana)
+# 1. Hilo de trabajo: lee y decodifica las imágenes del manifiesto del
+#    nivel (y las escala si corresponde). No toca el display.
+# 2. Hilo principal, step(): en porciones de slice_ms por frame convierte
+#    al formato de pantalla lo que ya decodificó el hilo, lo registra en
+#    AssetManager y ejecuta los pasos "call" (p. ej. Player.load_assets).
+# 3. Cuando todo el manifiesto está listo, build() construye el nivel; sus
+#    cargas ya son aciertos de AssetManager, así que es rápido.
+#
+# Manifiesto (BaseLevel.asset_manifest):
+#   ("image",  ruta, alpha)
+#   ("scaled", ruta, (ancho, alto), alpha)
+#   ("call",   nombre, función)      -> solo hilo principal
+# =============================================================================
+
+class LevelLoader:
+
+    def __init__(self, name, factory, manifest, slice_ms=4):
+        self.name = name
+        self.factory = factory
+        self.slice_ms = slice_ms
+
+        # Lo que ya está en AssetManager no se vuelve a cargar
+        self._decode_items = []
+        self._main_items = []
+        for item in manifest:
+            if item[0] == "call":
+                self._main_items.append(item)
+            elif not AssetManager.has(self._key(item)):
+                self._decode_items.append(item)
+
+        self.total = len(self._decode_items) + len(self._main_items)
+        self.completed = 0
+        self.current = None          # último asset terminado
+        self.errors = []
+
+        self._decoded = queue.Queue()
+        self._pending_decode = len(self._decode_items)
+        self._thread = None
+
+    # -------------------------------------------------------------------------
+    # region HILO DE TRABAJO
+    # -------------------------------------------------------------------------
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._decode_all, name=f"loader-{self.name}", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def _decode_all(self):
+        for item in self._decode_items:
+            try:
+                self._decoded.put((item, self._decode(item), None))
+            except Exception as e:
+                self._decoded.put((item, None, e))
+
+    @staticmethod
+    def _decode(item):
+        kind, path = item[0], item[1]
+        if kind == "image":
+            return pygame.image.load(path)
+        _kind, _path, size, alpha = item
+        # Lee/llena la cache en disco, sin convertir (no estamos en el principal)
+        return cached_scaled_image(path, size, alpha=alpha, convert=False)
+
+    @staticmethod
+    def _key(item):
+        if item[0] == "image":
+            return AssetManager.image_key(item[1], item[2])
+        return AssetManager.scaled_key(item[1], item[2], item[3])
+    # endregion
+    # -------------------------------------------------------------------------
+
+
+    # -------------------------------------------------------------------------
+    # region HILO PRINCIPAL
+    # -------------------------------------------------------------------------
+    def step(self):
+        """Avanza la carga durante como mucho slice_ms. True si terminó."""
+        deadline = time.perf_counter() + self.slice_ms / 1000.0
+
+        while self._pending_decode and time.perf_counter() < deadline:
+            try:
+                item, surface, error = self._decoded.get_nowait()
+            except queue.Empty:
+                break
+            self._pending_decode -= 1
+            if error is not None:
+                # El nivel reintentará al construirse y usará su fallback
+                print(f"Error precargando {item[1]}: {error}")
+                self.errors.append((item[1], error))
+            else:
+                alpha = item[-1]
+                surface = surface.convert_alpha() if alpha else surface.convert()
+                AssetManager.store(self._key(item), surface)
+            self._finish_item(item[1])
+
+        # Los pasos "call" van después de las imágenes, uno por porción
+        if not self._pending_decode and self._main_items and time.perf_counter() < deadline:
+            _kind, label, func = self._main_items.pop(0)
+            func()
+            self._finish_item(label)
+
+        return self.done
+
+    def _finish_item(self, label):
+        self.completed += 1
+        self.current = label
+
+    @property
+    def done(self):
+        return not self._pending_decode and not self._main_items
+
+    @property
+    def progress(self):
+        return self.completed / self.total if self.total else 1.0
+
+    def build(self):
+        """Construye el nivel (llamar solo cuando done es True)."""
+        return self.factory()
+    # endregion
+    # -------------------------------------------------------------------------
+
+#endregion
+# =============================================================================
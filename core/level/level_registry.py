@@ -0,0 +1,213 @@
+import importlib
+import time
+from collections import OrderedDict
+
+from config import LEVEL_CACHE_SIZE, LEVEL_CACHE_MB
+from core.utils.asset_manager import AssetManager
+from core.render.sprite_cache import SpriteCache
+
+# =============================================================================
+#region LEVEL REGISTRY (Niveles del menú con import diferido)
+# id de menú -> (spec en assets/levels/, runtime "módulo:Clase").
+# Nada del nivel se importa al arrancar: el runtime (y con él física,
+# entidades y numpy) se importa la primera vez que se elige un nivel.
+# Se mide el tiempo de import y el de construcción de cada nivel.
+#
+# Cache caliente: al salir de un nivel, park() lo guarda en lugar de
+# destruirlo (sigue siendo dueño de sus assets en AssetManager y sus
+# sprites de bolas siguen en SpriteCache). Si se vuelve a elegir con el
+# mismo spec, create() solo llama a reenter().
+# Límite: LEVEL_CACHE_SIZE niveles y LEVEL_CACHE_MB (ver config.py);
+# flush() descarta todo. Todo nivel que sale de la cache pasa por
+# _discard().
+# =============================================================================
+
+DEFAULT_RUNTIME = "core.level.level:BaseLevel"
+
+
+class _Entry:
+    __slots__ = ("level_id", "spec_key", "runtime", "cls",
+                 "import_ms", "build_ms", "builds", "warm_hits")
+
+    def __init__(self, level_id, spec_key, runtime):
+        self.level_id = level_id
+        self.spec_key = spec_key
+        self.runtime = runtime
+        self.cls = None
+        self.import_ms = None       # solo el primer import (luego es gratis)
+        self.build_ms = None        # última carga (construcción o re-entrada)
+        self.builds = 0
+        self.warm_hits = 0          # re-entradas servidas desde la cache
+
+
+class LevelRegistry:
+
+    _entries = {}       # id -> _Entry (orden de registro = orden del juego)
+    _warm = OrderedDict()   # id -> nivel guardado (LRU primero)
+    cache_size = LEVEL_CACHE_SIZE
+    cache_bytes = int(LEVEL_CACHE_MB * 1024 * 1024)
+
+    # -------------------------------------------------------------------------
+    # region REGISTRO
+    # -------------------------------------------------------------------------
+    @classmethod
+    def register(cls, level_id, spec_key, runtime=DEFAULT_RUNTIME):
+        cls._entries[level_id] = _Entry(level_id, spec_key, runtime)
+
+    @classmethod
+    def ids(cls):
+        return list(cls._entries)
+
+    @classmethod
+    def has(cls, level_id):
+        return level_id in cls._entries
+
+    @classmethod
+    def next_id(cls, level_id):
+        """Siguiente nivel en orden de registro (None si era el último)."""
+        ids = cls.ids()
+        index = ids.index(level_id) + 1
+        return ids[index] if index < len(ids) else None
+    # endregion
+    # -------------------------------------------------------------------------
+
+
+    # -------------------------------------------------------------------------
+    # region CARGA DIFERIDA
+    # -------------------------------------------------------------------------
+    @classmethod
+    def level_class(cls, level_id):
+        """Clase runtime del nivel, importándola la primera vez."""
+        entry = cls._entries[level_id]
+        if entry.cls is None:
+            module_name, class_name = entry.runtime.split(":")
+            t0 = time.perf_counter()
+            module = importlib.import_module(module_name)
+            entry.cls = getattr(module, class_name)
+            entry.import_ms = (time.perf_counter() - t0) * 1000.0
+        return entry.cls
+
+    @classmethod
+    def spec(cls, level_id, ANCHO, ALTO):
+        from core.level.level_spec import load_spec
+        return load_spec(cls._entries[level_id].spec_key, ANCHO, ALTO)
+
+    @classmethod
+    def manifest(cls, level_id, ANCHO, ALTO):
+        """Assets a precargar (para LevelLoader)."""
+        level_class = cls.level_class(level_id)
+        return level_class.asset_manifest(cls.spec(level_id, ANCHO, ALTO))
+
+    @classmethod
+    def create(cls, level_id, pantalla, ANCHO, ALTO):
+        """Construye y carga el nivel, listo para jugar."""
+        entry = cls._entries[level_id]
+        level_class = cls.level_class(level_id)
+        spec = cls.spec(level_id, ANCHO, ALTO)
+
+        t0 = time.perf_counter()
+        level = cls._warm.pop(level_id, None)
+        if level is not None and level.spec is spec and level.pantalla is pantalla:
+            level.reenter()
+            entry.warm_hits += 1
+        else:
+            # Spec recompilado (JSON editado) u otra pantalla: no sirve
+            if level is not None:
+                cls._discard(level)
+            level = level_class(pantalla, ANCHO, ALTO, spec)
+            level.load_assets()
+            entry.builds += 1
+        entry.build_ms = (time.perf_counter() - t0) * 1000.0
+        return level
+    # endregion
+    # -------------------------------------------------------------------------
+
+
+    # -------------------------------------------------------------------------
+    # region CACHE CALIENTE
+    # -------------------------------------------------------------------------
+    @classmethod
+    def park(cls, level_id, level):
+        """Guarda un nivel que se deja de jugar para reutilizarlo después."""
+        previous = cls._warm.pop(level_id, None)
+        if previous is not None and previous is not level:
+            cls._discard(previous)
+        if cls.cache_size <= 0:
+            cls._discard(level)
+            return
+        cls._warm[level_id] = level
+        cls._trim()
+
+    @classmethod
+    def _trim(cls):
+        """Descarta niveles (el más antiguo primero) hasta entrar en el límite."""
+        sizes = {level_id: level.resident_bytes() for level_id, level in cls._warm.items()}
+        total = sum(sizes.values())
+        while cls._warm and (len(cls._warm) > cls.cache_size or total > cls.cache_bytes):
+            level_id, level = cls._warm.popitem(last=False)
+            total -= sizes[level_id]
+            cls._discard(level)
+
+    @classmethod
+    def flush(cls):
+        """Descarta todos los niveles guardados y suelta sus assets."""
+        while cls._warm:
+            _level_id, level = cls._warm.popitem(last=False)
+            cls._discard(level)
+
+    @classmethod
+    def _discard(cls, level):
+        """Suelta lo que retiene un nivel que ya no está en la cache."""
+        level.release_entities()
+        AssetManager.release_owner(level)
+
+        # Sprites de bolas, salvo los que comparte con otro nivel guardado
+        in_use = set()
+        for other in cls._warm.values():
+            in_use |= other.ball_sprite_paths()
+        SpriteCache.evict(level.ball_sprite_paths() - in_use)
+
+    @classmethod
+    def warm_ids(cls):
+        return list(cls._warm)
+    # endregion
+    # -------------------------------------------------------------------------
+
+
+    # -------------------------------------------------------------------------
+    # region MÉTRICAS
+    # -------------------------------------------------------------------------
+    @classmethod
+    def report(cls):
+        """[(id, ms de import, ms de la última carga, construcciones, re-entradas)]"""
+        return [(e.level_id, e.import_ms, e.build_ms, e.builds, e.warm_hits)
+                for e in cls._entries.values()]
+
+    @classmethod
+    def describe(cls, level_id):
+        entry = cls._entries[level_id]
+        fmt = lambda ms: "-" if ms is None else f"{ms:.1f} ms"
+        return (f"{level_id}: import {fmt(entry.import_ms)}, "
+                f"carga {fmt(entry.build_ms)} "
+                f"(construido x{entry.builds}, en caliente x{entry.warm_hits})")
+
+    @classmethod
+    def print_report(cls):
+        for level_id in cls._entries:
+            print("  " + cls.describe(level_id))
+    # endregion
+    # -------------------------------------------------------------------------
+
+
+# -----------------------------------------------------------------------------
+# Niveles del juego (ids de acción del menú)
+# -----------------------------------------------------------------------------
+LevelRegistry.register("level_1", "level1")
+LevelRegistry.register("level_2", "level2")
+LevelRegistry.register("level_3", "level3")
+LevelRegistry.register("level_4", "level4")
+LevelRegistry.register("level_5", "level5")
+LevelRegistry.register("boss_level", "boss", "core.level.boss_level:BossLevel")
+
+#endregion
+# =============================================================================
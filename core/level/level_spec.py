@@ -0,0 +1,401 @@
+import json
+import os
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from core.entities.ball import Ball
+
+# =============================================================================
+#region LEVEL SPEC (Niveles declarativos en assets/levels/*.json)
+# Cada nivel se describe en JSON y se compila a un LevelSpec inmutable con
+# la geometría ya resuelta para una resolución (ANCHO, ALTO) y la lista
+# de assets a precargar. BaseLevel (core/level/level.py) juega cualquier
+# LevelSpec; BossLevel agrega la lógica del jefe si el spec tiene "boss".
+#
+# Formato:
+#   "extends":    otro nivel del que se heredan las claves no indicadas
+#   "name", "time_limit", "hud_height", "floor_offset"
+#   "background": {"image", "alpha", "fill"}
+#   "boundaries": "tiles" | "simple" | "none"
+#   "tileset":    {"image", "tile", "platform_tiles", "floor", "wall", "ceiling"}
+#   "music":      {"path", "volume"}
+#   "platforms":  [{"id", "type": "static"|"moving"|"breakable",
+#                   "x"|"cx", "y"|"cy", "w", "h", "range", "speed", "direction"}]
+#   "balls":      bolas iniciales
+#   "waves":      [{"every_ms", "first_ms", "last_life_burst", "ball_params",
+#                   "groups": [[bola, ...], ...]}]  -> un grupo por disparo
+#   "boss":       parámetros del jefe (ver _compile_boss)
+#
+# Coordenadas: número = píxeles, negativo = desde el borde derecho/inferior,
+# "NN%" = porcentaje del ancho/alto. Las plataformas usan coordenadas de
+# pantalla; bolas, jefe y cristal miden "y" desde el inicio del área de
+# juego (debajo del HUD). Una bola con "on": id se apoya sobre esa
+# plataforma ("dx" desplaza en x).
+#
+# Velocidades ("speed", "vx", "vy", gravity/MIN_VY de ball_params) van por
+# tick a 60 Hz; el runtime las pasa al SIM_HZ real (core/utils/tick_rate.py).
+#
+# Los specs compilados se guardan por (archivo, mtime, resolución):
+# reiniciar o volver a entrar a un nivel no recompila nada.
+# =============================================================================
+
+LEVELS_DIR = os.path.join("assets", "levels")
+
+DEFAULTS = {
+    "time_limit": 99,
+    "hud_height": 50,
+    "floor_offset": 48,
+    "background": {},
+    "boundaries": "tiles",
+    "tileset": {
+        "image": "assets/blocks/block.png",
+        "tile": [16, 16],
+        "platform_tiles": {
+            "top_left": 0, "top": 1, "top_right": 11,
+            "left": 12, "fill": 24, "right": 23,
+            "bottom_left": 96, "bottom": 97, "bottom_right": 107,
+        },
+        "floor": 0,
+        "wall": 1,
+        "ceiling": 1,
+    },
+    "music": None,
+    "platforms": [],
+    "balls": [],
+    "waves": [],
+    "boss": None,
+}
+
+BACKGROUND_FILL = (18, 18, 30)
+MUSIC_VOLUME = 0.5
+HEART_ICON = ("scaled", "assets/sprites/heart.png", (36, 36), True)
+
+
+class LevelSpecError(ValueError):
+    """El archivo del nivel no existe o tiene un formato inválido."""
+
+
+# -----------------------------------------------------------------------------
+# region ESTRUCTURAS COMPILADAS
+# -----------------------------------------------------------------------------
+@dataclass(frozen=True)
+class TilesetSpec:
+    image: str
+    tile_w: int
+    tile_h: int
+    platform_tiles: Tuple[Tuple[str, int], ...]
+    floor_idx: int
+    wall_idx: int
+    ceiling_idx: int
+
+
+@dataclass(frozen=True)
+class PlatformSpec:
+    id: Optional[str]
+    kind: str               # "static" | "moving" | "breakable"
+    x: int
+    y: int
+    w: int
+    h: int
+    move_range: int = 0
+    speed: int = 0
+    direction: int = 1
+
+    @property
+    def platform_type(self):
+        return "breakable" if self.kind == "breakable" else "normal"
+
+
+@dataclass(frozen=True)
+class BallSpec:
+    size: str
+    x: int
+    y: int
+    vx: float
+    vy: float
+    params: Tuple[Tuple[str, float], ...] = ()
+
+
+@dataclass(frozen=True)
+class WaveSpec:
+    every_ms: int
+    first_ms: Optional[int]
+    groups: Tuple[Tuple[BallSpec, ...], ...]
+    last_life_burst: int = 0
+
+
+@dataclass(frozen=True)
+class ShotSpec:
+    size: str
+    dx: int
+    vx: float
+    vy: float
+
+
+@dataclass(frozen=True)
+class CrystalSpec:
+    image: str
+    height: int
+    delay_ms: int
+    damage: int
+    positions: Tuple[Tuple[int, int], ...]
+
+
+@dataclass(frozen=True)
+class BossSpec:
+    image: str
+    size: Tuple[int, int]
+    x: int
+    y: int
+    hp: int
+    speed: int
+    patrol: Tuple[int, int]
+    hit_score: int
+    shoot_every_ms: int
+    first_shot_ms: int
+    shots: Tuple[ShotSpec, ...]
+    ball_sprites: Tuple[Tuple[str, str], ...]
+    crystal: Optional[CrystalSpec]
+
+
+@dataclass(frozen=True)
+class LevelSpec:
+    key: str
+    name: str
+    screen: Tuple[int, int]
+    time_limit: int
+    hud_height: int
+    floor_offset: int
+    background_image: Optional[str]
+    background_alpha: bool
+    background_fill: Tuple[int, int, int]
+    boundaries: str
+    tileset: TilesetSpec
+    music_path: Optional[str]
+    music_volume: float
+    platforms: Tuple[PlatformSpec, ...]
+    balls: Tuple[BallSpec, ...]
+    waves: Tuple[WaveSpec, ...]
+    boss: Optional[BossSpec]
+    # Manifiesto para LevelLoader: ("image", ruta, alpha) / ("scaled", ...)
+    assets: Tuple[tuple, ...]
+# endregion
+# -----------------------------------------------------------------------------
+
+
+# -----------------------------------------------------------------------------
+# region CARGA Y CACHE
+# -----------------------------------------------------------------------------
+_compiled = {}      # (ruta, mtime_ns, ANCHO, ALTO) -> LevelSpec
+
+
+def spec_path(key):
+    return os.path.join(LEVELS_DIR, f"{key}.json")
+
+
+def load_spec(key, ANCHO, ALTO):
+    """LevelSpec de assets/levels/<key>.json para la resolución dada."""
+    path = spec_path(key)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError as e:
+        raise LevelSpecError(f"No existe el nivel '{key}' ({path})") from e
+
+    cache_key = (path, mtime, ANCHO, ALTO)
+    spec = _compiled.get(cache_key)
+    if spec is None:
+        spec = compile_spec(key, _read(key), ANCHO, ALTO)
+        _compiled[cache_key] = spec
+    return spec
+
+
+def clear_cache():
+    _compiled.clear()
+
+
+def _read(key, seen=()):
+    """JSON del nivel con "extends" ya resuelto (merge superficial)."""
+    if key in seen:
+        raise LevelSpecError(f"Herencia circular en el nivel '{key}'")
+    try:
+        with open(spec_path(key), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        raise LevelSpecError(f"No se pudo leer el nivel '{key}': {e}") from e
+
+    parent = data.pop("extends", None)
+    base = _read(parent, seen + (key,)) if parent else dict(DEFAULTS)
+    base.update(data)
+    return base
+# endregion
+# -----------------------------------------------------------------------------
+
+
+# -----------------------------------------------------------------------------
+# region COMPILADOR
+# -----------------------------------------------------------------------------
+def _coord(value, size):
+    """Píxeles, negativo desde el borde opuesto o "NN%" de `size`."""
+    if isinstance(value, str):
+        if not value.endswith("%"):
+            raise LevelSpecError(f"Coordenada inválida: {value!r}")
+        return int(size * float(value[:-1]) / 100)
+    value = int(value)
+    return size + value if value < 0 else value
+
+
+def compile_spec(key, data, ANCHO, ALTO):
+    hud_height = int(data["hud_height"])
+    floor_offset = int(data["floor_offset"])
+    area_top = hud_height
+
+    try:
+        platforms = tuple(_compile_platform(p, ANCHO, ALTO) for p in data["platforms"])
+        named = {p.id: p for p in platforms if p.id}
+
+        # Límites donde se ubican las bolas generadas (como en el spawn original)
+        x_range = (16 + 30, ANCHO - 16 - 30)
+
+        def ball(raw, params=()):
+            return _compile_ball(raw, named, ANCHO, area_top, x_range, params)
+
+        balls = tuple(ball(b) for b in data["balls"])
+
+        waves = []
+        for w in data["waves"]:
+            params = tuple(sorted(w.get("ball_params", {}).items()))
+            waves.append(WaveSpec(
+                every_ms=int(w["every_ms"]),
+                first_ms=w.get("first_ms"),
+                groups=tuple(tuple(ball(b, params) for b in g) for g in w["groups"]),
+                last_life_burst=int(w.get("last_life_burst", 0)),
+            ))
+
+        boss = _compile_boss(data["boss"], ANCHO, area_top) if data["boss"] else None
+
+        bg = data["background"]
+        ts = data["tileset"]
+        tileset = TilesetSpec(
+            image=ts["image"],
+            tile_w=int(ts["tile"][0]),
+            tile_h=int(ts["tile"][1]),
+            platform_tiles=tuple(sorted(ts["platform_tiles"].items())),
+            floor_idx=int(ts["floor"]),
+            wall_idx=int(ts["wall"]),
+            ceiling_idx=int(ts["ceiling"]),
+        )
+        music = data["music"] or {}
+    except (KeyError, TypeError, ValueError) as e:
+        raise LevelSpecError(f"Nivel '{key}' inválido: {e!r}") from e
+
+    if data["boundaries"] not in ("tiles", "simple", "none"):
+        raise LevelSpecError(f"Nivel '{key}': boundaries desconocido {data['boundaries']!r}")
+
+    background_image = bg.get("image")
+    background_alpha = bool(bg.get("alpha", True))
+
+    # Manifiesto de assets (mismas claves que AssetManager.image/scaled)
+    assets = []
+    if background_image:
+        assets.append(("scaled", background_image,
+                       (ANCHO, ALTO - hud_height), background_alpha))
+    assets.append(("image", tileset.image, True))
+    assets.append(HEART_ICON)
+    if boss:
+        assets.append(("scaled", boss.image, boss.size, True))
+        if boss.crystal:
+            assets.append(("image", boss.crystal.image, True))
+
+    return LevelSpec(
+        key=key,
+        name=data.get("name", key),
+        screen=(ANCHO, ALTO),
+        time_limit=int(data["time_limit"]),
+        hud_height=hud_height,
+        floor_offset=floor_offset,
+        background_image=background_image,
+        background_alpha=background_alpha,
+        background_fill=tuple(bg.get("fill", BACKGROUND_FILL)),
+        boundaries=data["boundaries"],
+        tileset=tileset,
+        music_path=music.get("path"),
+        music_volume=float(music.get("volume", MUSIC_VOLUME)),
+        platforms=platforms,
+        balls=balls,
+        waves=tuple(waves),
+        boss=boss,
+        assets=tuple(assets),
+    )
+
+
+def _compile_platform(raw, ANCHO, ALTO):
+    kind = raw.get("type", "static")
+    if kind not in ("static", "moving", "breakable"):
+        raise LevelSpecError(f"Tipo de plataforma desconocido: {kind!r}")
+
+    w, h = int(raw["w"]), int(raw["h"])
+    x = _coord(raw["cx"], ANCHO) - w // 2 if "cx" in raw else _coord(raw["x"], ANCHO)
+    y = _coord(raw["cy"], ALTO) - h // 2 if "cy" in raw else _coord(raw["y"], ALTO)
+
+    return PlatformSpec(
+        id=raw.get("id"), kind=kind, x=x, y=y, w=w, h=h,
+        move_range=int(raw.get("range", 0)),
+        speed=int(raw.get("speed", 0)),
+        direction=int(raw.get("direction", 1)),
+    )
+
+
+def _compile_ball(raw, named, ANCHO, area_top, x_range, params):
+    size = raw["size"]
+    radius = Ball.radius_by_size[size]
+    dx = int(raw.get("dx", 0))
+
+    if "on" in raw:
+        # Apoyada sobre una plataforma con nombre
+        platform = named[raw["on"]]
+        x = platform.x + platform.w // 2 + dx
+        y = platform.y - radius
+    else:
+        x = _coord(raw["x"], ANCHO) + dx
+        x = max(x_range[0], min(x, x_range[1]))
+        y = area_top + int(raw["y"])
+
+    return BallSpec(size=size, x=x, y=y,
+                    vx=raw.get("vx", 0), vy=raw.get("vy", 0), params=params)
+
+
+def _compile_boss(raw, ANCHO, area_top):
+    crystal = raw.get("crystal")
+    if crystal:
+        crystal = CrystalSpec(
+            image=crystal["image"],
+            height=int(crystal["height"]),
+            delay_ms=int(crystal["delay_ms"]),
+            damage=int(crystal.get("damage", 1)),
+            positions=tuple(
+                (_coord(x, ANCHO), area_top + int(y)) for x, y in crystal["positions"]
+            ),
+        )
+
+    return BossSpec(
+        image=raw["image"],
+        size=(int(raw["size"][0]), int(raw["size"][1])),
+        x=_coord(raw["x"], ANCHO) + int(raw.get("dx", 0)),
+        y=area_top + int(raw["y"]),
+        hp=int(raw["hp"]),
+        speed=int(raw["speed"]),
+        patrol=(int(raw["patrol"][0]), int(raw["patrol"][1])),
+        hit_score=int(raw.get("hit_score", 0)),
+        shoot_every_ms=int(raw["shoot_every_ms"]),
+        first_shot_ms=int(raw["first_shot_ms"]),
+        shots=tuple(
+            ShotSpec(s["size"], int(s.get("dx", 0)), s["vx"], s["vy"]) for s in raw["shot"]
+        ),
+        ball_sprites=tuple(sorted(raw.get("ball_sprites", {}).items())),
+        crystal=crystal,
+    )
+# endregion
+# -----------------------------------------------------------------------------
+
+#endregion
+# =============================================================================
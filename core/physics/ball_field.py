@@ -0,0 +1,255 @@
+import numpy as np
+
+from core.utils.tick_rate import per_tick, ticks
+
+# Límites de rebote comunes a Ball y BallField (en ticks de SIM_HZ)
+MAX_VY = per_tick(18)
+BOUNCE_COOLDOWN = ticks(3)      # ticks sin volver a rebotar
+
+# ================================================================
+#region FIELD ATTRIBUTE (Descriptor de vista)
+# Atributo de Ball que vive en los arrays del BallField cuando la
+# bola está adjunta, o en la propia instancia cuando está suelta.
+# ================================================================
+class FieldAttr:
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.local = "_" + name
+
+    def __get__(self, ball, owner=None):
+        if ball is None:
+            return self
+        field = ball._field
+        if field is None:
+            return ball.__dict__[self.local]
+        return getattr(field, self.name).item(ball._slot)
+
+    def __set__(self, ball, value):
+        field = ball._field
+        if field is None:
+            ball.__dict__[self.local] = value
+        else:
+            getattr(field, self.name)[ball._slot] = value
+#endregion
+# ================================================================
+
+
+
+# ================================================================
+#region BALL FIELD (Structure-of-arrays de todas las bolas)
+# Contenedor tipo lista para level.balls. Guarda el estado físico en
+# arrays contiguos de NumPy y aplica Ball.update en un solo paso
+# vectorizado. Los objetos Ball quedan como vistas finas sobre su fila.
+# ================================================================
+class BallField:
+
+    # Columnas dinámicas (se escriben en cada paso y son visibles desde Ball)
+    FLOAT_COLUMNS = ("x", "y", "vx", "vy", "bounce_factor", "prev_x", "prev_y")
+    INT_COLUMNS = ("bounce_count", "just_bounced")
+
+    # Parámetros por bola copiados al adjuntar (constantes durante la vida)
+    PARAM_COLUMNS = ("radius", "gravity", "min_vy", "min_bounce_height",
+                     "max_bounces_before_low")
+
+    # -------------------------------------------------------------
+    def __init__(self, capacity=64):
+        self.views = []
+        self.capacity = 0
+        self._grow(capacity)
+
+    # -------------------------------------------------------------
+    def _grow(self, capacity):
+        """Reserva arrays con nueva capacidad conservando las filas vivas."""
+        n = len(self.views)
+
+        def resize(name, dtype):
+            arr = np.zeros(capacity, dtype=dtype)
+            if self.capacity:
+                arr[:n] = getattr(self, name)[:n]
+            setattr(self, name, arr)
+
+        for name in self.FLOAT_COLUMNS:
+            resize(name, np.float64)
+        for name in self.INT_COLUMNS:
+            resize(name, np.int64)
+        for name in self.PARAM_COLUMNS:
+            resize(name, np.float64)
+
+        self.capacity = capacity
+
+    def _columns(self):
+        return self.FLOAT_COLUMNS + self.INT_COLUMNS + self.PARAM_COLUMNS
+
+
+    # -------------------------------------------------------------
+    # region ADJUNTAR / SOLTAR
+    # -------------------------------------------------------------
+    def _attach(self, ball):
+        if ball._field is not None:
+            raise ValueError("Ball ya pertenece a un BallField")
+
+        slot = len(self.views)
+        if slot >= self.capacity:
+            self._grow(self.capacity * 2)
+
+        d = ball.__dict__
+        for name in self.FLOAT_COLUMNS + self.INT_COLUMNS:
+            getattr(self, name)[slot] = d["_" + name]
+
+        self.radius[slot] = ball.radius_by_size[ball.size]
+        self.gravity[slot] = ball.gravity
+        self.min_vy[slot] = ball.MIN_VY
+        self.min_bounce_height[slot] = ball.MIN_BOUNCE_HEIGHT
+        self.max_bounces_before_low[slot] = ball.max_bounces_before_low
+
+        ball._field = self
+        ball._slot = slot
+        self.views.append(ball)
+
+    def _detach(self, ball):
+        """Devuelve el estado a la instancia y libera su fila (swap-remove)."""
+        slot = ball._slot
+        d = ball.__dict__
+        for name in self.FLOAT_COLUMNS + self.INT_COLUMNS:
+            d["_" + name] = getattr(self, name).item(slot)
+        ball._field = None
+        ball._slot = -1
+
+        last = len(self.views) - 1
+        if slot != last:
+            moved = self.views[last]
+            for name in self._columns():
+                col = getattr(self, name)
+                col[slot] = col[last]
+            self.views[slot] = moved
+            moved._slot = slot
+        self.views.pop()
+    # endregion
+    # -------------------------------------------------------------
+
+
+    # -------------------------------------------------------------
+    # region INTERFAZ DE LISTA (compatibilidad con level.balls)
+    # -------------------------------------------------------------
+    def append(self, ball):
+        self._attach(ball)
+
+    def extend(self, balls):
+        for ball in balls:
+            self._attach(ball)
+
+    def remove(self, ball):
+        if ball._field is not self:
+            raise ValueError("BallField.remove(x): x no está en el campo")
+        self._detach(ball)
+
+    def clear(self):
+        while self.views:
+            self._detach(self.views[-1])
+
+    def __contains__(self, ball):
+        return getattr(ball, "_field", None) is self
+
+    def __len__(self):
+        return len(self.views)
+
+    def __iter__(self):
+        return iter(self.views)
+
+    def __getitem__(self, index):
+        return self.views[index]
+    # endregion
+    # -------------------------------------------------------------
+
+
+    # -------------------------------------------------------------
+    # region INTERPOLACIÓN
+    # -------------------------------------------------------------
+    def store_previous(self):
+        """Copia x/y actuales a prev_x/prev_y (antes de cada paso)."""
+        n = len(self.views)
+        np.copyto(self.prev_x[:n], self.x[:n])
+        np.copyto(self.prev_y[:n], self.y[:n])
+    # endregion
+    # -------------------------------------------------------------
+
+
+    # -------------------------------------------------------------
+    # region STEP (Ball.update vectorizado)
+    # -------------------------------------------------------------
+    def step(self, floor_y, left_wall, right_wall, ceiling_y):
+        """
+        Aplica exactamente las reglas de Ball.update / bounce_vertical
+        a todas las bolas a la vez.
+        """
+        n = len(self.views)
+        if n == 0:
+            return
+
+        x = self.x[:n]
+        y = self.y[:n]
+        vx = self.vx[:n]
+        vy = self.vy[:n]
+        bf = self.bounce_factor[:n]
+        bc = self.bounce_count[:n]
+        jb = self.just_bounced[:n]
+        r = self.radius[:n]
+        g = self.gravity[:n]
+        min_vy = self.min_vy[:n]
+
+        np.subtract(jb, 1, out=jb, where=jb > 0)
+
+        vy += g
+        x += vx
+        y += vy
+
+        # TECHO (retorna sin evaluar piso ni paredes)
+        ceiling_limit = ceiling_y + 16
+        hit_ceiling = y - r <= ceiling_limit
+        if hit_ceiling.any():
+            y[hit_ceiling] = ceiling_limit + r[hit_ceiling]
+
+            bounce = hit_ceiling & (jb == 0)
+            vy[bounce] = np.maximum(np.abs(vy[bounce]) * bf[bounce], min_vy[bounce])
+            jb[bounce] = BOUNCE_COOLDOWN
+
+        # PISO (retorna sin evaluar paredes)
+        hit_floor = ~hit_ceiling & (y + r >= floor_y) & (jb == 0)
+        if hit_floor.any():
+            y[hit_floor] = floor_y - r[hit_floor]
+            bc[hit_floor] += 1
+            vy[hit_floor] = self._floor_bounce_vy(hit_floor, n)
+            jb[hit_floor] = BOUNCE_COOLDOWN
+            y[hit_floor] -= 1
+
+        # PAREDES
+        walls = ~(hit_ceiling | hit_floor)
+
+        hit_left = walls & (x - r <= left_wall)
+        x[hit_left] = left_wall + r[hit_left]
+        vx[hit_left] = np.abs(vx[hit_left]) * bf[hit_left]
+
+        hit_right = walls & (x + r >= right_wall)
+        x[hit_right] = right_wall - r[hit_right]
+        vx[hit_right] = -np.abs(vx[hit_right]) * bf[hit_right]
+
+    def _floor_bounce_vy(self, mask, n):
+        """bounce_vertical(use_min_height=True) para las filas de `mask`."""
+        vy = self.vy[:n][mask]
+        bf = self.bounce_factor[:n][mask]
+        g = self.gravity[:n][mask]
+        min_vy = self.min_vy[:n][mask]
+
+        low = self.bounce_count[:n][mask] > self.max_bounces_before_low[:n][mask]
+        required_vy = -np.sqrt(2 * g * self.min_bounce_height[:n][mask])
+
+        new_vy = np.where(low, np.minimum(vy, required_vy), -np.abs(vy) * bf)
+        new_vy = np.where(np.abs(new_vy) < min_vy, -min_vy, new_vy)
+        new_vy = np.where(np.abs(new_vy) > MAX_VY, -MAX_VY, new_vy)
+        return new_vy
+    # endregion
+    # -------------------------------------------------------------
+
+#endregion
+# ================================================================
@@ -1,5 +1,10 @@
 import pygame
 import math
+from collections import deque
+from core.physics.spatial_hash import SpatialHash
+from core.physics.swept import sweep_point_moving_circle
+from core.entities.ball import Ball
+from core.entities.bullet import Bullet
 
 # ================================================================
 #region COLLISION SYSTEM (MAIN CLASS)
@@ -7,6 +12,15 @@ import math
 # ================================================================
 class CollisionSystem:
 
+    def __init__(self):
+        # Broadphase: rejillas reconstruidas en cada frame
+        self.ball_hash = SpatialHash()
+        self.platform_hash = SpatialHash()
+
+        # Métrica: pares que llegan al narrowphase (último frame / histórico)
+        self.pair_count = 0
+        self.pairs_by_frame = deque(maxlen=600)
+
     # ============================================================
     #region BULLET vs BALL
     # Colisión entre bala y bola (circular vs punto)
@@ -21,6 +35,20 @@ class CollisionSystem:
         dy = bullet_center_y - ball.y
         distance = math.sqrt(dx*dx + dy*dy)
         return distance < ball.radius_by_size[ball.size]
+
+    @staticmethod
+    def bullet_ball_toi(bullet, ball):
+        """
+        Instante (0..1) del paso en que el centro de la bala entra a la
+        bola, con las dos moviéndose; None si no llega a tocarla.
+        """
+        cx = bullet.x + bullet.width / 2
+        half_h = bullet.height / 2
+        return sweep_point_moving_circle(
+            cx, bullet.prev_y + half_h, cx, bullet.y + half_h,
+            ball.prev_x, ball.prev_y, ball.x, ball.y,
+            ball.radius_by_size[ball.size]
+        )
     #endregion
     # ============================================================
 
@@ -31,8 +59,8 @@ class CollisionSystem:
     # ============================================================
     @staticmethod
     def check_bullet_platform(bullet, platform):
-        """Detecta colisión bala-plataforma"""
-        bullet_rect = bullet.get_hitbox()
+        """Detecta colisión bala-plataforma (todo el recorrido del paso)"""
+        bullet_rect = bullet.get_swept_hitbox()
         return bullet_rect.colliderect(platform.rect)
     #endregion
     # ============================================================
@@ -124,44 +152,73 @@ class CollisionSystem:
     # ============================================================
     def process_collisions(self, level):
         """Procesa todas las colisiones del nivel."""
+        self.pair_count = 0
+        self._build_broadphase(level)
+
         bullets_to_remove = []
-        
-        for bullet in level.bullets[:]:
+        removed_platforms = set()
+        platform_system = getattr(level, 'platform_system', None)
+
+        for bullet in level.bullets:
             bullet_hit_something = False
-            
-            # 1. Bala vs Bolas
-            for ball in level.balls[:]:
-                if self.check_bullet_ball(bullet, ball):
-                    self._handle_bullet_hit_ball(level, bullet, ball)
-                    bullet_hit_something = True
-                    break
-            
-            # 2. Bala vs Plataforma
-            if not bullet_hit_something and hasattr(level, 'platform_system'):
-                for platform in level.platform_system.platforms[:]:
+            hitbox = bullet.get_swept_hitbox()
+
+            # 1. Bala vs Bolas: las de las celdas que recorrió el centro de
+            #    la bala en el paso; gana la que toca primero (barrido)
+            cx = bullet.x + bullet.width / 2
+            cy = bullet.y + bullet.height / 2
+            prev_cy = bullet.prev_y + bullet.height / 2
+            first, first_t = None, None
+            for ball in self.ball_hash.query(cx, cy, cx, prev_cy):
+                if ball not in level.balls:
+                    continue
+                self.pair_count += 1
+                t = self.bullet_ball_toi(bullet, ball)
+                if t is not None and (first_t is None or t < first_t):
+                    first, first_t = ball, t
+            if first is not None:
+                self._handle_bullet_hit_ball(level, bullet, first, bullets_to_remove)
+                bullet_hit_something = True
+
+            # 2. Bala vs Plataforma (la primera en su camino hacia arriba)
+            if not bullet_hit_something and platform_system is not None:
+                hit = None
+                for platform in self.platform_hash.query(
+                        hitbox.left, hitbox.top, hitbox.right, hitbox.bottom):
+                    if platform in removed_platforms:
+                        continue
+                    self.pair_count += 1
                     if self.check_bullet_platform(bullet, platform):
-                        bullets_to_remove.append(bullet)
-                        bullet_hit_something = True
-
-                        # Si es rompediza, se elimina
-                        if platform.type == "breakable":
-                            level.platform_system.platforms.remove(platform)
-                        break
-            
+                        if hit is None or platform.rect.bottom > hit.rect.bottom:
+                            hit = platform
+                if hit is not None:
+                    bullets_to_remove.append(bullet)
+                    bullet_hit_something = True
+
+                    # Si es rompediza, se elimina
+                    if hit.type == "breakable":
+                        platform_system.remove_platform(hit)
+                        removed_platforms.add(hit)
+
             # 3. Bala vs Límites del nivel
             if not bullet_hit_something and self.check_bullet_walls(bullet, level):
                 bullets_to_remove.append(bullet)
-        
-        # Eliminar balas impactadas
+
+        # Eliminar balas impactadas (vuelven al pool al final del paso)
         for bullet in bullets_to_remove:
-            if bullet in level.bullets:
-                level.bullets.remove(bullet)
+            if level.bullets.discard(bullet):
+                Bullet.pool.release(bullet)
 
         # 4. Bola vs Jugador
-        if level.player and level.player.is_alive():
-            for ball in level.balls[:]:
-                if self.check_player_ball(level.player, ball):
-                    level.player.take_damage()
+        player = level.player
+        if player and player.is_alive():
+            for ball in self.ball_hash.query(
+                    player.x, player.y, player.x + player.width, player.y + player.height):
+                if ball not in level.balls:
+                    continue
+                self.pair_count += 1
+                if self.check_player_ball(player, ball):
+                    player.take_damage()
                     break
 
         # 5. Jugador vs Paredes del nivel
@@ -169,6 +226,51 @@ class CollisionSystem:
             self.check_player_walls(level.player, level)
             self.check_player_ceiling(level.player, level)
             self.check_player_floor(level.player, level)
+
+        self.pairs_by_frame.append(self.pair_count)
+    #endregion
+    # ============================================================
+
+
+    # ============================================================
+    #region BROADPHASE
+    # Reconstrucción de las rejillas de bolas y plataformas
+    # ============================================================
+    def _build_broadphase(self, level):
+        """Inserta bolas y plataformas en sus rejillas para este frame."""
+        # Celda = diámetro de la bola más grande presente
+        max_r = 0
+        for ball in level.balls:
+            r = ball.radius_by_size[ball.size]
+            if r > max_r:
+                max_r = r
+        cell = max(2 * max_r, 32)
+
+        # AABB de todo el recorrido del paso (para las pruebas de barrido)
+        self.ball_hash.clear(cell)
+        for ball in level.balls:
+            r = ball.radius_by_size[ball.size]
+            x0, y0, x1, y1 = ball.prev_x, ball.prev_y, ball.x, ball.y
+            self.ball_hash.insert(ball, min(x0, x1) - r, min(y0, y1) - r,
+                                  max(x0, x1) + r, max(y0, y1) + r)
+
+        self.platform_hash.clear(cell)
+        platform_system = getattr(level, 'platform_system', None)
+        if platform_system is not None:
+            for platform in platform_system.platforms:
+                rect = platform.rect
+                self.platform_hash.insert(platform, rect.left, rect.top, rect.right, rect.bottom)
+
+    def pair_stats(self):
+        """Pares narrowphase: último frame, promedio y máximo recientes."""
+        history = self.pairs_by_frame
+        if not history:
+            return {"last": 0, "avg": 0.0, "max": 0}
+        return {
+            "last": history[-1],
+            "avg": sum(history) / len(history),
+            "max": max(history),
+        }
     #endregion
     # ============================================================
 
@@ -177,16 +279,23 @@ class CollisionSystem:
     #region INTERNAL HANDLERS
     # Handlers internos: cuando la bala golpea una bola
     # ============================================================
-    def _handle_bullet_hit_ball(self, level, bullet, ball):
+    def _handle_bullet_hit_ball(self, level, bullet, ball, bullets_to_remove):
         """Maneja cuando una bala golpea una bola."""
-        if bullet in level.bullets:
-            level.bullets.remove(bullet)
+        bullets_to_remove.append(bullet)
 
         if ball in level.balls:
             level.balls.remove(ball)
-            new_balls = ball.split()
+            new_balls = ball.split(level.clock.now())
+            # Liberación diferida: las hijas de este split no pueden ser ella
+            Ball.pool.release(ball)
             level.balls.extend(new_balls)
             level.score += 100
+
+            # Las hijas pueden ser golpeadas por otra bala este mismo frame
+            for child in new_balls:
+                r = child.radius_by_size[child.size]
+                self.ball_hash.insert(child, child.x - r, child.y - r,
+                                      child.x + r, child.y + r)
     #endregion
     # ============================================================
 
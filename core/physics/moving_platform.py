@@ -1,5 +1,6 @@
 import pygame
 from core.physics.platforms import Platform
+from core.utils.tick_rate import per_tick
 
 
 class MovingPlatform(Platform):
@@ -8,6 +9,8 @@ class MovingPlatform(Platform):
     Se mueve en el eje X entre dos límites.
     """
 
+    is_static = False
+
     def __init__(
         self,
         x,
@@ -22,25 +25,36 @@ class MovingPlatform(Platform):
 
         # Posición base
         self.start_x = x
+        self.pos_x = float(x)   # rect.x es entero: a SIM_HZ alto el paso es < 1 px
 
-        # Movimiento
+        # Movimiento (speed en px por tick a 60 Hz)
         self.move_range = move_range
-        self.speed = speed
+        self.speed = per_tick(speed)
         self.direction = 1  # 1 = derecha, -1 = izquierda
 
     # -------------------------------------------------------------
     def update(self):
         """Actualiza el movimiento horizontal"""
 
-        self.rect.x += self.speed * self.direction
-        self.hitbox.x = self.rect.x + 2  # mantener hitbox alineada
+        self.pos_x += self.speed * self.direction
 
         # Límite derecho
-        if self.rect.x >= self.start_x + self.move_range:
-            self.rect.x = self.start_x + self.move_range
+        if self.pos_x >= self.start_x + self.move_range:
+            self.pos_x = self.start_x + self.move_range
             self.direction = -1
 
         # Límite izquierdo
-        elif self.rect.x <= self.start_x - self.move_range:
-            self.rect.x = self.start_x - self.move_range
+        elif self.pos_x <= self.start_x - self.move_range:
+            self.pos_x = self.start_x - self.move_range
             self.direction = 1
+
+        self.rect.x = round(self.pos_x)
+        self.hitbox.x = self.rect.x + 2  # mantener hitbox alineada
+
+    # -------------------------------------------------------------
+    def reset_position(self, direction=1):
+        """Vuelve a la posición inicial (reinicio del nivel)."""
+        self.pos_x = float(self.start_x)
+        self.rect.x = self.start_x
+        self.hitbox.x = self.rect.x + 2
+        self.direction = direction
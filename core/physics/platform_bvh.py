@@ -0,0 +1,90 @@
+# ================================================================
+#region PLATFORM BVH (Jerarquía de cajas sobre plataformas fijas)
+# Árbol binario de AABBs sobre los hitbox de las plataformas fijas.
+# Se construye una vez (partiendo por la mediana del eje más largo) y
+# una consulta por rect solo baja por las ramas que lo tocan, así cada
+# bola prueba las plataformas cercanas y no todas.
+#
+# Las plataformas no se mueven: el árbol no se actualiza, se reconstruye
+# entero cuando cambia el conjunto (AdvancedPlatformSystem.version, p. ej.
+# al romperse una). Las móviles no entran aquí.
+#
+# Nodos en una lista plana: [left, top, right, bottom, hijo_der, inicio, n]
+#   hoja:    hijo_der = -1, items[inicio:inicio+n]
+#   interno: hijo izquierdo = índice + 1, hijo derecho = hijo_der
+# ================================================================
+
+LEAF_SIZE = 4
+
+
+class PlatformBVH:
+
+    def __init__(self, platforms):
+        self.platforms = list(platforms)
+        # (orden de registro, left, top, right, bottom)
+        self._items = [
+            (i, p.hitbox.left, p.hitbox.top, p.hitbox.right, p.hitbox.bottom)
+            for i, p in enumerate(self.platforms)
+        ]
+        self._nodes = []
+        if self._items:
+            self._build(0, len(self._items))
+
+    # -------------------------------------------------------------
+    def _build(self, start, end):
+        items = self._items
+        chunk = items[start:end]
+        node = [
+            min(it[1] for it in chunk), min(it[2] for it in chunk),
+            max(it[3] for it in chunk), max(it[4] for it in chunk),
+            -1, start, end - start,
+        ]
+        index = len(self._nodes)
+        self._nodes.append(node)
+
+        if end - start > LEAF_SIZE:
+            # Partir por la mediana de los centros en el eje más largo
+            if node[2] - node[0] >= node[3] - node[1]:
+                chunk.sort(key=lambda it: it[1] + it[3])
+            else:
+                chunk.sort(key=lambda it: it[2] + it[4])
+            items[start:end] = chunk
+
+            mid = (start + end) // 2
+            self._build(start, mid)
+            node[4] = self._build(mid, end)
+            node[6] = 0
+        return index
+
+    # -------------------------------------------------------------
+    def query(self, left, top, right, bottom):
+        """Plataformas cuyo hitbox toca el rect, en orden de registro."""
+        nodes = self._nodes
+        if not nodes:
+            return []
+
+        found = []
+        stack = [0]
+        while stack:
+            index = stack.pop()
+            node = nodes[index]
+            if node[0] > right or node[2] < left or node[1] > bottom or node[3] < top:
+                continue
+            if node[4] < 0:
+                start = node[5]
+                for it in self._items[start:start + node[6]]:
+                    if it[1] <= right and it[3] >= left and it[2] <= bottom and it[4] >= top:
+                        found.append(it[0])
+            else:
+                stack.append(node[4])
+                stack.append(index + 1)
+
+        # El primer choque se resuelve en orden de registro (como sin BVH)
+        found.sort()
+        platforms = self.platforms
+        return [platforms[i] for i in found]
+
+    def __len__(self):
+        return len(self.platforms)
+#endregion
+# ================================================================
@@ -1,6 +1,10 @@
 import pygame
+from collections import deque
 from core.utils.spritesheet import slice_spritesheet, load_image
-from core.entities.ball import Ball   # necesario para bounce_vertical
+from core.entities.ball import Ball   # constantes de rebote
+from core.utils.entity_store import EntityStore
+from core.physics.swept import sweep_circle_aabb
+from core.physics.platform_bvh import PlatformBVH
 
 PLATFORM_TILES = {}
 
@@ -56,6 +60,10 @@ def build_platform_surface(width, height, tiles):
 # Maneja cada plataforma individualmente: gráfica, hitbox y colisiones
 # ================================================================
 class Platform:
+
+    # Las plataformas fijas pueden predecirse analíticamente (ver trajectory.py)
+    is_static = True
+
     def __init__(self, x, y, width, height, platform_type="normal"):
         # Hitbox principal del bloque
         self.rect = pygame.Rect(x, y, width, height)
@@ -109,7 +117,7 @@ class Platform:
     # -------------------------------------------------------------
     def draw(self, screen):
         """Dibuja la plataforma con tiles."""
-        screen.blit(self.surface, self.rect)
+        return screen.blit(self.surface, self.rect)
 #endregion
 # ================================================================
 
@@ -121,20 +129,56 @@ class Platform:
 # ================================================================
 class AdvancedPlatformSystem:
     def __init__(self):
-        self.platforms = []
+        self.platforms = EntityStore()
         self.breakable_platforms = set()
+
+        # Se incrementa cada vez que cambia el conjunto de plataformas
+        self.version = 0
+
+        # Consultas bola-plataforma: BVH de las fijas (se reconstruye al
+        # cambiar version) + lista corta de móviles que se prueban siempre
+        self._bvh = None
+        self._dynamic = []
+        self._order = {}        # id(plataforma) -> orden de registro
+        self._query_version = -1
+        self.bvh_builds = 0
+
+        # Métrica: candidatas probadas / plataformas totales, por paso
+        self._step_candidates = 0
+        self._step_total = 0
+        self.queries_by_step = deque(maxlen=600)
     
     # -------------------------------------------------------------
     # Agregar plataforma normal y devolver referencia
     def add_platform(self, x, y, width, height, platform_type="normal"):
         platform = Platform(x, y, width, height, platform_type)
+        return self.register_platform(platform)
+
+    # -------------------------------------------------------------
+    # Registrar una plataforma ya construida (p. ej. MovingPlatform)
+    def register_platform(self, platform):
         self.platforms.append(platform)
 
         if platform.type == "breakable":
             self.breakable_platforms.add(platform)
 
+        self.version += 1
         return platform
 
+    # -------------------------------------------------------------
+    # Eliminar plataforma (rompibles)
+    def remove_platform(self, platform):
+        if self.platforms.discard(platform):
+            self.breakable_platforms.discard(platform)
+            self.version += 1
+
+    # -------------------------------------------------------------
+    # Volver a un conjunto de plataformas ya construido (reinicio)
+    def restore(self, platforms):
+        self.platforms = EntityStore(platforms)
+        self.breakable_platforms = {p for p in platforms if p.type == "breakable"}
+        self.version += 1
+
     # -------------------------------------------------------------
     # Agregar plataforma centrada según posición media
     def add_centered_platform(self, center_x, center_y, width, height, platform_type="normal"):
@@ -144,13 +188,93 @@ class AdvancedPlatformSystem:
 
     # -------------------------------------------------------------
     # Detección general de colisiones con bolas
-    def process_ball_collisions(self, ball):
-        for platform in self.platforms[:]:
+    def process_ball_collisions(self, ball, platforms=None):
+        """
+        Resuelve la primera plataforma que toca la bola.
+        platforms: subconjunto a revisar (por defecto todas).
+        """
+        if platforms is None:
+            platforms = self.platforms
+        for platform in platforms:
             if platform.check_ball_collision(ball):
                 self._handle_collision(ball, platform)
                 return True
         return False
 
+    # -------------------------------------------------------------
+    # Plataformas que puede tocar la bola en este paso (su recorrido)
+    def platforms_near_ball(self, ball):
+        if self._query_version != self.version:
+            self._bvh = PlatformBVH(self.static_platforms())
+            self._dynamic = self.dynamic_platforms()
+            self._order = {id(p): i for i, p in enumerate(self.platforms)}
+            self._query_version = self.version
+            self.bvh_builds += 1
+
+        r = ball.radius_by_size[ball.size]
+        x0, y0, x1, y1 = ball.prev_x, ball.prev_y, ball.x, ball.y
+        candidates = self._bvh.query(min(x0, x1) - r, min(y0, y1) - r,
+                                     max(x0, x1) + r, max(y0, y1) + r)
+        if self._dynamic:
+            # Fijas y móviles intercaladas en orden de registro: el primer
+            # choque se resuelve igual que recorriendo self.platforms
+            order = self._order
+            candidates.extend(self._dynamic)
+            candidates.sort(key=lambda p: order[id(p)])
+
+        self._step_candidates += len(candidates)
+        self._step_total += len(self._bvh) + len(self._dynamic)
+        return candidates
+
+    def end_query_step(self):
+        """Cierra la métrica de consultas del paso."""
+        self.queries_by_step.append((self._step_candidates, self._step_total))
+        self._step_candidates = 0
+        self._step_total = 0
+
+    def pruning_stats(self):
+        """Pares bola-plataforma probados vs. posibles en la ventana reciente."""
+        candidates = sum(c for c, _ in self.queries_by_step)
+        total = sum(t for _, t in self.queries_by_step)
+        return {
+            "candidates": candidates,
+            "total": total,
+            "pruned": 1.0 - candidates / total if total else 0.0,
+            "builds": self.bvh_builds,
+        }
+
+    # -------------------------------------------------------------
+    # Igual, pero sin túneles: si al final del paso no toca nada y la
+    # bola avanzó más que su radio, barre el movimiento del paso
+    def process_ball_collisions_swept(self, ball, platforms=None):
+        if self.process_ball_collisions(ball, platforms):
+            return True
+
+        x0, y0 = ball.prev_x, ball.prev_y
+        dx = ball.x - x0
+        dy = ball.y - y0
+        r = ball.radius_by_size[ball.size]
+        if dx * dx + dy * dy <= r * r:
+            return False
+
+        if platforms is None:
+            platforms = self.platforms
+        first, first_t = None, None
+        for platform in platforms:
+            hb = platform.hitbox
+            t = sweep_circle_aabb(x0, y0, dx, dy, r, hb.left, hb.top, hb.right, hb.bottom)
+            # t == 0: ya la tocaba al empezar el paso (se está separando)
+            if t and (first_t is None or t < first_t):
+                first, first_t = platform, t
+        if first is None:
+            return False
+
+        # Retroceder al punto de contacto y resolver como un choque normal
+        ball.x = x0 + dx * first_t
+        ball.y = y0 + dy * first_t
+        self._handle_collision(ball, first)
+        return True
+
     # -------------------------------------------------------------
     def _handle_collision(self, ball, platform):
         """Determina el comportamiento según tipo de plataforma."""
@@ -186,20 +310,33 @@ class AdvancedPlatformSystem:
         # COLISIÓN POR DEBAJO (empujar hacia abajo sin rebotar hacia arriba)
         ball.vy = abs(ball.vy) * 0.8
         ball.y = platform.rect.bottom + r
-        ball.just_bounced = 3
+        ball.just_bounced = Ball.BOUNCE_COOLDOWN
 
     # -------------------------------------------------------------
     # Colisión en plataformas rompibles
     def _handle_breakable_collision(self, ball, platform):
         self._handle_normal_collision(ball, platform)
-        if platform in self.platforms:
-            self.platforms.remove(platform)
-            self.breakable_platforms.discard(platform)
+        self.remove_platform(platform)
+
+    # -------------------------------------------------------------
+    def static_platforms(self):
+        return [p for p in self.platforms if p.is_static]
+
+    def dynamic_platforms(self):
+        return [p for p in self.platforms if not p.is_static]
 
     # -------------------------------------------------------------
     def draw(self, screen):
         """Dibuja TODAS las plataformas del nivel."""
         for platform in self.platforms:
             platform.draw(screen)
+
+    def draw_dynamic(self, screen):
+        """Dibuja solo las móviles (las fijas van en StaticLayer)."""
+        return [
+            platform.draw(screen)
+            for platform in self.platforms
+            if not platform.is_static
+        ]
 #endregion
 # ================================================================
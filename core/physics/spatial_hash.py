@@ -0,0 +1,62 @@
+# ================================================================
+#region SPATIAL HASH (Broadphase por rejilla uniforme)
+# Reparte entidades en celdas cuadradas según su AABB. Las consultas
+# solo devuelven entidades de las celdas que toca el área pedida,
+# así el narrowphase no compara todo contra todo.
+# ================================================================
+class SpatialHash:
+
+    def __init__(self, cell_size=80):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.count = 0
+
+    # -------------------------------------------------------------
+    def clear(self, cell_size=None):
+        """Vacía la rejilla (opcionalmente con nuevo tamaño de celda)."""
+        if cell_size:
+            self.cell_size = cell_size
+        self.cells.clear()
+        self.count = 0
+
+    # -------------------------------------------------------------
+    def insert(self, obj, left, top, right, bottom):
+        """
+        Inserta `obj` en todas las celdas que cubre su AABB.
+        El orden de inserción se conserva en las consultas.
+        """
+        cs = self.cell_size
+        entry = (self.count, obj)
+        self.count += 1
+
+        cells = self.cells
+        for cx in range(int(left // cs), int(right // cs) + 1):
+            for cy in range(int(top // cs), int(bottom // cs) + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [entry]
+                else:
+                    bucket.append(entry)
+
+    # -------------------------------------------------------------
+    def query(self, left, top, right, bottom):
+        """
+        Retorna las entidades cuyas celdas se solapan con el AABB dado,
+        sin duplicados y en orden de inserción.
+        """
+        cs = self.cell_size
+        cells = self.cells
+        found = {}
+
+        for cx in range(int(left // cs), int(right // cs) + 1):
+            for cy in range(int(top // cs), int(bottom // cs) + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    for order, obj in bucket:
+                        found[order] = obj
+
+        if len(found) < 2:
+            return list(found.values())
+        return [found[k] for k in sorted(found)]
+#endregion
+# ================================================================
@@ -0,0 +1,105 @@
+import math
+
+# ================================================================
+#region SWEPT TESTS (Detección continua dentro de un paso)
+# Las pruebas por solape solo miran la posición al final del paso: una
+# bola rápida puede cruzar una plataforma delgada (o una bala saltarse
+# una bola pequeña) sin que ningún tick la vea encima.
+#
+# Estas funciones reciben el movimiento completo del paso y devuelven
+# el instante exacto del primer contacto, t en [0, 1]
+# (0 = inicio del paso, 1 = final), o None si no hay contacto.
+# Si al empezar el paso ya hay contacto, t = 0.
+#
+# Círculo vs AABB: equivale a un punto (el centro) contra el rect
+# "redondeado" por el radio = dos rects agrandados + 4 círculos de
+# esquina (Ericson, Real-Time Collision Detection, 5.5.7).
+# ================================================================
+
+def segment_circle(x0, y0, x1, y1, cx, cy, r):
+    """Primer t en que el segmento (x0,y0)->(x1,y1) entra al círculo."""
+    dx = x1 - x0
+    dy = y1 - y0
+    fx = x0 - cx
+    fy = y0 - cy
+
+    c = fx * fx + fy * fy - r * r
+    if c <= 0:
+        return 0.0
+    a = dx * dx + dy * dy
+    if a == 0:
+        return None
+    b = 2 * (fx * dx + fy * dy)
+    disc = b * b - 4 * a * c
+    if disc < 0:
+        return None
+
+    t = (-b - math.sqrt(disc)) / (2 * a)
+    return t if 0.0 <= t <= 1.0 else None
+
+
+def segment_aabb(x0, y0, dx, dy, left, top, right, bottom):
+    """Primer t en que el punto (x0,y0) + t*(dx,dy) entra al rect (slabs)."""
+    t_enter = 0.0
+    t_exit = 1.0
+    for p, d, lo, hi in ((x0, dx, left, right), (y0, dy, top, bottom)):
+        if d == 0:
+            if p < lo or p > hi:
+                return None
+            continue
+        t1 = (lo - p) / d
+        t2 = (hi - p) / d
+        if t1 > t2:
+            t1, t2 = t2, t1
+        if t1 > t_enter:
+            t_enter = t1
+        if t2 < t_exit:
+            t_exit = t2
+        if t_enter > t_exit:
+            return None
+    return t_enter
+
+
+def sweep_circle_aabb(x0, y0, dx, dy, r, left, top, right, bottom):
+    """
+    Primer t en que un círculo de radio r que se mueve de (x0, y0) a
+    (x0+dx, y0+dy) toca el rect (left, top, right, bottom).
+    """
+    # Descarte rápido: rect agrandado por r en todas direcciones
+    t = segment_aabb(x0, y0, dx, dy, left - r, top - r, right + r, bottom + r)
+    if t is None:
+        return None
+
+    # Entrada por una cara: es el contacto real
+    hx = x0 + dx * t
+    hy = y0 + dy * t
+    if left <= hx <= right or top <= hy <= bottom:
+        return t
+
+    # Entrada por la zona de una esquina: el borde ahí es un cuarto de
+    # círculo; puede tocarlo, o no tocarlo y entrar después por una cara
+    best = None
+    x1 = x0 + dx
+    y1 = y0 + dy
+    candidates = (
+        segment_aabb(x0, y0, dx, dy, left - r, top, right + r, bottom),
+        segment_aabb(x0, y0, dx, dy, left, top - r, right, bottom + r),
+        segment_circle(x0, y0, x1, y1, left, top, r),
+        segment_circle(x0, y0, x1, y1, right, top, r),
+        segment_circle(x0, y0, x1, y1, left, bottom, r),
+        segment_circle(x0, y0, x1, y1, right, bottom, r),
+    )
+    for t in candidates:
+        if t is not None and (best is None or t < best):
+            best = t
+    return best
+
+
+def sweep_point_moving_circle(px0, py0, px1, py1, cx0, cy0, cx1, cy1, r):
+    """
+    Punto (p. ej. una bala) contra un círculo que también se mueve en el
+    mismo paso: se prueba el movimiento relativo contra el círculo quieto.
+    """
+    return segment_circle(px0 - cx0, py0 - cy0, px1 - cx1, py1 - cy1, 0.0, 0.0, r)
+#endregion
+# ================================================================
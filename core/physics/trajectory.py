@@ -0,0 +1,367 @@
+import heapq
+import math
+
+# ================================================================
+#region ANALYTIC BALL PHYSICS (Trayectorias por eventos)
+# Modo de física opcional para las bolas.
+#
+# Entre rebotes, Ball.update sigue una parábola discreta exacta:
+#   vy_k = vy0 + k*g
+#   x_k  = x0 + k*vx
+#   y_k  = y0 + k*vy0 + g*k*(k+1)/2
+# que coincide en cada tick entero con la parábola continua
+#   y(s) = y0 + (vy0 + g/2)*s + (g/2)*s^2
+#
+# Para cada bola se guarda la semilla de su trayectoria y se calcula
+# en forma cerrada el próximo tick de impacto (techo, piso, paredes y
+# plataformas fijas). Los impactos se ordenan en una cola de prioridad;
+# entre impactos la posición se evalúa bajo demanda, por lo que se
+# pueden adelantar miles de ticks sin simular cada uno.
+#
+# Las plataformas se prueban en tiempo continuo, así que una bola
+# rápida no atraviesa plataformas delgadas entre dos ticks.
+# Las plataformas móviles siguen resolviéndose por frame (ver BaseLevel).
+# ================================================================
+
+# Horizonte máximo de predicción (ticks)
+MAX_HORIZON = 1_000_000
+
+
+class _Seed:
+    """Parámetros de la trayectoria de una bola desde el tick t0."""
+    __slots__ = ("t0", "x0", "y0", "vx", "vy0", "g", "r", "jb0", "seq")
+
+    def __init__(self, t0, ball, seq):
+        self.t0 = t0
+        self.x0 = ball.x
+        self.y0 = ball.y
+        self.vx = ball.vx
+        self.vy0 = ball.vy
+        self.g = ball.gravity
+        self.r = ball.radius_by_size[ball.size]
+        self.jb0 = ball.just_bounced
+        self.seq = seq
+
+    # -------------------------------------------------------------
+    # Evaluación discreta (k ticks después de t0)
+    def x_at(self, k):
+        return self.x0 + k * self.vx
+
+    def y_at(self, k):
+        return self.y0 + k * self.vy0 + self.g * k * (k + 1) / 2
+
+    def vy_at(self, k):
+        return self.vy0 + k * self.g
+
+    # Evaluación continua (s puede ser fraccionario)
+    def y_cont(self, s):
+        return self.y0 + (self.vy0 + self.g / 2) * s + (self.g / 2) * s * s
+
+
+# ----------------------------------------------------------------
+#region HELPERS MATEMÁTICOS
+# ----------------------------------------------------------------
+def _roots(a, b, c):
+    """Raíces reales ordenadas de a*s^2 + b*s + c = 0 (o None)."""
+    if a == 0:
+        if b == 0:
+            return None
+        s = -c / b
+        return (s, s)
+    disc = b * b - 4 * a * c
+    if disc < 0:
+        return None
+    sq = math.sqrt(disc)
+    s1 = (-b - sq) / (2 * a)
+    s2 = (-b + sq) / (2 * a)
+    return (s1, s2) if s1 <= s2 else (s2, s1)
+
+
+def _first_tick(pred, estimate, kmin):
+    """
+    Primer entero k >= kmin que cumple pred, partiendo de una
+    estimación analítica y corrigiendo errores de redondeo.
+    """
+    if estimate is None or estimate > MAX_HORIZON:
+        return None
+    k = max(kmin, math.ceil(estimate - 1e-9))
+    while k > kmin and pred(k - 1):
+        k -= 1
+    for _ in range(4):
+        if pred(k):
+            return k
+        k += 1
+    return None
+
+
+def _intersect(a, b):
+    lo = max(a[0], b[0])
+    hi = min(a[1], b[1])
+    return (lo, hi) if lo <= hi else None
+#endregion
+# ----------------------------------------------------------------
+
+
+class AnalyticBallSystem:
+
+    def __init__(self, platform_system=None):
+        self.platform_system = platform_system
+
+        self.tick = 0
+        self.seeds = {}       # ball -> _Seed
+        self.written = {}     # ball -> estado escrito en el último tick
+        self.events = []      # heap (tick, seq, ball, platform, crossing)
+        self._seq = 0
+
+        self._platforms_version = None
+        self._static_platforms = []
+
+        # Métricas
+        self.events_processed = 0
+
+    # -------------------------------------------------------------
+    # region API POR FRAME
+    # -------------------------------------------------------------
+    def step(self, level, ticks=1):
+        """Avanza `ticks` ticks de física y escribe el estado en las bolas."""
+        self._sync(level)
+        self.tick += ticks
+        self._advance_to(level, self.tick)
+        self._write_all(level)
+    # endregion
+    # -------------------------------------------------------------
+
+
+    # -------------------------------------------------------------
+    # region SINCRONIZACIÓN
+    # -------------------------------------------------------------
+    def _sync(self, level):
+        """
+        Re-siembra bolas nuevas o modificadas por otros sistemas
+        (splits, plataformas móviles, colisiones externas).
+        """
+        ps = self.platform_system
+        if ps is not None and ps.version != self._platforms_version:
+            self._platforms_version = ps.version
+            self._static_platforms = ps.static_platforms()
+            # Cambió la geometría: todas las predicciones quedan inválidas
+            self.written = {}
+
+        seeds = {}
+        written = {}
+        for ball in level.balls:
+            state = self.written.get(ball)
+            if state is not None and state == self._state(ball):
+                seeds[ball] = self.seeds[ball]
+                written[ball] = state
+            else:
+                seeds[ball] = self._reseed(ball, level)
+        self.seeds = seeds
+        self.written = written
+
+    @staticmethod
+    def _state(ball):
+        return (ball.x, ball.y, ball.vx, ball.vy, ball.just_bounced)
+
+    def _reseed(self, ball, level):
+        self._seq += 1
+        seed = _Seed(self.tick, ball, self._seq)
+        self.seeds[ball] = seed
+        self._schedule(ball, seed, level)
+        return seed
+    # endregion
+    # -------------------------------------------------------------
+
+
+    # -------------------------------------------------------------
+    # region EVALUACIÓN
+    # -------------------------------------------------------------
+    def _write(self, ball, seed, tick):
+        k = tick - seed.t0
+        ball.x = seed.x_at(k)
+        ball.y = seed.y_at(k)
+        ball.vy = seed.vy_at(k)
+        ball.just_bounced = max(0, seed.jb0 - k)
+
+    def _write_all(self, level):
+        written = {}
+        for ball in level.balls:
+            seed = self.seeds.get(ball)
+            if seed is None:
+                continue
+            self._write(ball, seed, self.tick)
+            written[ball] = self._state(ball)
+        self.written = written
+    # endregion
+    # -------------------------------------------------------------
+
+
+    # -------------------------------------------------------------
+    # region COLA DE EVENTOS
+    # -------------------------------------------------------------
+    def _advance_to(self, level, tick):
+        events = self.events
+        while events and events[0][0] <= tick:
+            t, seq, ball, platform, crossing = heapq.heappop(events)
+            seed = self.seeds.get(ball)
+            if seed is None or seed.seq != seq or ball not in level.balls:
+                continue  # evento obsoleto
+            self.events_processed += 1
+            self._resolve(level, ball, seed, t, platform, crossing)
+
+    def _schedule(self, ball, seed, level):
+        found = self._next_event(seed, level)
+        if found is not None:
+            t, platform, crossing = found
+            heapq.heappush(self.events, (t, seed.seq, ball, platform, crossing))
+
+    def _resolve(self, level, ball, seed, t, platform, crossing):
+        """
+        Ejecuta el tick de impacto con las reglas exactas de Ball.update
+        y de las plataformas, y re-siembra la trayectoria.
+        """
+        k = t - seed.t0
+        self._write(ball, seed, t - 1)
+        ball.update(level.floor_y, level.playfield_left,
+                    level.playfield_right, level.game_area_y_start)
+
+        free_flight = abs(ball.vy - seed.vy_at(k)) < 1e-9 and ball.vx == seed.vx
+        hit = False
+        if self._static_platforms:
+            hit = self.platform_system.process_ball_collisions(ball, self._static_platforms)
+
+        # Túnel: la bola entró y salió de la plataforma entre dos ticks
+        if (not hit and platform is not None and free_flight
+                and k - 1 < crossing[0] and crossing[1] < k
+                and platform in self._static_platforms):
+            s = (crossing[0] + crossing[1]) / 2
+            ball.x = seed.x0 + s * seed.vx
+            ball.y = seed.y_cont(s)
+            if platform.check_ball_collision(ball):
+                self.platform_system._handle_collision(ball, platform)
+            else:
+                self._write(ball, seed, t)
+
+        ps = self.platform_system
+        if ps is not None and ps.version != self._platforms_version:
+            # Una rompible desapareció: los eventos pendientes contra ella
+            # se resuelven como vuelo libre y se re-predicen
+            self._platforms_version = ps.version
+            self._static_platforms = ps.static_platforms()
+
+        self.tick, saved = t, self.tick
+        self._reseed(ball, level)
+        self.tick = saved
+    # endregion
+    # -------------------------------------------------------------
+
+
+    # -------------------------------------------------------------
+    # region PREDICCIÓN DE IMPACTOS
+    # -------------------------------------------------------------
+    def _next_event(self, seed, level):
+        """Retorna (tick, plataforma|None, cruce|None) del próximo impacto."""
+        candidates = [
+            self._ceiling_tick(seed, level),
+            self._floor_tick(seed, level),
+            self._wall_tick(seed, level),
+        ]
+        best = min((k for k in candidates if k is not None), default=None)
+        best_platform = None
+        best_crossing = None
+
+        for platform in self._static_platforms:
+            found = self._platform_tick(seed, platform)
+            if found is not None and (best is None or found[0] < best):
+                best, best_crossing = found
+                best_platform = platform
+
+        if best is None:
+            return None
+        return seed.t0 + best, best_platform, best_crossing
+
+    def _ceiling_tick(self, seed, level):
+        limit = level.game_area_y_start + 16 + seed.r
+        pred = lambda k: seed.y_at(k) <= limit
+        if pred(1):
+            return 1
+        roots = _roots(seed.g / 2, seed.vy0 + seed.g / 2, seed.y0 - limit)
+        if roots is None or roots[1] < 1:
+            return None
+        k = _first_tick(pred, max(roots[0], 1), 1)
+        return k if k is not None and k <= roots[1] + 1 else None
+
+    def _floor_tick(self, seed, level):
+        limit = level.floor_y - seed.r
+        kmin = max(1, seed.jb0)
+        pred = lambda k: seed.y_at(k) >= limit
+        if pred(kmin):
+            return kmin
+        roots = _roots(seed.g / 2, seed.vy0 + seed.g / 2, seed.y0 - limit)
+        if roots is None:
+            return None
+        return _first_tick(pred, roots[1], kmin)
+
+    def _wall_tick(self, seed, level):
+        r = seed.r
+        left = level.playfield_left
+        right = level.playfield_right
+
+        if seed.x0 - r < left or seed.x0 + r > right:
+            return 1
+        if seed.vx < 0:
+            pred = lambda k: seed.x_at(k) - r <= left
+            return _first_tick(pred, (seed.x0 - r - left) / -seed.vx, 1)
+        if seed.vx > 0:
+            pred = lambda k: seed.x_at(k) + r >= right
+            return _first_tick(pred, (right - r - seed.x0) / seed.vx, 1)
+        return None
+
+    def _platform_tick(self, seed, platform):
+        """
+        Primer intervalo de tiempo continuo en el que la bola entra al
+        hitbox de la plataforma expandido por su radio.
+        Retorna (tick, (s_entrada, s_salida)) o None.
+        """
+        box = platform.hitbox
+        r = seed.r
+
+        # Eje X (lineal)
+        if seed.vx == 0:
+            if not (box.left - r <= seed.x0 <= box.right + r):
+                return None
+            x_iv = (-math.inf, math.inf)
+        else:
+            sa = (box.left - r - seed.x0) / seed.vx
+            sb = (box.right + r - seed.x0) / seed.vx
+            x_iv = (min(sa, sb), max(sa, sb))
+
+        # Eje Y (parábola): y(s) <= bottom  y  y(s) >= top
+        a = seed.g / 2
+        b = seed.vy0 + seed.g / 2
+        below_bottom = _roots(a, b, seed.y0 - (box.bottom + r))
+        if below_bottom is None:
+            return None
+        above_top = _roots(a, b, seed.y0 - (box.top - r))
+        if above_top is None:
+            y_ivs = [below_bottom]
+        else:
+            y_ivs = [
+                (below_bottom[0], min(below_bottom[1], above_top[0])),
+                (max(below_bottom[0], above_top[1]), below_bottom[1]),
+            ]
+
+        for y_iv in y_ivs:
+            iv = _intersect(x_iv, y_iv)
+            if iv is None or iv[1] <= 1e-9:
+                continue
+            entry = max(iv[0], 0.0)
+            if entry > MAX_HORIZON:
+                return None
+            return max(1, math.ceil(entry)), (entry, iv[1])
+        return None
+    # endregion
+    # -------------------------------------------------------------
+
+#endregion
+# ================================================================
@@ -0,0 +1,89 @@
+import pygame
+
+# =====================================================================
+#region DIRTY RECT RENDERER (ACTUALIZACIÓN PARCIAL DE PANTALLA)
+# En lugar de redibujar y hacer flip de toda la pantalla, cada frame:
+#   1. restaura desde StaticLayer solo las zonas donde había algo
+#      dibujado el frame anterior (bolas, balas, jugador, HUD...),
+#   2. las entidades se dibujan normalmente y registran su rect con
+#      mark(),
+#   3. present() llama a pygame.display.update() con las zonas del
+#      frame anterior + las del actual.
+#
+# Si el área sucia supera max_share de la pantalla (overlay de game
+# over, muchas bolas grandes) o la capa estática cambió, se hace un
+# redibujado completo con flip().
+# =====================================================================
+class DirtyRectRenderer:
+
+    # --------------------------------------------------------------
+    #region INIT
+    # --------------------------------------------------------------
+    def __init__(self, screen_rect, max_share=0.5):
+        self.screen_rect = pygame.Rect(screen_rect)
+        self.max_area = self.screen_rect.width * self.screen_rect.height * max_share
+
+        self._previous = []        # zonas dibujadas el frame anterior
+        self._current = []         # zonas dibujadas en este frame
+        self._full_redraw = True
+        self._static_revision = None
+
+        # Métricas
+        self.full_frames = 0
+        self.partial_frames = 0
+    #endregion
+    # --------------------------------------------------------------
+
+
+    # --------------------------------------------------------------
+    #region FRAME
+    # --------------------------------------------------------------
+    def restore(self, screen, static_layer):
+        """Inicio de frame: borra lo del frame anterior con la capa estática."""
+        # La capa estática puede reconstruirse al dibujarse: mirar después
+        if self._full_redraw or static_layer.surface is None:
+            static_layer.draw(screen)
+            self._full_redraw = True
+        else:
+            static_layer.refresh()
+            if static_layer.revision != self._static_revision:
+                screen.blit(static_layer.surface, (0, 0))
+                self._full_redraw = True
+            else:
+                background = static_layer.surface
+                for rect in self._previous:
+                    screen.blit(background, rect, rect)
+
+        self._static_revision = static_layer.revision
+        self._current = []
+
+    def mark(self, rect):
+        """Registra una zona dibujada en este frame (None se ignora)."""
+        if rect is not None:
+            clipped = self.screen_rect.clip(rect)
+            if clipped.width and clipped.height:
+                self._current.append(clipped)
+
+    def present(self):
+        """Fin de frame: actualiza solo las zonas sucias (o flip completo)."""
+        dirty = self._previous + self._current
+        self._previous = self._current
+        self._current = []
+
+        area = sum(r.width * r.height for r in dirty)
+        if self._full_redraw or area > self.max_area:
+            pygame.display.flip()
+            self.full_frames += 1
+        else:
+            pygame.display.update(dirty)
+            self.partial_frames += 1
+        self._full_redraw = False
+
+    def invalidate(self):
+        """Fuerza un redibujado completo en el próximo frame."""
+        self._full_redraw = True
+    #endregion
+    # --------------------------------------------------------------
+
+#endregion
+# FIN DirtyRectRenderer
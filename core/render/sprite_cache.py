@@ -0,0 +1,102 @@
+import pygame
+
+# =====================================================================
+#region SPRITE CACHE (SPRITES ESCALADOS COMPARTIDOS)
+# Cache global de sprites ya decodificados y escalados.
+# Clave: (ruta del sprite, radio). Los fallos de carga también se
+# guardan (entrada negativa) para construir el círculo de respaldo
+# una sola vez.
+# =====================================================================
+class SpriteCache:
+
+    # --------------------------------------------------------------
+    #region ESTADO GLOBAL
+    # --------------------------------------------------------------
+    _surfaces = {}      # (path, radius) -> Surface escalada
+    _negative = set()   # claves cuya carga desde disco falló
+
+    hits = 0
+    misses = 0
+    #endregion
+    # --------------------------------------------------------------
+
+
+    # --------------------------------------------------------------
+    #region GET (Obtener sprite escalado)
+    # --------------------------------------------------------------
+    @classmethod
+    def get_scaled(cls, path, radius, fallback_color=(255, 255, 255)):
+        """
+        Retorna el sprite de `path` escalado a un cuadrado de 2*radius.
+        Si la carga falla, retorna (y guarda) un círculo de color.
+        La Surface retornada es compartida: no debe modificarse.
+        """
+        key = (path, radius)
+        surf = cls._surfaces.get(key)
+        if surf is not None:
+            cls.hits += 1
+            return surf
+
+        cls.misses += 1
+        size = (2 * radius, 2 * radius)
+
+        try:
+            img = pygame.image.load(path).convert_alpha()
+            surf = pygame.transform.scale(img, size)
+        except Exception:
+            # Fallback visual si hay error (se construye una sola vez)
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.circle(surf, fallback_color, (radius, radius), radius)
+            cls._negative.add(key)
+
+        cls._surfaces[key] = surf
+        return surf
+    #endregion
+    # --------------------------------------------------------------
+
+
+    # --------------------------------------------------------------
+    #region EVICT (Liberar al descargar un nivel)
+    # --------------------------------------------------------------
+    @classmethod
+    def evict(cls, paths=None):
+        """
+        Elimina entradas del cache.
+        paths=None  -> vacía el cache completo
+        paths=[...] -> solo las entradas de esas rutas (todos los radios)
+        """
+        if paths is None:
+            cls._surfaces.clear()
+            cls._negative.clear()
+            return
+
+        paths = set(paths)
+        for key in [k for k in cls._surfaces if k[0] in paths]:
+            del cls._surfaces[key]
+            cls._negative.discard(key)
+
+    @classmethod
+    def reset_stats(cls):
+        cls.hits = 0
+        cls.misses = 0
+    #endregion
+    # --------------------------------------------------------------
+
+
+    # --------------------------------------------------------------
+    #region STATS (Métricas del cache)
+    # --------------------------------------------------------------
+    @classmethod
+    def stats(cls):
+        """Retorna contadores de uso del cache."""
+        return {
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "entries": len(cls._surfaces),
+            "negative": len(cls._negative),
+        }
+    #endregion
+    # --------------------------------------------------------------
+
+#endregion
+# FIN SpriteCache
@@ -0,0 +1,128 @@
+import pygame
+
+# =====================================================================
+#region STATIC LAYER (FONDO + LÍMITES + PLATAFORMAS FIJAS)
+# Compone en una sola superficie opaca todo lo que no se mueve:
+# el fondo del nivel, la superficie SRCALPHA de BoundariesRenderer y
+# las plataformas fijas (is_static). Por frame el nivel hace un único
+# blit opaco en lugar de un blit de pantalla completa con alfa por
+# píxel más uno por plataforma.
+#
+# Cuando cambia el conjunto de plataformas (AdvancedPlatformSystem
+# incrementa su version, p. ej. al romperse una "breakable") solo se
+# recompone el rectángulo de las plataformas afectadas. Si cambia el
+# fondo o los límites se reconstruye todo.
+# Las plataformas móviles se siguen dibujando por frame.
+# =====================================================================
+class StaticLayer:
+
+    FALLBACK_COLOR = (18, 18, 30)
+
+    # --------------------------------------------------------------
+    #region INIT
+    # --------------------------------------------------------------
+    def __init__(self, level):
+        self.level = level
+        self.surface = None
+
+        # Lo que está horneado en self.surface
+        self._baked_platforms = set()
+        self._platform_version = None
+        self._baked_sources = None
+
+        # Cambia cada vez que se modifica self.surface
+        self.revision = 0
+
+        # Métricas
+        self.full_builds = 0
+        self.partial_rebuilds = 0
+    #endregion
+    # --------------------------------------------------------------
+
+
+    # --------------------------------------------------------------
+    #region CONSTRUCCIÓN
+    # --------------------------------------------------------------
+    def _sources(self):
+        level = self.level
+        renderer = level.boundaries_renderer
+        boundaries = renderer.surface if renderer else None
+        return level.background, boundaries
+
+    def build(self):
+        """Compone la capa completa desde cero."""
+        level = self.level
+        surf = pygame.Surface((level.ANCHO, level.ALTO))
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert()
+        self.surface = surf
+
+        platforms = level.platform_system.static_platforms()
+        self._compose(surf.get_rect(), platforms)
+
+        self._baked_platforms = set(platforms)
+        self._platform_version = level.platform_system.version
+        self._baked_sources = self._sources()
+        self.revision += 1
+        self.full_builds += 1
+
+    def _compose(self, area, platforms):
+        """Dibuja fondo, límites y plataformas dentro de `area`."""
+        surf = self.surface
+        background, boundaries = self._sources()
+
+        surf.set_clip(area)
+        if background:
+            surf.blit(background, (0, 0))
+        else:
+            surf.fill(self.FALLBACK_COLOR)
+        if boundaries:
+            surf.blit(boundaries, (0, 0))
+        for platform in platforms:
+            if platform.rect.colliderect(area):
+                platform.draw(surf)
+        surf.set_clip(None)
+
+    def _sync_platforms(self):
+        """Recompone solo las zonas de plataformas agregadas o quitadas."""
+        system = self.level.platform_system
+        current = system.static_platforms()
+        current_set = set(current)
+
+        changed = self._baked_platforms ^ current_set
+        for platform in changed:
+            self._compose(platform.rect, current)
+            self.partial_rebuilds += 1
+
+        self._baked_platforms = current_set
+        self._platform_version = system.version
+        if changed:
+            self.revision += 1
+
+    def _sources_changed(self):
+        return any(a is not b for a, b in zip(self._baked_sources, self._sources()))
+
+    def invalidate(self):
+        self.surface = None
+    #endregion
+    # --------------------------------------------------------------
+
+
+    # --------------------------------------------------------------
+    #region DRAW
+    # --------------------------------------------------------------
+    def refresh(self):
+        """Reconstruye o recompone lo que haya cambiado desde el último uso."""
+        if self.surface is None or self._sources_changed():
+            self.build()
+        elif self._platform_version != self.level.platform_system.version:
+            self._sync_platforms()
+
+    def draw(self, screen):
+        self.refresh()
+        screen.blit(self.surface, (0, 0))
+    #endregion
+    # --------------------------------------------------------------
+
+#endregion
+# FIN StaticLayer
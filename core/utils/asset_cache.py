@@ -0,0 +1,177 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+from typing import Callable, List, Sequence
+
+import pygame
+
+# ======================================================================
+#region ASSET CACHE (Frames procesados persistentes en disco)
+# Guarda el resultado final de procesar una imagen (cortar, escalar...)
+# como píxeles crudos, para no repetir decodificación y transformaciones
+# en cada arranque.
+#
+# Clave: hash del CONTENIDO del archivo fuente + parámetros de la
+# transformación + CACHE_VERSION. Si el asset cambia, cambia el hash y
+# la entrada vieja simplemente deja de usarse.
+#
+# Formato de cada entrada (<clave>.frames):
+#   uint32 largo del header | header JSON | píxeles de cada frame
+#   header = {"format": "RGBA"|"RGB", "frames": [[w, h, offset], ...]}
+# Al cargar se mapea el archivo en memoria y cada frame se crea con
+# pygame.image.frombuffer sobre una vista del mmap (sin copiar).
+# ======================================================================
+
+CACHE_DIR = os.path.join("cache", "assets")
+CACHE_VERSION = 1
+
+_HEADER = struct.Struct("<I")
+_hash_memo = {}      # (ruta, mtime, tamaño) -> sha1 del contenido
+
+# Métricas
+stats = {"hits": 0, "misses": 0}
+
+
+def _tobytes(surface, fmt):
+    tobytes = getattr(pygame.image, "tobytes", None) or pygame.image.tostring
+    return tobytes(surface, fmt)
+
+
+def source_hash(path: str) -> str:
+    """sha1 del contenido del archivo (memorizado por mtime y tamaño)."""
+    st = os.stat(path)
+    memo_key = (path, st.st_mtime_ns, st.st_size)
+    digest = _hash_memo.get(memo_key)
+    if digest is None:
+        h = hashlib.sha1()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        digest = h.hexdigest()
+        _hash_memo[memo_key] = digest
+    return digest
+
+
+def _entry_path(path, params):
+    key = json.dumps([CACHE_VERSION, source_hash(path), params], sort_keys=True)
+    name = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, f"{name}.frames")
+
+
+def _finish(surface, alpha):
+    """Pasa al formato de pantalla si hay display (blits rápidos)."""
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
+
+
+# ----------------------------------------------------------------------
+# Lectura / escritura de entradas
+# ----------------------------------------------------------------------
+def _read_entry(entry, alpha, convert=True):
+    try:
+        f = open(entry, "rb")
+    except OSError:
+        return None
+
+    with f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+    try:
+        (header_len,) = _HEADER.unpack_from(mm, 0)
+        header = json.loads(bytes(mm[_HEADER.size:_HEADER.size + header_len]))
+        fmt = header["format"]
+        bpp = len(fmt)
+        data_start = _HEADER.size + header_len
+        view = memoryview(mm)
+
+        frames = []
+        for w, h, offset in header["frames"]:
+            start = data_start + offset
+            buf = view[start:start + w * h * bpp]
+            frame = pygame.image.frombuffer(buf, (w, h), fmt)
+            frames.append(_finish(frame, alpha) if convert else frame)
+        return frames
+    except (ValueError, KeyError, struct.error) as e:
+        print(f"Cache de assets corrupta ({entry}): {e}")
+        return None
+
+
+def _write_entry(entry, frames, alpha):
+    fmt = "RGBA" if alpha else "RGB"
+    chunks = []
+    meta = []
+    offset = 0
+    for frame in frames:
+        data = _tobytes(frame, fmt)
+        w, h = frame.get_size()
+        meta.append([w, h, offset])
+        chunks.append(data)
+        offset += len(data)
+
+    header = json.dumps({"format": fmt, "frames": meta}).encode("utf-8")
+    tmp = entry + ".tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(len(header)))
+            f.write(header)
+            for data in chunks:
+                f.write(data)
+        os.replace(tmp, entry)
+    except OSError as e:
+        print(f"No se pudo escribir la cache de assets: {e}")
+#endregion
+# ======================================================================
+
+
+# ======================================================================
+#region API
+# ======================================================================
+def cached_frames(path: str, params: Sequence,
+                  build: Callable[[], List[pygame.Surface]],
+                  alpha: bool = True, convert: bool = True) -> List[pygame.Surface]:
+    """
+    Retorna los frames procesados de `path` desde la cache en disco, o
+    los construye con build() y los guarda.
+    params: todo lo que influye en el resultado (tamaños, cortes...).
+    convert=False deja los frames sin pasar al formato de pantalla
+    (para cargar desde otro hilo; la conversión la hace el principal).
+    """
+    params = list(params)
+    try:
+        entry = _entry_path(path, params)
+    except OSError:
+        # Sin fuente no hay clave: que build() reporte el error
+        return build()
+
+    frames = _read_entry(entry, alpha, convert)
+    if frames is not None:
+        stats["hits"] += 1
+        return frames
+
+    stats["misses"] += 1
+    frames = build()
+    _write_entry(entry, frames, alpha)
+    return frames
+
+
+def cached_scaled_image(path: str, size, alpha: bool = True,
+                        convert: bool = True) -> pygame.Surface:
+    """Imagen de `path` escalada a `size`, cacheada en disco."""
+    size = (int(size[0]), int(size[1]))
+
+    def build():
+        img = pygame.image.load(path)
+        if convert:
+            img = _finish(img, alpha)
+        return [pygame.transform.scale(img, size)]
+
+    return cached_frames(path, ["scale", size], build, alpha=alpha, convert=convert)[0]
+#endregion
+# ======================================================================
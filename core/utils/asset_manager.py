@@ -0,0 +1,223 @@
+import os
+from collections import OrderedDict
+
+import pygame
+
+from config import ASSET_BUDGET_MB
+from core.utils.asset_cache import cached_scaled_image
+
+# ======================================================================
+#region ASSET MANAGER (Imágenes, escalados, fuentes y sonidos compartidos)
+# Punto único de carga de assets. Cada asset se decodifica una sola vez
+# y se comparte entre menú, HUD y niveles.
+#
+# - Referencias por dueño: quien carga pasa owner (normalmente el nivel).
+#   Al salir del nivel, release_owner(nivel) suelta todas sus referencias.
+# - Las entradas sin dueños siguen en memoria (volver a entrar a un nivel
+#   no vuelve a decodificar nada) hasta que el total supera el
+#   presupuesto (config.ASSET_BUDGET_MB); entonces se expulsan en orden
+#   LRU. Las entradas con dueños nunca se expulsan.
+# - report() lista los bytes residentes por asset.
+# ======================================================================
+
+class _Entry:
+    __slots__ = ("value", "nbytes", "owners")
+
+    def __init__(self, value, nbytes):
+        self.value = value
+        self.nbytes = nbytes
+        self.owners = set()
+
+
+class AssetManager:
+
+    _entries = OrderedDict()    # clave -> _Entry (orden = uso, LRU primero)
+    _by_owner = {}              # id(owner) -> set(claves)
+    budget_bytes = int(ASSET_BUDGET_MB * 1024 * 1024)
+    resident_bytes = 0
+
+    # Métricas
+    hits = 0
+    misses = 0
+    evictions = 0
+
+    # ------------------------------------------------------------------
+    # region NÚCLEO
+    # ------------------------------------------------------------------
+    @classmethod
+    def _get(cls, key, owner, loader, sizer):
+        entry = cls._entries.get(key)
+        if entry is not None:
+            cls.hits += 1
+            cls._entries.move_to_end(key)
+        else:
+            cls.misses += 1
+            value = loader()
+            entry = _Entry(value, sizer(value))
+            cls._entries[key] = entry
+            cls.resident_bytes += entry.nbytes
+
+        if owner is not None:
+            entry.owners.add(id(owner))
+            cls._by_owner.setdefault(id(owner), set()).add(key)
+
+        cls._evict_over_budget()
+        return entry.value
+
+    @classmethod
+    def has(cls, key):
+        return key in cls._entries
+
+    @classmethod
+    def store(cls, key, value, owner=None):
+        """Registra un asset ya cargado por otro camino (precarga)."""
+        sizer = cls._sound_bytes if key[0] == "sound" else cls._surface_bytes
+        return cls._get(key, owner, lambda: value, sizer)
+
+    @classmethod
+    def owned_bytes(cls, owner):
+        """Bytes de los assets que referencia `owner` (compartidos incluidos)."""
+        return sum(
+            cls._entries[key].nbytes
+            for key in cls._by_owner.get(id(owner), ())
+            if key in cls._entries
+        )
+
+    @classmethod
+    def release_owner(cls, owner):
+        """Suelta todas las referencias de `owner` (p. ej. al salir de un nivel)."""
+        for key in cls._by_owner.pop(id(owner), ()):
+            entry = cls._entries.get(key)
+            if entry is not None:
+                entry.owners.discard(id(owner))
+        cls._evict_over_budget()
+
+    @classmethod
+    def _evict_over_budget(cls):
+        if cls.resident_bytes <= cls.budget_bytes:
+            return
+        for key in list(cls._entries):
+            if cls.resident_bytes <= cls.budget_bytes:
+                break
+            entry = cls._entries[key]
+            if entry.owners:
+                continue
+            del cls._entries[key]
+            cls.resident_bytes -= entry.nbytes
+            cls.evictions += 1
+
+    @classmethod
+    def set_budget(cls, megabytes):
+        cls.budget_bytes = int(megabytes * 1024 * 1024)
+        cls._evict_over_budget()
+
+    @classmethod
+    def clear(cls):
+        cls._entries.clear()
+        cls._by_owner.clear()
+        cls.resident_bytes = 0
+    # endregion
+    # ------------------------------------------------------------------
+
+
+    # ------------------------------------------------------------------
+    # region TAMAÑOS
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _surface_bytes(surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    @staticmethod
+    def _sound_bytes(sound):
+        init = pygame.mixer.get_init()
+        if not sound or not init:
+            return 0
+        freq, size, channels = init
+        return int(sound.get_length() * freq * (abs(size) // 8) * channels)
+
+    @staticmethod
+    def _file_bytes(path):
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+    # endregion
+    # ------------------------------------------------------------------
+
+
+    # ------------------------------------------------------------------
+    # region TIPOS DE ASSET
+    # ------------------------------------------------------------------
+    @staticmethod
+    def image_key(path, alpha=True):
+        return ("image", path, alpha)
+
+    @staticmethod
+    def scaled_key(path, size, alpha=True):
+        return ("scaled", path, (int(size[0]), int(size[1])), alpha)
+
+    @classmethod
+    def image(cls, path, alpha=True, owner=None):
+        """Imagen decodificada y convertida al formato de pantalla."""
+        def load():
+            img = pygame.image.load(path)
+            return img.convert_alpha() if alpha else img.convert()
+        return cls._get(cls.image_key(path, alpha), owner, load, cls._surface_bytes)
+
+    @classmethod
+    def scaled(cls, path, size, alpha=True, owner=None):
+        """Imagen escalada a `size` (cacheada también en disco)."""
+        size = (int(size[0]), int(size[1]))
+        return cls._get(
+            cls.scaled_key(path, size, alpha), owner,
+            lambda: cached_scaled_image(path, size, alpha=alpha),
+            cls._surface_bytes
+        )
+
+    @classmethod
+    def font(cls, path, size, owner=None, fallback="Arial", fallback_size=None,
+             bold=False):
+        """Fuente TTF; si falla la carga se usa SysFont(fallback)."""
+        def load():
+            try:
+                return pygame.font.Font(path, size)
+            except Exception:
+                return pygame.font.SysFont(fallback, fallback_size or size, bold=bold)
+        key = ("font", path, size, fallback, fallback_size, bold)
+        return cls._get(key, owner, load, lambda _f: cls._file_bytes(path))
+
+    @classmethod
+    def sound(cls, path, owner=None):
+        """Sonido decodificado (None si no existe o falla)."""
+        def load():
+            try:
+                return pygame.mixer.Sound(path)
+            except Exception as e:
+                print(f"Error cargando sonido {path}: {e}")
+                return None
+        return cls._get(("sound", path), owner, load, cls._sound_bytes)
+    # endregion
+    # ------------------------------------------------------------------
+
+
+    # ------------------------------------------------------------------
+    # region DEPURACIÓN
+    # ------------------------------------------------------------------
+    @classmethod
+    def report(cls):
+        """[(clave, bytes residentes, nº de dueños)] de mayor a menor."""
+        rows = [(key, e.nbytes, len(e.owners)) for key, e in cls._entries.items()]
+        return sorted(rows, key=lambda row: row[1], reverse=True)
+
+    @classmethod
+    def print_report(cls):
+        print(f"Assets: {len(cls._entries)} entradas, "
+              f"{cls.resident_bytes / 1048576:.1f} / {cls.budget_bytes / 1048576:.0f} MB, "
+              f"hits={cls.hits} misses={cls.misses} expulsiones={cls.evictions}")
+        for key, nbytes, owners in cls.report():
+            print(f"  {nbytes / 1024:9.1f} KB  refs={owners}  {key}")
+    # endregion
+    # ------------------------------------------------------------------
+
+#endregion
+# ======================================================================
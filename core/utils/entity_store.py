@@ -0,0 +1,84 @@
+# ======================================================================
+#region ENTITY STORE (Contenedor de entidades con borrado O(1))
+# Sustituye a las listas de balas y plataformas del nivel, donde cada
+# `x in lista` y `lista.remove(x)` recorría la lista entera (y se hacía
+# dentro de bucles sobre copias: cuadrático en frames con muchos impactos).
+#
+# - Cada entidad guarda su posición en _slots (id(entidad) -> índice):
+#   `in`, remove() y discard() son O(1).
+# - remove() deja una lápida (None) en su hueco: se puede borrar mientras
+#   se itera, sin copiar la lista. compact() quita las lápidas (el nivel
+#   lo llama una vez por paso); el orden de inserción se conserva.
+# - Una entidad solo puede estar una vez en el mismo contenedor.
+# ======================================================================
+
+class EntityStore:
+
+    def __init__(self, items=()):
+        self._items = []    # entidad o None (lápida)
+        self._slots = {}    # id(entidad) -> índice en _items
+        self._dead = 0
+        self.extend(items)
+
+    # ------------------------------------------------------------------
+    # region ALTAS / BAJAS
+    # ------------------------------------------------------------------
+    def append(self, obj):
+        if id(obj) in self._slots:
+            raise ValueError("EntityStore.append(x): x ya está en el contenedor")
+        self._slots[id(obj)] = len(self._items)
+        self._items.append(obj)
+
+    def extend(self, objs):
+        for obj in objs:
+            self.append(obj)
+
+    def remove(self, obj):
+        if not self.discard(obj):
+            raise ValueError("EntityStore.remove(x): x no está en el contenedor")
+
+    def discard(self, obj):
+        """Quita obj si está; True si estaba."""
+        slot = self._slots.pop(id(obj), None)
+        if slot is None:
+            return False
+        self._items[slot] = None
+        self._dead += 1
+        return True
+
+    def clear(self):
+        self._items.clear()
+        self._slots.clear()
+        self._dead = 0
+
+    def compact(self):
+        """Quita las lápidas (fin de paso, nadie está iterando)."""
+        if not self._dead:
+            return
+        self._items = [obj for obj in self._items if obj is not None]
+        self._slots = {id(obj): i for i, obj in enumerate(self._items)}
+        self._dead = 0
+    # endregion
+    # ------------------------------------------------------------------
+
+
+    # ------------------------------------------------------------------
+    # region CONSULTA
+    # ------------------------------------------------------------------
+    def __contains__(self, obj):
+        return id(obj) in self._slots
+
+    def __len__(self):
+        return len(self._items) - self._dead
+
+    def __iter__(self):
+        # Lo añadido durante la iteración también se recorre (como en list)
+        return (obj for obj in self._items if obj is not None)
+
+    def __repr__(self):
+        return f"EntityStore({list(self)!r})"
+    # endregion
+    # ------------------------------------------------------------------
+
+#endregion
+# ======================================================================
@@ -0,0 +1,305 @@
+import csv
+import json
+import os
+import time
+from collections import deque
+from time import perf_counter_ns
+
+import pygame
+
+from core.utils.object_pool import ObjectPool
+
+# ======================================================================
+#region FRAME PROFILER (Tiempo por subsistema y por frame)
+# Mide cuánto tarda cada fase del frame con perf_counter_ns:
+#   - Fases del nivel (_update_*, _process_collisions, _draw_*, HUD.draw):
+#     attach(level) las envuelve como atributos de la instancia, así que
+#     con el profiler apagado no hay ningún envoltorio y el coste es cero.
+#   - Fases del bucle principal (display.flip): measure(nombre, fn).
+#
+# Una fase puede ejecutarse varias veces por frame de render (varios pasos
+# de simulación): se suma todo lo del frame. Por fase se guarda una
+# ventana de WINDOW frames para los percentiles p50/p95/p99.
+#
+# El overlay (F3) muestra los percentiles; la grabación (F4) escribe una
+# fila por frame a CSV o JSON (según la extensión) en PROFILE_DIR.
+# ======================================================================
+
+LEVEL_PHASES = (
+    "_update_time",
+    "_update_player",
+    "_update_bullets",
+    "_update_balls",
+    "_update_platforms",
+    "_process_collisions",
+    "_draw_static_layer",
+    "_draw_platforms",
+    "_draw_entities",
+)
+
+WINDOW = 300
+OVERLAY_REFRESH = 15     # frames entre recálculos de percentiles
+PROFILE_DIR = "profiles"
+
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0
+    idx = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+class FrameProfiler:
+
+    def __init__(self, window=WINDOW):
+        self.enabled = False
+        self.overlay_visible = False
+        self.window = window
+
+        self.phases = []                 # orden de aparición
+        self.history = {}                # fase -> deque de ns por frame
+        self._current = {}               # fase -> ns acumulados del frame
+        self._frame_start = 0
+        self.frame_index = 0
+
+        # Grabación a disco
+        self.record_path = None
+        self._rows = []
+
+        # Overlay
+        self._level = None
+        self._stats = []
+        self._frames_since_stats = 0
+        self._font = None
+
+    # ------------------------------------------------------------------
+    # region ENCENDIDO / INSTRUMENTACIÓN
+    # ------------------------------------------------------------------
+    def enable(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        if self._level is not None:
+            self._wrap(self._level)
+
+    def disable(self):
+        if not self.enabled:
+            return
+        self.stop_recording()
+        self.enabled = False
+        self.overlay_visible = False
+        if self._level is not None:
+            self._unwrap(self._level)
+        self._current.clear()
+
+    def attach(self, level):
+        """Instrumenta un nivel (reemplaza al anterior)."""
+        if self._level is level:
+            return
+        if self._level is not None:
+            self._unwrap(self._level)
+        self._level = level
+        if self.enabled and level is not None:
+            self._wrap(level)
+
+    def detach(self):
+        self.attach(None)
+
+    def _wrap(self, level):
+        for name in LEVEL_PHASES:
+            method = getattr(level, name, None)
+            if method is not None:
+                setattr(level, name, self._timed(name, method))
+
+        hud = getattr(level, "hud", None)
+        if hud is not None:
+            hud.draw = self._timed("HUD.draw", hud.draw)
+
+    def _unwrap(self, level):
+        # Borrar el atributo de instancia deja visible el método de la clase
+        for name in LEVEL_PHASES:
+            level.__dict__.pop(name, None)
+        hud = getattr(level, "hud", None)
+        if hud is not None:
+            hud.__dict__.pop("draw", None)
+
+    def _timed(self, name, fn):
+        current = self._current
+
+        def timed(*args, **kwargs):
+            t0 = perf_counter_ns()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                current[name] = current.get(name, 0) + perf_counter_ns() - t0
+
+        return timed
+
+    def measure(self, name, fn, *args):
+        """Ejecuta fn(*args) midiendo su duración si el profiler está activo."""
+        if not self.enabled:
+            return fn(*args)
+        t0 = perf_counter_ns()
+        try:
+            return fn(*args)
+        finally:
+            self._current[name] = self._current.get(name, 0) + perf_counter_ns() - t0
+    # endregion
+    # ------------------------------------------------------------------
+
+
+    # ------------------------------------------------------------------
+    # region FRAMES
+    # ------------------------------------------------------------------
+    def begin_frame(self):
+        if self.enabled:
+            self._frame_start = perf_counter_ns()
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+
+        current = self._current
+        current["frame"] = perf_counter_ns() - self._frame_start
+
+        for name, ns in current.items():
+            samples = self.history.get(name)
+            if samples is None:
+                samples = self.history[name] = deque(maxlen=self.window)
+                self.phases.append(name)
+            samples.append(ns)
+
+        if self.record_path is not None:
+            row = {"frame": self.frame_index}
+            row.update((f"{name}_ns", ns) for name, ns in current.items())
+            self._rows.append(row)
+
+        self.frame_index += 1
+        self._frames_since_stats += 1
+        current.clear()
+
+    def stats(self):
+        """[(fase, p50_ms, p95_ms, p99_ms)] de la ventana actual."""
+        result = []
+        for name in self.phases:
+            values = sorted(self.history[name])
+            result.append((
+                name,
+                _percentile(values, 50) / 1e6,
+                _percentile(values, 95) / 1e6,
+                _percentile(values, 99) / 1e6,
+            ))
+        return result
+    # endregion
+    # ------------------------------------------------------------------
+
+
+    # ------------------------------------------------------------------
+    # region GRABACIÓN (CSV / JSON)
+    # ------------------------------------------------------------------
+    def start_recording(self, path=None):
+        if path is None:
+            stamp = time.strftime("%Y%m%d_%H%M%S")
+            path = os.path.join(PROFILE_DIR, f"frames_{stamp}.csv")
+        self.enable()
+        self.record_path = path
+        self._rows = []
+
+    def stop_recording(self):
+        """Escribe lo grabado y retorna la ruta (o None si no grababa)."""
+        path = self.record_path
+        if path is None:
+            return None
+        rows = self._rows
+        self.record_path = None
+        self._rows = []
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if path.endswith(".json"):
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(rows, f)
+        else:
+            columns = ["frame"] + [f"{name}_ns" for name in self.phases]
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=columns, restval=0)
+                writer.writeheader()
+                writer.writerows(rows)
+
+        print(f"Perfil guardado en {path} ({len(rows)} frames)")
+        return path
+
+    def toggle_recording(self):
+        if self.record_path is None:
+            self.start_recording()
+        else:
+            self.stop_recording()
+    # endregion
+    # ------------------------------------------------------------------
+
+
+    # ------------------------------------------------------------------
+    # region OVERLAY
+    # ------------------------------------------------------------------
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+        if self.overlay_visible:
+            self.enable()
+            self._frames_since_stats = OVERLAY_REFRESH
+
+    def handle_events(self, events):
+        """F3: overlay, F4: grabar/guardar perfil."""
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F3:
+                    self.toggle_overlay()
+                elif event.key == pygame.K_F4:
+                    self.toggle_recording()
+
+    def draw(self, screen):
+        """Dibuja el overlay; retorna su rect (None si está oculto)."""
+        if not self.overlay_visible:
+            return None
+
+        if self._font is None:
+            self._font = pygame.font.SysFont("monospace", 13)
+
+        # Percentiles recalculados cada pocos frames, no en cada uno
+        if self._frames_since_stats >= OVERLAY_REFRESH:
+            self._stats = self.stats()
+            self._frames_since_stats = 0
+
+        lines = [f"{'fase':<22}{'p50':>7}{'p95':>7}{'p99':>7}  ms"]
+        for name, p50, p95, p99 in self._stats:
+            lines.append(f"{name:<22}{p50:7.2f}{p95:7.2f}{p99:7.2f}")
+        hud = getattr(self._level, "hud", None)
+        if hud is not None:
+            lines.append(f"HUD font.render/frame {hud.frame_render_calls}")
+        for pool in ObjectPool.all_pools():
+            lines.append(pool.describe())
+        platform_system = getattr(self._level, "platform_system", None)
+        if platform_system is not None:
+            query = platform_system.pruning_stats()
+            if query["total"]:
+                lines.append(f"plataformas BVH: {query['pruned']:.0%} podado "
+                             f"({query['candidates']}/{query['total']} pares, "
+                             f"rebuilds {query['builds']})")
+        if self.record_path is not None:
+            lines.append(f"REC {self.record_path} ({len(self._rows)})")
+
+        line_h = self._font.get_linesize()
+        width = max(self._font.size(line)[0] for line in lines) + 12
+        panel = pygame.Surface((width, line_h * len(lines) + 8), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        for i, line in enumerate(lines):
+            text = self._font.render(line, True, (180, 255, 180))
+            panel.blit(text, (6, 4 + i * line_h))
+
+        return screen.blit(panel, (screen.get_width() - width - 8, 8))
+    # endregion
+    # ------------------------------------------------------------------
+
+#endregion
+# ======================================================================
@@ -0,0 +1,84 @@
+import pygame
+
+# ======================================================================
+#region GAME CLOCK
+# Reloj de juego propiedad de cada nivel. Todo lo que dependa del tiempo
+# (cuenta regresiva, cooldowns, spawns, invulnerabilidad) lo consulta
+# con now() en lugar de pygame.time.get_ticks().
+#
+# - El nivel lo avanza con advance(dt) en cada paso fijo de simulación,
+#   así el tiempo de juego es determinista y puede ir más rápido que el
+#   tiempo real (simulación sin cabeza, replays).
+# - El bucle principal usa scale_real_time() para convertir el tiempo
+#   real en tiempo de juego: pausa (0) y cámara lenta/rápida (escala).
+# - En pausa se pueden pedir pasos sueltos con request_step().
+# ======================================================================
+
+class GameClock:
+
+    def __init__(self, start_ms=0):
+        self.time_ms = float(start_ms)
+        self.paused = False
+        self.time_scale = 1.0
+        self._step_requests = 0
+
+    # ------------------------------------------------------------------
+    # Lectura
+    # ------------------------------------------------------------------
+    def now(self):
+        """Milisegundos de juego transcurridos."""
+        return int(self.time_ms)
+
+    # ------------------------------------------------------------------
+    # Avance (llamado por el nivel en cada paso de simulación)
+    # ------------------------------------------------------------------
+    def advance(self, dt_ms):
+        self.time_ms += dt_ms
+
+    # ------------------------------------------------------------------
+    # Control desde el bucle principal
+    # ------------------------------------------------------------------
+    def scale_real_time(self, real_ms):
+        """Tiempo real -> tiempo de juego a simular (0 en pausa)."""
+        if self.paused:
+            return 0.0
+        return real_ms * self.time_scale
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+        self._step_requests = 0
+
+    def toggle_pause(self):
+        if self.paused:
+            self.resume()
+        else:
+            self.pause()
+
+    def set_time_scale(self, scale):
+        self.time_scale = max(0.05, min(8.0, scale))
+
+    def request_step(self, steps=1):
+        """Modo paso a paso: solo tiene efecto en pausa."""
+        if self.paused:
+            self._step_requests += steps
+
+    def take_step_requests(self):
+        steps = self._step_requests
+        self._step_requests = 0
+        return steps
+
+
+class WallClock:
+    """Reloj de pared para objetos creados fuera de un nivel."""
+
+    def now(self):
+        return pygame.time.get_ticks()
+
+
+WALL_CLOCK = WallClock()
+
+#endregion
+# ======================================================================
@@ -0,0 +1,109 @@
+# ======================================================================
+#region OBJECT POOL (Reutilización de entidades de vida corta)
+# Bolas y balas se crean y destruyen decenas de veces por segundo
+# (cada split crea dos bolas, cada disparo una bala). El pool guarda
+# las instancias liberadas y las reinicializa en lugar de construir
+# objetos nuevos.
+#
+# - acquire(*args): instancia libre reinicializada con cls.reinit(*args)
+#   (o una nueva cls(*args) si no hay libres).
+# - release(obj): liberación DIFERIDA. El objeto queda pendiente y solo
+#   vuelve a estar libre en flush(), cuando el paso de simulación que lo
+#   liberó ya terminó (el nivel llama a flush_all() antes de cada paso).
+#   Así, una bola destruida en el bucle de colisiones no puede reaparecer
+#   como hija de un split en ese mismo bucle, y nadie ve cambiar un
+#   objeto mientras todavía lo recorre.
+# - stats(): vivos, libres, pendientes, máximo de vivos (high-water),
+#   creados y reutilizados.
+#
+# La clase del pool debe tener reinit() con los mismos argumentos que
+# __init__ (que normalmente solo llama a reinit).
+# ======================================================================
+
+class ObjectPool:
+
+    _pools = []     # todos los pools creados (flush_all / métricas)
+
+    def __init__(self, cls, name=None):
+        self.cls = cls
+        self.name = name or cls.__name__
+        self._free = []
+        self._pending = []
+
+        # Métricas
+        self.live = 0
+        self.high_water = 0
+        self.created = 0
+        self.reused = 0
+
+        ObjectPool._pools.append(self)
+
+    # ------------------------------------------------------------------
+    # region ACQUIRE / RELEASE
+    # ------------------------------------------------------------------
+    def acquire(self, *args, **kwargs):
+        if self._free:
+            obj = self._free.pop()
+            obj.reinit(*args, **kwargs)
+            self.reused += 1
+        else:
+            obj = self.cls(*args, **kwargs)
+            self.created += 1
+        obj._pool_released = False
+
+        self.live += 1
+        if self.live > self.high_water:
+            self.high_water = self.live
+        return obj
+
+    def release(self, obj):
+        """Devuelve obj al pool al final del paso (doble release se ignora)."""
+        if getattr(obj, "_pool_released", True):
+            return
+        obj._pool_released = True
+        self._pending.append(obj)
+        self.live -= 1
+
+    def release_all(self, objs):
+        for obj in objs:
+            self.release(obj)
+
+    def flush(self):
+        """Fin del paso: lo liberado pasa a estar disponible."""
+        if self._pending:
+            self._free.extend(self._pending)
+            self._pending.clear()
+
+    @classmethod
+    def flush_all(cls):
+        for pool in cls._pools:
+            pool.flush()
+    # endregion
+    # ------------------------------------------------------------------
+
+
+    # ------------------------------------------------------------------
+    # region MÉTRICAS
+    # ------------------------------------------------------------------
+    def stats(self):
+        return {
+            "live": self.live,
+            "free": len(self._free),
+            "pending": len(self._pending),
+            "high_water": self.high_water,
+            "created": self.created,
+            "reused": self.reused,
+        }
+
+    def describe(self):
+        return (f"pool {self.name}: vivos {self.live} libres {len(self._free)} "
+                f"max {self.high_water} (nuevos {self.created}, reusados {self.reused})")
+
+    @classmethod
+    def all_pools(cls):
+        return list(cls._pools)
+    # endregion
+    # ------------------------------------------------------------------
+
+#endregion
+# ======================================================================
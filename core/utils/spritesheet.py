@@ -26,7 +26,8 @@ def load_image(path: str) -> pygame.Surface:
 def slice_spritesheet(sheet: pygame.Surface, tile_w: int, tile_h: int,
                       margin: int = 0, spacing: int = 0, 
                       start_x: int = 0, start_y: int = 0,
-                      max_tiles: Optional[int] = None) -> List[pygame.Surface]:
+                      max_tiles: Optional[int] = None,
+                      subsurface: bool = False) -> List[pygame.Surface]:
     """
     Corta un spritesheet en tiles y retorna una lista de Surfaces.
 
@@ -37,6 +38,11 @@ def slice_spritesheet(sheet: pygame.Surface, tile_w: int, tile_h: int,
         spacing: espacio entre tiles
         start_x / start_y: offsets iniciales
         max_tiles: máximo número de tiles a extraer
+        subsurface: si es True cada tile es una vista (sheet.subsurface)
+                    que comparte píxeles con el sheet, sin copiar nada.
+                    Las vistas mantienen vivo el sheet y no deben
+                    modificarse; usar materialize_tiles() si hace falta
+                    una copia independiente.
     
     Retorna:
         Lista de surfaces representando cada tile.
@@ -49,9 +55,14 @@ def slice_spritesheet(sheet: pygame.Surface, tile_w: int, tile_h: int,
         x = margin + start_x
         while x + tile_w <= sheet_w:
 
-            # Crear tile con transparencia
-            tile = pygame.Surface((tile_w, tile_h), flags=pygame.SRCALPHA)
-            tile.blit(sheet, (0, 0), pygame.Rect(x, y, tile_w, tile_h))
+            rect = pygame.Rect(x, y, tile_w, tile_h)
+            if subsurface:
+                # Vista sobre el sheet: sin reservar ni copiar píxeles
+                tile = sheet.subsurface(rect)
+            else:
+                # Crear tile con transparencia
+                tile = pygame.Surface((tile_w, tile_h), flags=pygame.SRCALPHA)
+                tile.blit(sheet, (0, 0), rect)
             tiles.append(tile)
 
             # Si se alcanzó el máximo, detener
@@ -64,6 +75,15 @@ def slice_spritesheet(sheet: pygame.Surface, tile_w: int, tile_h: int,
     
     return tiles
 
+
+def materialize_tiles(tiles: List[pygame.Surface]) -> List[pygame.Surface]:
+    """
+    Convierte vistas (subsurfaces) en Surfaces independientes del sheet,
+    para quien necesite modificarlas o liberar el sheet original.
+    """
+    return [tile.copy() if tile.get_parent() is not None else tile
+            for tile in tiles]
+
 #endregion
 # ======================================================================
 
@@ -74,7 +94,8 @@ def slice_spritesheet(sheet: pygame.Surface, tile_w: int, tile_h: int,
 # ======================================================================
 
 def slice_spritesheet_regions(sheet: pygame.Surface, 
-                               regions: List[dict]) -> List[pygame.Surface]:
+                               regions: List[dict],
+                               subsurface: bool = False) -> List[pygame.Surface]:
     """
     Corta distintas regiones del spritesheet con configuraciones diferentes.
 
@@ -95,7 +116,8 @@ def slice_spritesheet_regions(sheet: pygame.Surface,
             spacing=region.get('spacing', 0),
             start_x=region.get('start_x', 0),
             start_y=region.get('start_y', 0),
-            max_tiles=region.get('max_tiles', None)
+            max_tiles=region.get('max_tiles', None),
+            subsurface=subsurface
         )
         all_tiles.extend(tiles)
     
@@ -200,7 +222,8 @@ def load_your_tileset(path: str) -> List[pygame.Surface]:
         margin=0,
         spacing=0,
         start_x=0,
-        start_y=0
+        start_y=0,
+        subsurface=True
     )
     
     return tiles
@@ -0,0 +1,30 @@
+from config import BASE_HZ, SIM_HZ
+
+# ======================================================================
+#region TICK RATE (Constantes "por tick" independientes de SIM_HZ)
+# Las constantes de movimiento se escriben como siempre, por tick a
+# BASE_HZ (60 Hz): gravedad 0.18, bala 10 px, animación cada 6 ticks...
+# Al crear el estado de simulación se pasan al tick real con estas
+# funciones, así 120 Hz juega igual que 60 Hz (con pasos más finos):
+#   per_tick(v)   velocidad      (px/tick)    * TICK_SCALE
+#   per_tick2(a)  aceleración    (px/tick^2)  * TICK_SCALE^2
+#   ticks(n)      duración en ticks           / TICK_SCALE
+# Distancias (px), factores de rebote y tiempos en ms no cambian.
+# ======================================================================
+
+TICK_SCALE = BASE_HZ / SIM_HZ
+
+
+def per_tick(value):
+    return value * TICK_SCALE
+
+
+def per_tick2(value):
+    return value * TICK_SCALE * TICK_SCALE
+
+
+def ticks(count):
+    return max(1, round(count / TICK_SCALE))
+
+#endregion
+# ======================================================================
@@ -0,0 +1,219 @@
+# ======================================================================
+#region TIMER WHEEL (Planificador de eventos en tiempo de juego)
+# Rueda de temporizadores jerárquica con resolución de 1 ms:
+#   nivel 0: 256 ranuras de 1 ms      (hasta ~0.25 s)
+#   nivel 1:  64 ranuras de 256 ms    (hasta ~16 s)
+#   nivel 2:  64 ranuras de 16.4 s    (hasta ~17 min)
+#   overflow: el resto, se reinserta cuando da la vuelta el nivel 2
+#
+# advance(now) solo recorre las ranuras de los ms transcurridos (salta
+# bloques enteros si el nivel 0 está vacío) y los temporizadores que
+# vencen, más la cascada ocasional, en lugar de preguntar a cada
+# temporizador en cada frame.
+# Un temporizador vence cuando now >= due (igual que "now - last >= delay").
+# ======================================================================
+
+L0_BITS = 8
+LN_BITS = 6
+L0_SIZE = 1 << L0_BITS
+LN_SIZE = 1 << LN_BITS
+L0_MASK = L0_SIZE - 1
+LN_MASK = LN_SIZE - 1
+L1_SPAN = 1 << (L0_BITS + LN_BITS)
+L2_SPAN = 1 << (L0_BITS + 2 * LN_BITS)
+
+
+class Timer:
+    """Handle de un temporizador programado."""
+    __slots__ = ("due", "interval", "callback", "name", "cancelled", "wheel")
+
+    def __init__(self, wheel, due, interval, callback, name):
+        self.wheel = wheel
+        self.due = due
+        self.interval = interval
+        self.callback = callback
+        self.name = name
+        self.cancelled = False
+
+    def cancel(self):
+        if not self.cancelled:
+            self.cancelled = True
+            self.wheel.active -= 1
+
+    def __repr__(self):
+        kind = f"cada {self.interval} ms" if self.interval else "una vez"
+        return f"<Timer {self.name or self.callback.__name__} due={self.due} {kind}>"
+
+
+class TimerWheel:
+
+    def __init__(self, start_ms=0):
+        self.now = int(start_ms)
+        self.levels = [
+            [[] for _ in range(L0_SIZE)],
+            [[] for _ in range(LN_SIZE)],
+            [[] for _ in range(LN_SIZE)],
+        ]
+        self.overflow = []
+        self.active = 0
+        self._l0_count = 0      # entradas en el nivel 0 (incluye canceladas)
+
+        # Métricas
+        self.fired = 0
+
+    # ------------------------------------------------------------------
+    # region PROGRAMAR
+    # ------------------------------------------------------------------
+    def schedule(self, delay_ms, callback, name=None):
+        """Ejecuta callback() una vez, dentro de delay_ms de juego."""
+        timer = Timer(self, self.now + int(delay_ms), 0, callback, name)
+        self.active += 1
+        self._insert(timer)
+        return timer
+
+    def schedule_repeating(self, interval_ms, callback, name=None, first_delay=None):
+        """
+        Ejecuta callback() cada interval_ms (el primero tras first_delay).
+        El siguiente vencimiento se cuenta desde el momento del disparo.
+        """
+        delay = interval_ms if first_delay is None else first_delay
+        timer = Timer(self, self.now + int(delay), int(interval_ms), callback, name)
+        self.active += 1
+        self._insert(timer)
+        return timer
+
+    def cancel(self, timer):
+        if timer is not None:
+            timer.cancel()
+
+    def _insert(self, timer):
+        due = max(timer.due, self.now + 1)
+        delta = due - self.now
+
+        if delta < L0_SIZE:
+            self.levels[0][due & L0_MASK].append(timer)
+            self._l0_count += 1
+        elif delta < L1_SPAN:
+            self.levels[1][(due >> L0_BITS) & LN_MASK].append(timer)
+        elif delta < L2_SPAN:
+            self.levels[2][(due >> (L0_BITS + LN_BITS)) & LN_MASK].append(timer)
+        else:
+            self.overflow.append(timer)
+    # endregion
+    # ------------------------------------------------------------------
+
+
+    # ------------------------------------------------------------------
+    # region AVANZAR
+    # ------------------------------------------------------------------
+    def advance(self, now_ms):
+        """Avanza la rueda hasta now_ms y ejecuta lo que venció."""
+        target = int(now_ms)
+        levels = self.levels
+        expired = []
+
+        while self.now < target:
+            if self.active == 0:
+                break
+
+            # Nivel 0 vacío: saltar directo al próximo límite de cascada
+            if self._l0_count == 0:
+                boundary = (self.now | L0_MASK) + 1
+                if boundary > target:
+                    break
+                self.now = boundary - 1
+
+            t = self.now + 1
+            self.now = t
+
+            # Cascada: al dar la vuelta un nivel se baja la ranura siguiente
+            if t & L0_MASK == 0:
+                idx1 = (t >> L0_BITS) & LN_MASK
+                if idx1 == 0:
+                    idx2 = (t >> (L0_BITS + LN_BITS)) & LN_MASK
+                    if idx2 == 0:
+                        # Se separa antes: lo que sigue lejos vuelve al overflow
+                        overflow, self.overflow = self.overflow, []
+                        self._cascade(overflow, t, expired)
+                    self._cascade(levels[2][idx2], t, expired)
+                    levels[2][idx2] = []
+                self._cascade(levels[1][idx1], t, expired)
+                levels[1][idx1] = []
+
+            bucket = levels[0][t & L0_MASK]
+            if not bucket:
+                continue
+            levels[0][t & L0_MASK] = []
+            self._l0_count -= len(bucket)
+
+            for timer in bucket:
+                if timer.cancelled:
+                    continue
+                if timer.due > t:
+                    self._insert(timer)   # vuelta completa del overflow
+                    continue
+                expired.append(timer)
+
+        # Los callbacks ven now == now_ms (igual que el polling por frame)
+        self.now = max(self.now, target)
+        fired = 0
+        for timer in expired:
+            if timer.cancelled:
+                continue   # cancelado por otro callback de este mismo avance
+            if timer.interval:
+                # Igual que "last = now": el próximo se cuenta desde ahora
+                timer.due = self.now + timer.interval
+                self._insert(timer)
+            else:
+                timer.cancelled = True
+                self.active -= 1
+            timer.callback()
+            fired += 1
+
+        self.fired += fired
+        return fired
+
+    def _cascade(self, bucket, t, expired):
+        for timer in bucket:
+            if timer.cancelled:
+                continue
+            if timer.due <= t:
+                # Vence justo en el límite: _insert lo llevaría a t + 1
+                expired.append(timer)
+            else:
+                self._insert(timer)
+    # endregion
+    # ------------------------------------------------------------------
+
+
+    # ------------------------------------------------------------------
+    # region DEPURACIÓN
+    # ------------------------------------------------------------------
+    def pending(self):
+        """Lista de temporizadores activos ordenada por vencimiento."""
+        timers = []
+        for level in self.levels:
+            for bucket in level:
+                timers.extend(t for t in bucket if not t.cancelled)
+        timers.extend(t for t in self.overflow if not t.cancelled)
+        return sorted(timers, key=lambda t: t.due)
+
+    def clear(self):
+        for timer in self.pending():
+            timer.cancelled = True
+        for level in self.levels:
+            for i in range(len(level)):
+                level[i] = []
+        self.overflow = []
+        self.active = 0
+        self._l0_count = 0
+
+    def reset(self, now_ms):
+        """Descarta todo y sitúa la rueda en now_ms (reinicio de nivel)."""
+        self.clear()
+        self.now = int(now_ms)
+    # endregion
+    # ------------------------------------------------------------------
+
+#endregion
+# ======================================================================
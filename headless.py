@@ -0,0 +1,150 @@
+# =============================================================================
+# headless.py
+# Simulación sin ventana para pruebas de resistencia y ajuste de niveles.
+# Usa los drivers "dummy" de SDL (sin video ni audio), no dibuja por defecto
+# y avanza la simulación con un reloj virtual, sin dormir entre frames.
+#
+# Uso:
+#   python headless.py level_5
+#   python headless.py boss_level --seconds 120 --autofire
+#   python headless.py level_2 --frames 20000 --draw
+#   python headless.py level_3 --draw --profile profiles/level_3.csv
+# =============================================================================
+
+import os
+
+# Los drivers deben fijarse ANTES de inicializar pygame
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import time
+
+import pygame
+from config import ANCHO, ALTO, SIM_HZ
+from core.utils.frame_profiler import FrameProfiler
+from core.level.level_registry import LevelRegistry
+
+
+# -----------------------------------------------------------------------------
+#region NIVELES DISPONIBLES
+# -----------------------------------------------------------------------------
+def build_level(level_id, pantalla):
+    """Construye un nivel igual que main.py, listo para simular."""
+    return LevelRegistry.create(level_id, pantalla, ANCHO, ALTO)
+# endregion
+# -----------------------------------------------------------------------------
+
+
+# -----------------------------------------------------------------------------
+#region SIMULACIÓN
+# -----------------------------------------------------------------------------
+def _autofire(level):
+    """Dispara siempre que el jugador pueda (sin teclado)."""
+    if level.game_over or level.level_won:
+        return
+    player = level.player
+    if player and player.is_alive():
+        bullet = player.disparar(None)
+        if bullet:
+            level.bullets.append(bullet)
+
+
+def run(level_id, frames, autofire=False, draw=False, profile_path=None):
+    """
+    Simula `frames` pasos fijos (o hasta ganar/perder) y retorna métricas.
+    El reloj es virtual: cada paso representa 1000/SIM_HZ ms simulados.
+    Con profile_path se graba el tiempo por fase de cada paso (CSV/JSON).
+    """
+    pygame.init()
+    pygame.mixer.init()
+    # convert()/convert_alpha() necesitan un modo de video (dummy)
+    pantalla = pygame.display.set_mode((ANCHO, ALTO))
+
+    t_load = time.perf_counter()
+    level = build_level(level_id, pantalla)
+    load_s = time.perf_counter() - t_load
+
+    profiler = FrameProfiler()
+    if profile_path:
+        profiler.attach(level)
+        profiler.start_recording(profile_path)
+
+    paso_ms = 1000.0 / SIM_HZ
+    simulated = 0
+
+    t_start = time.perf_counter()
+    while simulated < frames:
+        profiler.begin_frame()
+        if autofire:
+            _autofire(level)
+
+        level.update(paso_ms)
+        simulated += 1
+
+        if draw:
+            level.render_alpha = 1.0
+            level.draw()
+        profiler.end_frame()
+
+        if level.game_over or level.level_won:
+            break
+    wall_s = time.perf_counter() - t_start
+    profiler.stop_recording()
+
+    level.detener_musica()
+    pygame.quit()
+
+    sim_s = simulated * paso_ms / 1000.0
+    return {
+        "level": level_id,
+        "frames": simulated,
+        "sim_seconds": sim_s,
+        "wall_seconds": wall_s,
+        "load_seconds": load_s,
+        "sim_fps": simulated / wall_s if wall_s > 0 else float("inf"),
+        "speedup": sim_s / wall_s if wall_s > 0 else float("inf"),
+        "balls": len(level.balls),
+        "score": level.score,
+        "game_over": level.game_over,
+        "level_won": level.level_won,
+    }
+# endregion
+# -----------------------------------------------------------------------------
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulación sin ventana de Super Pang")
+    parser.add_argument("level", choices=LevelRegistry.ids())
+    parser.add_argument("--frames", type=int, default=None,
+                        help="pasos de simulación (por defecto: 100 s de juego)")
+    parser.add_argument("--seconds", type=float, default=None,
+                        help="segundos de juego a simular")
+    parser.add_argument("--autofire", action="store_true",
+                        help="disparar automáticamente cada vez que se pueda")
+    parser.add_argument("--draw", action="store_true",
+                        help="dibujar cada frame sobre la superficie dummy")
+    parser.add_argument("--profile", metavar="RUTA", default=None,
+                        help="grabar el tiempo por fase de cada paso (.csv o .json)")
+    args = parser.parse_args()
+
+    frames = args.frames
+    if frames is None:
+        seconds = args.seconds if args.seconds is not None else 100
+        frames = int(seconds * SIM_HZ)
+
+    stats = run(args.level, frames, autofire=args.autofire, draw=args.draw,
+                profile_path=args.profile)
+
+    print(f"Nivel:            {stats['level']}")
+    print(f"Frames simulados: {stats['frames']} ({stats['sim_seconds']:.1f} s de juego)")
+    print(f"Carga:            {stats['load_seconds'] * 1000:.1f} ms "
+          f"({LevelRegistry.describe(stats['level'])})")
+    print(f"Tiempo real:      {stats['wall_seconds'] * 1000:.1f} ms")
+    print(f"FPS simulados:    {stats['sim_fps']:.0f} ({stats['speedup']:.1f}x tiempo real)")
+    print(f"Estado final:     bolas={stats['balls']} score={stats['score']} "
+          f"game_over={stats['game_over']} ganado={stats['level_won']}")
+
+
+if __name__ == "__main__":
+    main()
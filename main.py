@@ -4,14 +4,14 @@
 # =============================================================================
 
 import pygame
-from config import ANCHO, ALTO, FPS
-from core.level.level1 import Level1
-from core.level.level2 import Level2
-from core.level.level3 import Level3
-from core.level.level4 import Level4
-from core.level.level5 import Level5
-from core.level.boss_level import BossLevel
+from config import ANCHO, ALTO, SIM_HZ, RENDER_FPS, MAX_CATCHUP_STEPS, MENU_IDLE_WAIT_MS
+from core.audio.audio_manager import AudioManager
+from core.audio.sfx_bank import SFXBank
+from core.utils.frame_profiler import FrameProfiler
+from core.level.level_loader import LevelLoader
+from core.level.level_registry import LevelRegistry
 from ui.menu import Menu
+from ui.loading_screen import LoadingScreen
 
 def main():
     # -------------------------------------------------------------------------
@@ -33,22 +33,38 @@ def main():
         pygame.quit()
         return
 
+    # Decodificar todos los efectos de sonido una sola vez
+    SFXBank.load(AudioManager.sfx_volume)
+
     reloj = pygame.time.Clock()
 
+    # Paso fijo de simulación (ms) y acumulador de tiempo real pendiente
+    paso_ms = 1000.0 / SIM_HZ
+    acumulador = 0.0
+
     # -------------------------------------------------------------------------
     # Estado del juego y menú
     # -------------------------------------------------------------------------
-    estado = "menu"  # Estados posibles: "menu", "jugando"
+    estado = "menu"  # Estados posibles: "menu", "cargando", "jugando"
     nivel_actual = None
     menu = Menu(ANCHO, ALTO)
 
+    # Carga del nivel elegido (ver core/level/level_loader.py)
+    cargador = None
+    nivel_id = None
+    pantalla_carga = LoadingScreen(ANCHO, ALTO)
+
+    # Profiler por subsistema (F3 overlay, F4 grabar CSV)
+    profiler = FrameProfiler()
+
     # -------------------------------------------------------------------------
     # Loop principal del juego
     # -------------------------------------------------------------------------
     corriendo = True
 
     while corriendo:
-        dt = reloj.tick(FPS)
+        frame_ms = reloj.tick(RENDER_FPS)
+        profiler.begin_frame()
         eventos = pygame.event.get()
 
         # Detectar cierre de ventana
@@ -62,99 +78,97 @@ def main():
         if estado == "menu":
             accion = menu.handle_input(eventos)
 
-            if accion == "level_1":
-                print("Cargando Level 1...")
+            if LevelRegistry.has(accion):
                 try:
-                    menu.stop_menu_music()
-                    nivel_actual = Level1(pantalla, ANCHO, ALTO)
-                    nivel_actual.load_assets()
-                    estado = "jugando"
-                    pygame.mixer.music.set_volume(menu.music_volume)
+                    # El runtime del nivel se importa aquí la primera vez y
+                    # el spec compilado sale de la cache en las siguientes
+                    manifiesto = LevelRegistry.manifest(accion, ANCHO, ALTO)
+                    spec = LevelRegistry.spec(accion, ANCHO, ALTO)
+                    print(f"🎮 Cargando {spec.name}...")
+                    nivel_id = accion
+                    cargador = LevelLoader(
+                        spec.name,
+                        lambda: LevelRegistry.create(nivel_id, pantalla, ANCHO, ALTO),
+                        manifiesto
+                    ).start()
+                    estado = "cargando"
                 except Exception as e:
-                    print(f"Error cargando Level 1: {e}")
-
-            elif accion == "level_2":
-                print("🎮 Cargando Level 2...")
-                try:
-                    # Detener música del menú
-                    menu.stop_menu_music()
-
-                    nivel_actual = Level2(pantalla, ANCHO, ALTO)
-                    nivel_actual.load_assets()
-                    nivel_actual.spawn_initial_entities()
-                    estado = "jugando"
+                    print(f"Error cargando {accion}: {e}")
 
-                    # Aplicar configuración de volumen
-                    pygame.mixer.music.set_volume(menu.music_volume)
-                except Exception as e:
-                    print(f" Error cargando Level 2: {e}")
-
-            elif accion == "level_3":
-                print("Cargando Level 3...")
-                try:
-                    # Detener música del menú
-                    menu.stop_menu_music()
-
-                    nivel_actual = Level3(pantalla, ANCHO, ALTO)
-                    nivel_actual.spawn_initial_entities()
-                    estado = "jugando"
-
-                    # Aplicar configuración de volumen
-                    pygame.mixer.music.set_volume(menu.music_volume)
-                except Exception as e:
-                    print(f" Error cargando Level 3: {e}")
+            elif accion == "exit":
+                print("Saliendo del juego...")
+                corriendo = False
 
-            elif accion == "level_4":
-                print("🎮 Cargando Level 4...")
-                try:
-                    menu.stop_menu_music()
-                    nivel_actual = Level4(pantalla, ANCHO, ALTO)
-                    nivel_actual.load_assets()
-                    estado = "jugando"
-                    pygame.mixer.music.set_volume(menu.music_volume)
-                except Exception as e:
-                    print(f"Error cargando Level 4: {e}")
+            # Dibujar menú (solo si cambió algo)
+            if menu.draw(pantalla):
+                pygame.display.flip()
 
-            elif accion == "level_5":
-                print("🎮 Cargando Level 5...")
-                try:
-                    menu.stop_menu_music()
-                    nivel_actual = Level5(pantalla, ANCHO, ALTO)
-                    nivel_actual.load_assets()
-                    estado = "jugando"
-                    pygame.mixer.music.set_volume(menu.music_volume)
-                except Exception as e:
-                    print(f"Error cargando Level 5: {e}")
+            # Menú quieto: dormir hasta el próximo evento en lugar de
+            # girar a RENDER_FPS. El evento se devuelve a la cola para
+            # procesarlo en la siguiente vuelta.
+            if estado == "menu" and corriendo and menu.is_idle():
+                evento = pygame.event.wait(MENU_IDLE_WAIT_MS)
+                if evento.type != pygame.NOEVENT:
+                    pygame.event.post(evento)
 
-            elif accion == "boss_level":
-                print("🎮 Cargando Boss level...")
-                try:
+        # =====================================================================
+        # ESTADO: CARGANDO
+        # El hilo del LevelLoader decodifica; aquí solo se convierte por
+        # porciones y se anima la pantalla de carga. El nivel entra cuando
+        # está completo.
+        # =====================================================================
+        elif estado == "cargando":
+            cancelar = any(
+                evento.type == pygame.KEYDOWN and evento.key == pygame.K_ESCAPE
+                for evento in eventos
+            )
+            try:
+                if cancelar:
+                    # El hilo termina solo; lo ya cargado queda en AssetManager
+                    print("🔙 Carga cancelada")
+                    estado = "menu"
+                elif cargador.step():
                     menu.stop_menu_music()
-                    nivel_actual = BossLevel(pantalla, ANCHO, ALTO)
-                    nivel_actual.load_assets()
+                    nivel_actual = cargador.build()
+                    print(LevelRegistry.describe(nivel_id))
                     estado = "jugando"
                     pygame.mixer.music.set_volume(menu.music_volume)
-                except Exception as e:
-                    print(f"Error cargando Boss Level: {e}")
 
-            elif accion == "exit":
-                print("Saliendo del juego...")
-                corriendo = False
+                    # El tiempo de carga del nivel no debe simularse como atraso
+                    acumulador = 0.0
+                    reloj.tick()
+                    profiler.attach(nivel_actual)
+            except Exception as e:
+                print(f"Error cargando {cargador.name}: {e}")
+                nivel_actual = None
+                estado = "menu"
 
-            # Dibujar menú
-            menu.draw(pantalla)
-            pygame.display.flip()
+            if estado == "cargando":
+                pantalla_carga.draw(pantalla, cargador, pygame.time.get_ticks())
+                pygame.display.flip()
+            else:
+                if cargador.errors:
+                    print(f"{len(cargador.errors)} assets no se pudieron precargar")
+                cargador = None
+                menu.invalidate()
 
         # =====================================================================
         # ESTADO: JUGANDO
         # =====================================================================
         elif estado == "jugando":
             should_continue = nivel_actual.handle_events(eventos)
+            profiler.handle_events(eventos)
 
             # Volver al menú con ESC
             if not should_continue:
                 print("🔙 Volviendo al menú...")
                 nivel_actual.detener_musica()
+                profiler.detach()
+
+                # El nivel queda en la cache caliente: volver a elegirlo solo
+                # reinicia su estado. Al salir de la cache suelta sus assets
+                # y sus sprites de bolas
+                LevelRegistry.park(nivel_id, nivel_actual)
                 nivel_actual = None
 
                 pygame.mixer.music.stop()
@@ -163,14 +177,34 @@ def main():
 
                 menu.menu_music_playing = False
                 menu.menu_music_loaded = False
+                menu.invalidate()
 
                 estado = "menu"
                 continue
 
-            # Actualizar y dibujar nivel
-            nivel_actual.update(dt)
+            # Simulación a paso fijo: consumir el tiempo de juego acumulado
+            # (el reloj del nivel aplica pausa y escala de tiempo)
+            acumulador += nivel_actual.clock.scale_real_time(frame_ms)
+            pasos = 0
+            while acumulador >= paso_ms and pasos < MAX_CATCHUP_STEPS:
+                nivel_actual.update(paso_ms)
+                acumulador -= paso_ms
+                pasos += 1
+
+            # Frame demasiado lento: descartar el atraso restante
+            if pasos == MAX_CATCHUP_STEPS and acumulador >= paso_ms:
+                acumulador = 0.0
+
+            # Pasos sueltos pedidos en pausa (modo paso a paso)
+            for _ in range(nivel_actual.clock.take_step_requests()):
+                nivel_actual.update(paso_ms)
+
+            # Render interpolado entre el paso anterior y el actual
+            nivel_actual.render_alpha = acumulador / paso_ms
             nivel_actual.draw()
-            pygame.display.flip()
+            nivel_actual.mark_dirty(profiler.draw(pantalla))
+            profiler.measure("display.flip", nivel_actual.present)
+            profiler.end_frame()
 
     # -------------------------------------------------------------------------
     # Cleanup
@@ -178,6 +212,8 @@ def main():
     if nivel_actual:
         nivel_actual.detener_musica()
 
+    profiler.stop_recording()
+    LevelRegistry.flush()
     pygame.quit()
     print("Juego cerrado correctamente")
 
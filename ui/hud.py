@@ -5,6 +5,7 @@
 # =============================================================================
 
 import pygame
+from core.utils.asset_manager import AssetManager
 
 
 # -----------------------------------------------------------------------------
@@ -14,7 +15,7 @@ class HUD:
     # -------------------------------------------------------------------------
     # region INIT
     # -------------------------------------------------------------------------
-    def __init__(self, screen_width, hud_height, hud_y_start=0):
+    def __init__(self, screen_width, hud_height, hud_y_start=0, owner=None):
         """
         Inicializa el HUD.
 
@@ -22,6 +23,7 @@ class HUD:
             screen_width (int): Ancho total de la pantalla.
             hud_height (int): Alto del área visual del HUD.
             hud_y_start (int): Posición Y donde empieza el HUD.
+            owner: dueño de los assets en AssetManager (el nivel).
         """
         # Dimensiones y posición
         self.width = screen_width
@@ -35,6 +37,7 @@ class HUD:
         self.time = 99
         self.game_over = False
         self.level_won = False
+        self.now = 0            # ms del reloj del nivel (parpadeos)
 
         # Estética
         self.bg_color = (20, 20, 30)
@@ -44,17 +47,11 @@ class HUD:
         # Ruta de fuente
         font_path = "assets/fonts/ARCADECLASSIC.TTF"
 
-        # Cargar fuentes con fallback
-        try:
-            self.font = pygame.font.Font(font_path, 28)
-            self.font_large = pygame.font.Font(font_path, 36)
-            self.font_game_over = pygame.font.Font(font_path, 64)
-            self.font_instructions = pygame.font.Font(font_path, 24)
-        except Exception:
-            self.font = pygame.font.SysFont('Arial', 24)
-            self.font_large = pygame.font.SysFont('Arial', 32)
-            self.font_game_over = pygame.font.SysFont('Arial', 48)
-            self.font_instructions = pygame.font.SysFont('Arial', 18)
+        # Cargar fuentes con fallback (compartidas entre niveles)
+        self.font = AssetManager.font(font_path, 28, owner, fallback_size=24)
+        self.font_large = AssetManager.font(font_path, 36, owner, fallback_size=32)
+        self.font_game_over = AssetManager.font(font_path, 64, owner, fallback_size=48)
+        self.font_instructions = AssetManager.font(font_path, 24, owner, fallback_size=18)
 
         # Padding
         self.padding = 15
@@ -65,10 +62,53 @@ class HUD:
 
         # Cargar ícono de corazón si existe
         try:
-            heart_img = pygame.image.load("assets/sprites/heart.png").convert_alpha()
-            self.heart_icon = pygame.transform.scale(heart_img, (self.heart_size, self.heart_size))
+            self.heart_icon = AssetManager.scaled(
+                "assets/sprites/heart.png", (self.heart_size, self.heart_size), owner=owner
+            )
         except Exception:
             self.heart_icon = None  # fallback a dibujo geométrico
+
+        # Cache de textos renderizados: (fuente, texto, color) -> Surface.
+        # Solo se vuelve a renderizar cuando cambia el texto (vidas,
+        # score, tiempo); las capas oscuras de WIN/GAME OVER se crean
+        # una sola vez por opacidad.
+        self._text_cache = {}
+        self._overlays = {}
+
+        # Contadores de font.render (total y en el último draw)
+        self.render_calls = 0
+        self.frame_render_calls = 0
+    # endregion
+    # -------------------------------------------------------------------------
+
+
+    # -------------------------------------------------------------------------
+    # region TEXT CACHE
+    # -------------------------------------------------------------------------
+    TEXT_CACHE_LIMIT = 128
+
+    def _text(self, font, text, color):
+        """Retorna el texto renderizado, desde cache si ya existe."""
+        key = (font, text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            # El score crece sin límite: vaciar de vez en cuando
+            if len(self._text_cache) >= self.TEXT_CACHE_LIMIT:
+                self._text_cache.clear()
+            surf = font.render(text, True, color)
+            self._text_cache[key] = surf
+            self.render_calls += 1
+            self.frame_render_calls += 1
+        return surf
+
+    def _overlay(self, alpha):
+        """Capa oscura de pantalla completa (construida una vez)."""
+        overlay = self._overlays.get(alpha)
+        if overlay is None:
+            overlay = pygame.Surface((self.width, self.screen_height), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, alpha))
+            self._overlays[alpha] = overlay
+        return overlay
     # endregion
     # -------------------------------------------------------------------------
 
@@ -76,8 +116,9 @@ class HUD:
     # -------------------------------------------------------------------------
     # region UPDATE
     # -------------------------------------------------------------------------
-    def update(self, lives=None, score=None, time=None, game_over=None, level_won=None):
-        """Actualiza el estado del HUD."""
+    def update(self, lives=None, score=None, time=None, game_over=None, level_won=None,
+               now=None):
+        """Actualiza el estado del HUD (now: ms del GameClock del nivel)."""
         if lives is not None:
             self.lives = lives
         if score is not None:
@@ -88,6 +129,8 @@ class HUD:
             self.game_over = game_over
         if level_won is not None:
             self.level_won = level_won
+        if now is not None:
+            self.now = now
     # endregion
     # -------------------------------------------------------------------------
 
@@ -107,12 +150,19 @@ class HUD:
     # -------------------------------------------------------------------------
     def draw(self, screen):
         """Entry point de dibujo del HUD."""
+        self.frame_render_calls = 0
         if self.game_over:
             self._draw_game_over(screen)
         elif self.level_won:
             self._draw_win(screen)
         else:
             self._draw_normal_hud(screen)
+
+    def dirty_rect(self, screen_rect):
+        """Zona que ocupa el HUD (pantalla completa en WIN/GAME OVER)."""
+        if self.game_over or self.level_won:
+            return screen_rect
+        return pygame.Rect(0, self.y_start, self.width, self.height)
     # endregion
     # -------------------------------------------------------------------------
 
@@ -134,26 +184,24 @@ class HUD:
     # -------------------------------------------------------------------------
     def _draw_game_over(self, screen):
         """Pantalla completa de Game Over."""
-        overlay = pygame.Surface((self.width, self.screen_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 220))
-        screen.blit(overlay, (0, 0))
+        screen.blit(self._overlay(220), (0, 0))
 
         center_y = self.screen_height // 2
 
         # Título
-        game_over_text = self.font_game_over.render("GAME OVER", True, (255, 50, 50))
+        game_over_text = self._text(self.font_game_over, "GAME OVER", (255, 50, 50))
         screen.blit(game_over_text, (self.width//2 - game_over_text.get_width()//2, center_y - 80))
 
         # Score final
         score_text = f"FINAL SCORE {self.score:06d}"
-        score_surf = self.font_large.render(score_text, True, (255, 255, 255))
+        score_surf = self._text(self.font_large, score_text, (255, 255, 255))
         screen.blit(score_surf, (self.width//2 - score_surf.get_width()//2, center_y - 20))
 
         # Instrucciones
-        restart_text = self.font.render("Press   R   to Restart", True, (100, 255, 100))
+        restart_text = self._text(self.font, "Press   R   to Restart", (100, 255, 100))
         screen.blit(restart_text, (self.width//2 - restart_text.get_width()//2, center_y + 30))
 
-        exit_text = self.font.render("Press   ESC   to Exit", True, (255, 100, 100))
+        exit_text = self._text(self.font, "Press   ESC   to Exit", (255, 100, 100))
         screen.blit(exit_text, (self.width//2 - exit_text.get_width()//2, center_y + 70))
     # endregion
     # -------------------------------------------------------------------------
@@ -164,17 +212,15 @@ class HUD:
     # -------------------------------------------------------------------------
     def _draw_win(self, screen):
         """Dibuja la pantalla de victoria."""
-        overlay = pygame.Surface((self.width, self.screen_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        screen.blit(overlay, (0, 0))
+        screen.blit(self._overlay(200), (0, 0))
 
-        win_text = self.font_game_over.render("YOU WIN!", True, (50, 255, 50))
+        win_text = self._text(self.font_game_over, "YOU WIN!", (50, 255, 50))
         screen.blit(win_text, (self.width//2 - win_text.get_width()//2, self.screen_height//2 - 80))
 
-        score_surf = self.font_large.render(f"FINAL SCORE {self.score:06d}", True, (255, 255, 255))
+        score_surf = self._text(self.font_large, f"FINAL SCORE {self.score:06d}", (255, 255, 255))
         screen.blit(score_surf, (self.width//2 - score_surf.get_width()//2, self.screen_height//2 - 20))
 
-        restart_text = self.font.render("Press  R  to Restart", True, (100, 255, 100))
+        restart_text = self._text(self.font, "Press  R  to Restart", (100, 255, 100))
         screen.blit(restart_text, (self.width//2 - restart_text.get_width()//2, self.screen_height//2 + 30))
     # endregion
     # -------------------------------------------------------------------------
@@ -189,7 +235,7 @@ class HUD:
         y = self.y_start + self.height // 2
 
         # Texto "Vidas"
-        label = self.font.render("Vidas", True, self.text_color)
+        label = self._text(self.font, "Vidas", self.text_color)
         screen.blit(label, (x_start, y - label.get_height() // 2))
 
         # Coordenada inicial para íconos
@@ -224,7 +270,7 @@ class HUD:
     def _draw_score(self, screen):
         """Dibuja el marcador en el centro del HUD."""
         text = f"Score {self.score:06d}"
-        surf = self.font_large.render(text, True, self.text_color)
+        surf = self._text(self.font_large, text, self.text_color)
         x = self.width//2 - surf.get_width()//2
         y = self.y_start + self.height//2 - surf.get_height()//2
         screen.blit(surf, (x, y))
@@ -238,7 +284,7 @@ class HUD:
     def _draw_time(self, screen):
         """Dibuja el temporizador a la derecha."""
         text = f"Time {self.time:02d}"
-        surf = self.font.render(text, True, self.text_color)
+        surf = self._text(self.font, text, self.text_color)
 
         x = self.width - surf.get_width() - self.padding
         y = self.y_start + self.height//2 - surf.get_height()//2
@@ -246,8 +292,8 @@ class HUD:
 
         # Parpadeo si queda poco tiempo
         if self.time <= 10:
-            if pygame.time.get_ticks() % 1000 < 500:
-                surf2 = self.font.render(text, True, (255, 50, 50))
+            if self.now % 1000 < 500:
+                surf2 = self._text(self.font, text, (255, 50, 50))
                 screen.blit(surf2, (x, y))
     # endregion
     # -------------------------------------------------------------------------
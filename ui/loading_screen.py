@@ -0,0 +1,58 @@
+# =============================================================================
+# ui/loading_screen.py
+# Pantalla de carga: barra de progreso + asset actual mientras el
+# LevelLoader prepara el nivel
+# =============================================================================
+
+import math
+
+import pygame
+from core.utils.asset_manager import AssetManager
+
+
+class LoadingScreen:
+    def __init__(self, screen_width, screen_height):
+        self.width = screen_width
+        self.height = screen_height
+
+        # Colores (mismos que el menú)
+        self.bg_color = (20, 20, 40)
+        self.title_color = (255, 200, 50)
+        self.bar_color = (255, 100, 100)
+        self.bar_bg_color = (60, 60, 90)
+        self.text_color = (150, 150, 200)
+
+        font_path = "assets/fonts/ARCADECLASSIC.TTF"
+        self.font_title = AssetManager.font(font_path, 48, self, fallback_size=40, bold=True)
+        self.font_small = AssetManager.font(font_path, 24, self, fallback_size=20)
+
+        self.bar_rect = pygame.Rect(0, 0, int(screen_width * 0.6), 24)
+        self.bar_rect.center = (screen_width // 2, screen_height // 2 + 20)
+
+    # -------------------------------------------------------------------------
+    def draw(self, screen, loader, now_ms):
+        screen.fill(self.bg_color)
+
+        # Título con puntos animados (se ve que la ventana sigue viva)
+        dots = "." * (1 + (now_ms // 300) % 3)
+        title = self.font_title.render(f"Cargando {loader.name}{dots}", True, self.title_color)
+        screen.blit(title, title.get_rect(midbottom=(self.width // 2, self.bar_rect.top - 30)))
+
+        # Barra de progreso
+        pygame.draw.rect(screen, self.bar_bg_color, self.bar_rect, border_radius=6)
+        fill = self.bar_rect.copy()
+        fill.width = int(self.bar_rect.width * loader.progress)
+        if fill.width > 0:
+            pygame.draw.rect(screen, self.bar_color, fill, border_radius=6)
+
+        # Brillo que recorre la barra
+        glow_x = self.bar_rect.left + (math.sin(now_ms * 0.004) * 0.5 + 0.5) * self.bar_rect.width
+        pygame.draw.line(screen, (255, 255, 255),
+                         (glow_x, self.bar_rect.top + 4), (glow_x, self.bar_rect.bottom - 4), 2)
+
+        # Asset actual y contador
+        label = loader.current or "..."
+        info = self.font_small.render(
+            f"{loader.completed} / {loader.total}   {label}", True, self.text_color
+        )
+        screen.blit(info, info.get_rect(midtop=(self.width // 2, self.bar_rect.bottom + 16)))
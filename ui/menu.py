@@ -5,6 +5,8 @@
 
 import pygame
 from core.audio.audio_manager import AudioManager
+from core.audio.sfx_bank import SFXBank
+from core.utils.asset_manager import AssetManager
 
 
 class Menu:
@@ -49,31 +51,31 @@ class Menu:
 
         # Cursor gráfico
         try:
-            self.cursor_img = pygame.image.load("assets/hand_cursor0000.png").convert_alpha()
-            self.cursor_img = pygame.transform.scale(self.cursor_img, (32, 32))
+            self.cursor_img = AssetManager.scaled("assets/hand_cursor0000.png", (32, 32), owner=self)
         except:
             self.cursor_img = None
 
         # Fuentes
         font_path = "assets/fonts/ARCADECLASSIC.TTF"
-        try:
-            self.font_title = pygame.font.Font(font_path, 72)
-            self.font_subtitle = pygame.font.Font(font_path, 42)
-            self.font_option = pygame.font.Font(font_path, 30)
-            self.font_small = pygame.font.Font(font_path, 20)
-        except:
-            self.font_title = pygame.font.SysFont("Arial", 64, bold=True)
-            self.font_subtitle = pygame.font.SysFont("Arial", 38, bold=True)
-            self.font_option = pygame.font.SysFont("Arial", 32)
-            self.font_small = pygame.font.SysFont("Arial", 18)
+        self.font_title = AssetManager.font(font_path, 72, self, fallback_size=64, bold=True)
+        self.font_subtitle = AssetManager.font(font_path, 42, self, fallback_size=38, bold=True)
+        self.font_option = AssetManager.font(font_path, 30, self, fallback_size=32)
+        self.font_small = AssetManager.font(font_path, 20, self, fallback_size=18)
 
         # Fondo
         try:
-            self.background = pygame.image.load("assets/sprites/menu_bg.png")
-            self.background = pygame.transform.scale(self.background, (screen_width, screen_height))
+            self.background = AssetManager.scaled(
+                "assets/sprites/menu_bg.png", (screen_width, screen_height), alpha=False, owner=self
+            )
         except:
             self.background = None
 
+        # Render en cache: fondo + títulos por estado del menú y textos
+        # por (texto, color). Solo se redibuja cuando cambia _view_key().
+        self._bases = {}
+        self._texts = {}
+        self._shown_key = None
+
     # -------------------------------------------------------------------------
     # MÚSICA
     # -------------------------------------------------------------------------
@@ -102,6 +104,9 @@ class Menu:
         current_options = self._get_current_options()
 
         for evento in eventos:
+            if evento.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.invalidate()
+
             if evento.type == pygame.KEYDOWN:
 
                 if evento.key in (pygame.K_UP, pygame.K_w):
@@ -210,85 +215,109 @@ class Menu:
     # SONIDO
     # -------------------------------------------------------------------------
     def _play_menu_sound(self):
-        try:
-            sound = pygame.mixer.Sound("assets/sounds/beep.mp3")
-            sound.set_volume(self.sfx_volume)
-            sound.play()
-        except:
-            pass
+        SFXBank.play("menu_beep")
 
     # -------------------------------------------------------------------------
     # DIBUJO
     # -------------------------------------------------------------------------
     def draw(self, screen):
+        """
+        Dibuja el menú solo si cambió algo desde el último draw.
+        Retorna True si la pantalla cambió (hay que hacer flip).
+        """
         self.start_menu_music()
 
-        if self.background:
-            screen.blit(self.background, (0, 0))
-        else:
-            screen.fill(self.bg_color)
+        key = self._view_key()
+        if key == self._shown_key:
+            return False
+
+        screen.blit(self._base(self.menu_state), (0, 0))
 
         if self.menu_state == "main":
-            self._draw_main_menu(screen)
+            self._draw_options(screen, self.main_options, 200)
         elif self.menu_state == "levels":
-            self._draw_level_menu(screen)
+            self._draw_options(screen, self.level_options, 240)
         elif self.menu_state == "settings":
-            self._draw_settings_menu(screen)
-
-    def _draw_main_menu(self, screen):
-        title = self.font_title.render("SUPER PANG", True, self.title_color)
-        screen.blit(title, (self.width // 2 - title.get_width() // 2, 80))
-        self._draw_options(screen, self.main_options, 200)
-
-    def _draw_level_menu(self, screen):
-        title = self.font_title.render("SUPER PANG", True, self.title_color)
-        screen.blit(title, (self.width // 2 - title.get_width() // 2, 60))
-
-        subtitle = self.font_subtitle.render("Select Level", True, self.subtitle_color)
-        screen.blit(subtitle, (self.width // 2 - subtitle.get_width() // 2, 150))
-
-        self._draw_options(screen, self.level_options, 240)
-
-    def _draw_settings_menu(self, screen):
-        title = self.font_title.render("SUPER PANG", True, self.title_color)
-        screen.blit(title, (self.width // 2 - title.get_width() // 2, 60))
-
-        subtitle = self.font_subtitle.render("Settings", True, self.subtitle_color)
-        screen.blit(subtitle, (self.width // 2 - subtitle.get_width() // 2, 150))
-
+            self._draw_settings_options(screen)
+
+        self._shown_key = key
+        return True
+
+    def is_idle(self):
+        """True si el último frame dibujado sigue vigente."""
+        return self._shown_key == self._view_key()
+
+    def invalidate(self):
+        """Fuerza redibujar (p. ej. al volver de un nivel)."""
+        self._shown_key = None
+
+    def _view_key(self):
+        return (self.menu_state, self.selected_option,
+                round(self.music_volume, 2), round(self.sfx_volume, 2))
+
+    def _text(self, font, text, color):
+        key = (font, text, color)
+        surf = self._texts.get(key)
+        if surf is None:
+            surf = font.render(text, True, color)
+            self._texts[key] = surf
+        return surf
+
+    def _base(self, state):
+        """Fondo + título (+ subtítulo) de cada estado, pre-renderizado."""
+        base = self._bases.get(state)
+        if base is not None:
+            return base
+
+        base = pygame.Surface((self.width, self.height)).convert()
+        if self.background:
+            base.blit(self.background, (0, 0))
+        else:
+            base.fill(self.bg_color)
+
+        title = self._text(self.font_title, "SUPER PANG", self.title_color)
+        subtitle = None
+        title_y = 60
+        if state == "main":
+            title_y = 80
+        elif state == "levels":
+            subtitle = "Select Level"
+        elif state == "settings":
+            subtitle = "Settings"
+
+        base.blit(title, (self.width // 2 - title.get_width() // 2, title_y))
+        if subtitle:
+            sub = self._text(self.font_subtitle, subtitle, self.subtitle_color)
+            base.blit(sub, (self.width // 2 - sub.get_width() // 2, 150))
+
+        self._bases[state] = base
+        return base
+
+    def _draw_settings_options(self, screen):
         start_y = 280
         spacing = 70
 
         for i, option in enumerate(self.settings_options):
-            color = self.selected_color if i == self.selected_option else self.normal_color
             text = option
             if i < 2:
                 text = f"{option} {int((self.music_volume if i == 0 else self.sfx_volume) * 100)}"
-
-            surf = self.font_option.render(text, True, color)
-            x = self.width // 2 - surf.get_width() // 2
-            y = start_y + i * spacing
-
-            if i == self.selected_option:
-                if self.cursor_img:
-                    screen.blit(self.cursor_img, (x - 40, y - 5))
-                else:
-                    screen.blit(self.font_option.render(">", True, self.selected_color), (x - 50, y))
-
-            screen.blit(surf, (x, y))
+            self._draw_option(screen, text, i, start_y + i * spacing)
 
     def _draw_options(self, screen, options, start_y):
         spacing = 50
         for i, option in enumerate(options):
-            color = self.selected_color if i == self.selected_option else self.normal_color
-            surf = self.font_option.render(option, True, color)
-            x = self.width // 2 - surf.get_width() // 2
-            y = start_y + i * spacing
-
-            if i == self.selected_option:
-                if self.cursor_img:
-                    screen.blit(self.cursor_img, (x - 40, y - 5))
-                else:
-                    screen.blit(self.font_option.render(">", True, self.selected_color), (x - 50, y))
-
-            screen.blit(surf, (x, y))
+            self._draw_option(screen, option, i, start_y + i * spacing)
+
+    def _draw_option(self, screen, text, index, y):
+        selected = index == self.selected_option
+        color = self.selected_color if selected else self.normal_color
+        surf = self._text(self.font_option, text, color)
+        x = self.width // 2 - surf.get_width() // 2
+
+        if selected:
+            if self.cursor_img:
+                screen.blit(self.cursor_img, (x - 40, y - 5))
+            else:
+                screen.blit(self._text(self.font_option, ">", self.selected_color), (x - 50, y))
+
+        screen.blit(surf, (x, y))